@@ -12,6 +12,7 @@ Requirements: 3.1, 3.2, 3.3, 3.4, 3.5
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -27,6 +28,9 @@ DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE", "")
 S3_BUCKET = os.environ.get("S3_BUCKET", "")
 MEDIACONVERT_ENDPOINT = os.environ.get("MEDIACONVERT_ENDPOINT", "")
 
+# Maximum concurrent MediaConvert GetJob/CancelJob calls per cancellation
+MAX_CANCEL_WORKERS = 8
+
 
 def get_dynamodb_table():
     """Get DynamoDB table resource."""
@@ -98,36 +102,53 @@ def stop_step_functions_execution(execution_arn: str) -> bool:
         return False
 
 
-def cancel_mediaconvert_jobs(files: list[dict]) -> list[str]:
-    """Cancel running MediaConvert jobs for task files."""
-    cancelled_jobs = []
+def _cancel_mediaconvert_job(mc, job_id: str) -> bool:
+    """Cancel one MediaConvert job if it is still running.
 
+    Returns:
+        True if the job was cancelled by this call
+    """
     try:
-        mc = get_mediaconvert_client()
+        # Check job status first
+        job = mc.get_job(Id=job_id)
+        status = job["Job"]["Status"]
 
-        for file in files:
-            job_id = file.get("mediaconvert_job_id")
-            if not job_id:
-                continue
+        if status in ["SUBMITTED", "PROGRESSING"]:
+            mc.cancel_job(Id=job_id)
+            logger.info(f"Cancelled MediaConvert job: {job_id}")
+            return True
 
-            try:
-                # Check job status first
-                job = mc.get_job(Id=job_id)
-                status = job["Job"]["Status"]
+        logger.info(f"MediaConvert job {job_id} already in status: {status}")
+
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "")
+        if error_code == "NotFoundException":
+            logger.info(f"MediaConvert job not found: {job_id}")
+        else:
+            logger.warning(f"Failed to cancel MediaConvert job {job_id}: {e}")
 
-                if status in ["SUBMITTED", "PROGRESSING"]:
-                    mc.cancel_job(Id=job_id)
-                    cancelled_jobs.append(job_id)
-                    logger.info(f"Cancelled MediaConvert job: {job_id}")
-                else:
-                    logger.info(f"MediaConvert job {job_id} already in status: {status}")
+    return False
 
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                if error_code == "NotFoundException":
-                    logger.info(f"MediaConvert job not found: {job_id}")
-                else:
-                    logger.warning(f"Failed to cancel MediaConvert job {job_id}: {e}")
+
+def cancel_mediaconvert_jobs(files: list[dict]) -> list[str]:
+    """Cancel running MediaConvert jobs for task files.
+
+    Jobs are checked and cancelled concurrently so cancellation latency
+    does not grow with the number of files.
+    """
+    job_ids = [file["mediaconvert_job_id"] for file in files if file.get("mediaconvert_job_id")]
+    if not job_ids:
+        return []
+
+    cancelled_jobs = []
+
+    try:
+        mc = get_mediaconvert_client()
+
+        workers = min(MAX_CANCEL_WORKERS, len(job_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda job_id: _cancel_mediaconvert_job(mc, job_id), job_ids)
+            cancelled_jobs = [job_id for job_id, cancelled in zip(job_ids, results) if cancelled]
 
     except Exception as e:
         logger.exception(f"Error cancelling MediaConvert jobs: {e}")
@@ -274,15 +295,16 @@ def lambda_handler(event: dict, context: Any) -> dict:
                 ),
             }
 
-        # Stop Step Functions execution
+        # Stop Step Functions execution and cancel MediaConvert jobs concurrently
         execution_arn = task.get("execution_arn")
-        sfn_stopped = stop_step_functions_execution(execution_arn)
-
-        # Cancel MediaConvert jobs
         files = task.get("files", [])
-        cancelled_jobs = cancel_mediaconvert_jobs(files)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sfn_future = executor.submit(stop_step_functions_execution, execution_arn)
+            mc_future = executor.submit(cancel_mediaconvert_jobs, files)
+            sfn_stopped = sfn_future.result()
+            cancelled_jobs = mc_future.result()
 
-        # Clean up S3 files
+        # Clean up S3 files once no job can write new output
         deleted_files = cleanup_s3_files(task_id, files)
 
         # Update task status
@@ -291,9 +313,12 @@ def lambda_handler(event: dict, context: Any) -> dict:
         response_body = {
             "task_id": task_id,
             "status": "CANCELLED",
+            "previous_status": current_status,
             "sfn_stopped": sfn_stopped,
             "cancelled_jobs": cancelled_jobs,
             "deleted_files": deleted_files,
+            "mediaconvert_cancelled": bool(cancelled_jobs),
+            "s3_files_deleted": deleted_files > 0,
         }
 
         return {
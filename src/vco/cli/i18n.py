@@ -81,6 +81,10 @@ HELP_MESSAGES: dict[str, dict[Locale, str]] = {
         "ja": "[非推奨] レガシー Python 実装を使用",
         "en": "[Deprecated] Use legacy Python implementation",
     },
+    "scan.exif_bruteforce": {
+        "ja": "メタデータにコーデック情報がない動画を ffprobe で解析 (レガシー実装のみ)",
+        "en": "Probe videos without codec metadata with ffprobe (legacy implementation only)",
+    },
     # convert command
     "convert.description": {
         "ja": "変換候補の動画を H.265 に変換\n\n"
@@ -10,13 +10,15 @@ Usage:
     vco config set <key> <value>
 """
 
+import functools
 import json
+import re
 import sys
 from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from vco.analyzer.analyzer import CompressionAnalyzer
 from vco.cli.i18n import get_help
@@ -25,7 +27,46 @@ from vco.photos.manager import PhotosAccessManager
 from vco.services.import_service import ImportService
 from vco.services.scan import ScanService
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Task IDs are lowercase UUID4 strings generated by AsyncConvertCommand
+_TASK_ID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+# Timestamp formats for status output
+_DT_FMT_FULL = "%Y-%m-%d %H:%M:%S"
+_DT_FMT_SHORT = "%m-%d %H:%M"
+_TIME_FMT = "%H:%M:%S"
+
+# Rich markup for each task/file status, shared by every status table row
+_STATUS_COLORS = MappingProxyType(
+    {
+        "PENDING": "[yellow]PENDING[/yellow]",
+        "UPLOADING": "[blue]UPLOADING[/blue]",
+        "CONVERTING": "[blue]CONVERTING[/blue]",
+        "VERIFYING": "[blue]VERIFYING[/blue]",
+        "COMPLETED": "[green]COMPLETED[/green]",
+        "PARTIALLY_COMPLETED": "[yellow]PARTIALLY_COMPLETED[/yellow]",
+        "FAILED": "[red]FAILED[/red]",
+        "CANCELLED": "[dim]CANCELLED[/dim]",
+        "PROCESSING": "[blue]PROCESSING[/blue]",
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _truncate(text: str, width: int) -> str:
+    """Truncate text to width characters, appending "..." when cut."""
+    if len(text) > width:
+        return f"{text:.{width}s}..."
+    return text
 
 
 def format_size(size_bytes: int | float) -> str:
@@ -49,6 +90,16 @@ def format_duration(seconds: float) -> str:
     return f"{minutes}:{secs:02d}"
 
 
+def _require_valid_task_id(task_id: str) -> None:
+    """Exit with usage status if task_id is not a well-formed task ID.
+
+    Catches typos locally instead of spending an API round-trip on a 404.
+    """
+    if not _TASK_ID_RE.fullmatch(task_id):
+        _console().print(f"[red]Error: Invalid task ID: {task_id}[/red]")
+        sys.exit(2)
+
+
 def parse_date(date_str: str) -> datetime | None:
     """Parse YYYY-MM date string."""
     if not date_str:
@@ -77,6 +128,7 @@ cli.help = get_help("cli.description")
 @click.option("--top-n", type=int, help=get_help("scan.top_n"))
 @click.option("--json", "output_json", is_flag=True, help=get_help("scan.json"))
 @click.option("--legacy", is_flag=True, help=get_help("scan.legacy"))
+@click.option("--exif-bruteforce", is_flag=True, help=get_help("scan.exif_bruteforce"))
 @click.pass_context
 def scan(
     ctx,
@@ -85,8 +137,12 @@ def scan(
     top_n: int | None,
     output_json: bool,
     legacy: bool,
+    exif_bruteforce: bool,
 ):
     """Scan Apple Photos library and display conversion candidates."""
+    from rich.table import Table
+
+    console = _console()
     config = ctx.obj["config"]
 
     # Parse dates
@@ -101,7 +157,7 @@ def scan(
             "⚠ --legacy mode is deprecated and will be removed in a future version.",
             err=True,
         )
-        photos_manager = PhotosAccessManager()
+        photos_manager = PhotosAccessManager(exif_bruteforce=exif_bruteforce)
     else:
         # Use Swift implementation
         try:
@@ -114,7 +170,7 @@ def scan(
                 f"⚠ Swift implementation unavailable ({e}), falling back to legacy mode.",
                 err=True,
             )
-            photos_manager = PhotosAccessManager()
+            photos_manager = PhotosAccessManager(exif_bruteforce=exif_bruteforce)
 
     analyzer = CompressionAnalyzer()
     scan_service = ScanService(photos_manager=photos_manager, analyzer=analyzer)
@@ -195,7 +251,7 @@ def scan(
             location = "iCloud"
 
         table.add_row(
-            video.filename[:40] + ("..." if len(video.filename) > 40 else ""),
+            _truncate(video.filename, 40),
             video.codec,
             f"{video.resolution[0]}x{video.resolution[1]}",
             format_duration(video.duration),
@@ -248,6 +304,9 @@ scan.help = get_help("scan.description")
 @click.pass_context
 def convert(ctx, quality: str, top_n: int | None, dry_run: bool):
     """Convert candidate videos to H.265."""
+    from rich.table import Table
+
+    console = _console()
     config = ctx.obj["config"]
 
     # Load candidates
@@ -327,8 +386,13 @@ def import_cmd(
     item_id: str | None,
 ):
     """Import converted videos to Photos library."""
+    from rich.table import Table
+
     from vco.services.aws_import import AwsImportService
     from vco.services.unified_import import UnifiedImportService
+    from vco.utils.aws_session import get_http_session, get_session
+
+    console = _console()
 
     config = ctx.obj["config"]
     aws_config = config.config.aws
@@ -336,9 +400,7 @@ def import_cmd(
 
     # Initialize AWS service if configured
     aws_service = None
-    api_url = getattr(aws_config, "async_api_url", None)
-    if not api_url:
-        api_url = f"https://dln48ri1di.execute-api.{aws_config.region}.amazonaws.com/dev"
+    api_url = aws_config.async_api_url
 
     if aws_config.s3_bucket:
         try:
@@ -347,6 +409,8 @@ def import_cmd(
                 s3_bucket=aws_config.s3_bucket,
                 region=aws_config.region,
                 profile_name=aws_config.profile or None,
+                session=get_session(aws_config.region, aws_config.profile or None),
+                http_session=get_http_session(),
             )
         except Exception:
             # AWS service initialization failed, continue with local only
@@ -361,8 +425,9 @@ def import_cmd(
     if clear_mode:
         # Get all importable items to show what will be deleted
         list_result = unified_service.list_all_importable()
-        local_items = [item for item in list_result.all_items if item.source == "local"]
-        aws_items = [item for item in list_result.all_items if item.source == "aws"]
+        all_items = list_result.all_items
+        local_items = [item for item in all_items if item.source == "local"]
+        aws_items = [item for item in all_items if item.source == "aws"]
 
         if not local_items and not aws_items:
             console.print("[green]No items available for removal.[/green]")
@@ -772,6 +837,8 @@ def config(ctx, output_json: bool):
     if ctx.invoked_subcommand is not None:
         return
 
+    console = _console()
+
     config_manager = ctx.obj["config"]
     all_config = config_manager.get_all()
 
@@ -809,6 +876,7 @@ config.help = get_help("config.description")
 @click.pass_context
 def config_set(ctx, key: str, value: str):
     """Modify configuration value."""
+    console = _console()
     config_manager = ctx.obj["config"]
 
     try:
@@ -846,11 +914,9 @@ def _convert_async(ctx, candidates, quality: str, aws_config):
 
     from vco.services.async_convert import AsyncConvertCommand, UploadProgress
 
-    # Get API URL from config or use default
-    api_url = getattr(aws_config, "async_api_url", None)
-    if not api_url:
-        # Use default API URL based on region
-        api_url = f"https://dln48ri1di.execute-api.{aws_config.region}.amazonaws.com/dev"
+    console = _console()
+
+    api_url = aws_config.async_api_url
 
     console.print()
     console.print("[bold]Async conversion mode[/bold]")
@@ -940,21 +1006,28 @@ def _convert_async(ctx, candidates, quality: str, aws_config):
 @click.pass_context
 def status(ctx, status_filter: str | None, output_json: bool, task_id: str | None):
     """Check async task status."""
+    from rich.table import Table
+
     from vco.services.async_status import StatusCommand
+    from vco.utils.aws_session import get_http_session, get_session
+
+    console = _console()
+
+    if task_id:
+        _require_valid_task_id(task_id)
 
     config = ctx.obj["config"]
     aws_config = config.config.aws
 
-    # Get API URL
-    api_url = getattr(aws_config, "async_api_url", None)
-    if not api_url:
-        api_url = f"https://dln48ri1di.execute-api.{aws_config.region}.amazonaws.com/dev"
+    api_url = aws_config.async_api_url
 
     try:
         status_cmd = StatusCommand(
             api_url=api_url,
             region=aws_config.region,
             profile_name=aws_config.profile or None,
+            session=get_session(aws_config.region, aws_config.profile or None),
+            http_session=get_http_session(),
         )
 
         if task_id:
@@ -996,10 +1069,10 @@ def status(ctx, status_filter: str | None, output_json: bool, task_id: str | Non
             console.print(f"  Progress: {task.progress_percentage}%")
             if task.current_step:
                 console.print(f"  Current Step: {task.current_step}")
-            console.print(f"  Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            console.print(f"  Created: {task.created_at.strftime(_DT_FMT_FULL)}")
             if task.estimated_completion_time:
                 console.print(
-                    f"  Est. Completion: {task.estimated_completion_time.strftime('%H:%M:%S')}"
+                    f"  Est. Completion: {task.estimated_completion_time.strftime(_TIME_FMT)}"
                 )
             console.print()
 
@@ -1013,7 +1086,7 @@ def status(ctx, status_filter: str | None, output_json: bool, task_id: str | Non
 
             for f in task.files:
                 table.add_row(
-                    f.filename[:30] + ("..." if len(f.filename) > 30 else ""),
+                    _truncate(f.filename, 30),
                     _format_status(f.status),
                     f"{f.progress_percentage}%",
                     f"{f.ssim_score:.4f}" if f.ssim_score else "-",
@@ -1068,11 +1141,11 @@ def status(ctx, status_filter: str | None, output_json: bool, task_id: str | Non
                     files_str += f" ([red]{t.failed_count} failed[/red])"
 
                 table.add_row(
-                    t.task_id[:8] + "...",
+                    f"{t.task_id:.8s}...",
                     _format_status(t.status),
                     files_str,
                     f"{t.progress_percentage}%",
-                    t.created_at.strftime("%m-%d %H:%M"),
+                    t.created_at.strftime(_DT_FMT_SHORT),
                 )
 
             console.print(table)
@@ -1094,14 +1167,16 @@ status.help = get_help("status.description")
 def cancel(ctx, task_id: str):
     """Cancel a running async task."""
     from vco.services.async_cancel import CancelCommand
+    from vco.utils.aws_session import get_http_session, get_session
+
+    console = _console()
+
+    _require_valid_task_id(task_id)
 
     config = ctx.obj["config"]
     aws_config = config.config.aws
 
-    # Get API URL
-    api_url = getattr(aws_config, "async_api_url", None)
-    if not api_url:
-        api_url = f"https://dln48ri1di.execute-api.{aws_config.region}.amazonaws.com/dev"
+    api_url = aws_config.async_api_url
 
     console.print(f"[bold]Cancelling task: {task_id}[/bold]")
 
@@ -1114,6 +1189,8 @@ def cancel(ctx, task_id: str):
             api_url=api_url,
             region=aws_config.region,
             profile_name=aws_config.profile or None,
+            session=get_session(aws_config.region, aws_config.profile or None),
+            http_session=get_http_session(),
         )
 
         result = cancel_cmd.cancel(task_id)
@@ -1140,18 +1217,7 @@ cancel.help = get_help("cancel.description")
 
 def _format_status(status: str) -> str:
     """Format status with color."""
-    status_colors = {
-        "PENDING": "[yellow]PENDING[/yellow]",
-        "UPLOADING": "[blue]UPLOADING[/blue]",
-        "CONVERTING": "[blue]CONVERTING[/blue]",
-        "VERIFYING": "[blue]VERIFYING[/blue]",
-        "COMPLETED": "[green]COMPLETED[/green]",
-        "PARTIALLY_COMPLETED": "[yellow]PARTIALLY_COMPLETED[/yellow]",
-        "FAILED": "[red]FAILED[/red]",
-        "CANCELLED": "[dim]CANCELLED[/dim]",
-        "PROCESSING": "[blue]PROCESSING[/blue]",
-    }
-    return status_colors.get(status, status)
+    return _STATUS_COLORS.get(status, status)
 
 
 def main():
@@ -1,10 +1,45 @@
 """Configuration manager for Video Compression Optimizer."""
 
+import functools
+import hashlib
 import json
-from dataclasses import dataclass, field
+import operator
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
 from typing import Any
 
+from vco.config.quality_config import QUALITY_PRESETS
+
+# Default async workflow API endpoint, templated by region
+DEFAULT_ASYNC_API_URL = "https://dln48ri1di.execute-api.{region}.amazonaws.com/dev"
+
+
+def default_async_api_url(region: str) -> str:
+    """Get the default async API URL for a region.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        API Gateway URL for the async workflow
+    """
+    return DEFAULT_ASYNC_API_URL.format(region=region)
+
+
+# Accepted quality_preset values (QUALITY_PRESETS is the single source of truth)
+_VALID_PRESETS: frozenset[str] = frozenset(QUALITY_PRESETS)
+
+# Default folder for converted files, resolved once at import
+DEFAULT_STAGING_FOLDER = str(Path.home() / "Movies" / "VideoCompressionOptimizer" / "converted")
+
+
+@functools.lru_cache(maxsize=8)
+def _expand_folder(folder: str) -> Path:
+    """Expand a folder string to a Path, caching the home-directory lookup."""
+    return Path(folder).expanduser()
+
 
 @dataclass
 class AWSConfig:
@@ -16,6 +51,8 @@ class AWSConfig:
         role_arn: IAM role ARN for MediaConvert
         profile: AWS profile name (optional)
         quality_checker_function: Lambda function name for quality checking
+        async_api_url: API Gateway URL for async workflow (defaults to the
+            region's endpoint)
     """
 
     region: str = "ap-northeast-1"
@@ -23,6 +60,12 @@ class AWSConfig:
     role_arn: str = ""
     profile: str = ""
     quality_checker_function: str = "vco-quality-checker-dev"
+    async_api_url: str = ""
+
+    def __post_init__(self):
+        """Resolve the default async API URL for the region."""
+        if not self.async_api_url:
+            self.async_api_url = default_async_api_url(self.region)
 
 
 @dataclass
@@ -37,19 +80,14 @@ class ConversionConfig:
 
     quality_preset: str = "balanced"
     max_concurrent: int = 5
-    staging_folder: str = field(
-        default_factory=lambda: str(
-            Path.home() / "Movies" / "VideoCompressionOptimizer" / "converted"
-        )
-    )
+    staging_folder: str = DEFAULT_STAGING_FOLDER
 
     def __post_init__(self):
         """Validate configuration values."""
-        valid_presets = ("high", "balanced", "balanced+", "compression")
-        if self.quality_preset not in valid_presets:
+        if self.quality_preset not in _VALID_PRESETS:
             raise ValueError(
                 f"Invalid quality_preset: {self.quality_preset}. "
-                f"Must be one of: {', '.join(valid_presets)}"
+                f"Must be one of: {', '.join(QUALITY_PRESETS)}"
             )
         if not 1 <= self.max_concurrent <= 10:
             raise ValueError(
@@ -59,7 +97,7 @@ class ConversionConfig:
     @property
     def staging_folder_path(self) -> Path:
         """Get staging folder as Path object."""
-        return Path(self.staging_folder).expanduser()
+        return _expand_folder(self.staging_folder)
 
 
 @dataclass
@@ -77,6 +115,62 @@ class Config:
     schema_version: str = "1.0"
 
 
+def _validate_quality_preset(value: Any) -> Any:
+    """Validate a conversion.quality_preset value."""
+    if value not in _VALID_PRESETS:
+        raise ValueError(
+            f"Invalid quality_preset: {value}. Must be one of: {', '.join(QUALITY_PRESETS)}"
+        )
+    return value
+
+
+def _validate_max_concurrent(value: Any) -> int:
+    """Validate and convert a conversion.max_concurrent value."""
+    value = int(value)
+    if not 1 <= value <= 10:
+        raise ValueError(f"Invalid max_concurrent: {value}. Must be between 1 and 10")
+    return value
+
+
+def _no_validation(value: Any) -> Any:
+    """Accept a value unchanged."""
+    return value
+
+
+# Value validators for dotted keys that need them
+_VALIDATORS: dict[str, Callable[[Any], Any]] = {
+    "conversion.quality_preset": _validate_quality_preset,
+    "conversion.max_concurrent": _validate_max_concurrent,
+}
+
+
+def _build_accessors() -> dict[str, tuple[Callable[[Config], Any], str, str, Callable[[Any], Any]]]:
+    """Build the (getter, section, name, validator) table for every dotted key.
+
+    Walks the fields of Config once, one level into nested dataclasses.
+    """
+    accessors = {}
+    for section in fields(Config):
+        if not (isinstance(section.type, type) and is_dataclass(section.type)):
+            continue
+        for item in fields(section.type):
+            key = f"{section.name}.{item.name}"
+            accessors[key] = (
+                operator.attrgetter(key),
+                section.name,
+                item.name,
+                _VALIDATORS.get(key, _no_validation),
+            )
+    return accessors
+
+
+# Dotted configuration keys (e.g. "aws.region") and how to read/write them
+_ACCESSORS = _build_accessors()
+
+# Top-level Config attributes (sections and schema_version)
+_TOP_LEVEL_KEYS = frozenset(f.name for f in fields(Config))
+
+
 class ConfigManager:
     """Manages configuration loading, saving, and access.
 
@@ -93,6 +187,8 @@ class ConfigManager:
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self.config = self._load_config()
+        # Digest of the last payload written by save(), used to skip no-op writes
+        self._last_saved_hash: bytes | None = None
 
     def _load_config(self) -> Config:
         """Load configuration from file or create default.
@@ -131,15 +227,13 @@ class ConfigManager:
             quality_checker_function=aws_data.get(
                 "quality_checker_function", "vco-quality-checker-dev"
             ),
+            async_api_url=aws_data.get("async_api_url", ""),
         )
 
         conversion_config = ConversionConfig(
             quality_preset=conversion_data.get("quality_preset", "balanced"),
             max_concurrent=conversion_data.get("max_concurrent", 5),
-            staging_folder=conversion_data.get(
-                "staging_folder",
-                str(Path.home() / "Movies" / "VideoCompressionOptimizer" / "converted"),
-            ),
+            staging_folder=conversion_data.get("staging_folder", DEFAULT_STAGING_FOLDER),
             # Note: default_convert_mode is ignored for backward compatibility
         )
 
@@ -166,6 +260,7 @@ class ConfigManager:
                 "role_arn": config.aws.role_arn,
                 "profile": config.aws.profile,
                 "quality_checker_function": config.aws.quality_checker_function,
+                "async_api_url": config.aws.async_api_url,
             },
             "conversion": {
                 "quality_preset": config.conversion.quality_preset,
@@ -175,13 +270,30 @@ class ConfigManager:
         }
 
     def save(self) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file.
+
+        The file is written to a temporary sibling and renamed into place,
+        so an interrupted save never leaves a truncated config. Saving a
+        configuration identical to the last one written is a no-op.
+        """
+        data = self._config_to_dict(self.config)
+        # Persist the region's default API URL as "" so it keeps following
+        # aws.region, including hand edits of the file
+        aws = data["aws"]
+        if aws["async_api_url"] == default_async_api_url(aws["region"]):
+            aws["async_api_url"] = ""
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_saved_hash and self.config_path.exists():
+            return
+
         # Ensure directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = self._config_to_dict(self.config)
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.config_path)
+        self._last_saved_hash = digest
 
     def get(self, key: str) -> Any:
         """Get configuration value by dot-notation key.
@@ -195,23 +307,16 @@ class ConfigManager:
         Raises:
             KeyError: If key is not found
         """
-        parts = key.split(".")
-
-        if len(parts) == 1:
-            # Top-level key
-            if hasattr(self.config, key):
-                return getattr(self.config, key)
-            raise KeyError(f"Unknown configuration key: {key}")
+        accessor = _ACCESSORS.get(key)
+        if accessor is not None:
+            return accessor[0](self.config)
 
-        if len(parts) == 2:
-            section, name = parts
-            if hasattr(self.config, section):
-                section_obj = getattr(self.config, section)
-                if hasattr(section_obj, name):
-                    return getattr(section_obj, name)
-            raise KeyError(f"Unknown configuration key: {key}")
+        if key in _TOP_LEVEL_KEYS:
+            return getattr(self.config, key)
 
-        raise KeyError(f"Invalid configuration key format: {key}")
+        if key.count(".") > 1:
+            raise KeyError(f"Invalid configuration key format: {key}")
+        raise KeyError(f"Unknown configuration key: {key}")
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value by dot-notation key.
@@ -224,32 +329,24 @@ class ConfigManager:
             KeyError: If key is not found
             ValueError: If value is invalid
         """
-        parts = key.split(".")
-
-        if len(parts) != 2:
-            raise KeyError(f"Invalid configuration key format: {key}")
-
-        section, name = parts
-
-        if not hasattr(self.config, section):
-            raise KeyError(f"Unknown configuration section: {section}")
+        accessor = _ACCESSORS.get(key)
+        if accessor is None:
+            if key.count(".") != 1:
+                raise KeyError(f"Invalid configuration key format: {key}")
+            section = key.split(".", 1)[0]
+            if section not in _TOP_LEVEL_KEYS:
+                raise KeyError(f"Unknown configuration section: {section}")
+            raise KeyError(f"Unknown configuration key: {key}")
 
+        _, section, name, validate = accessor
+        value = validate(value)
         section_obj = getattr(self.config, section)
 
-        if not hasattr(section_obj, name):
-            raise KeyError(f"Unknown configuration key: {key}")
-
-        # Validate specific fields
-        if section == "conversion":
-            valid_presets = ("high", "balanced", "balanced+", "compression")
-            if name == "quality_preset" and value not in valid_presets:
-                raise ValueError(
-                    f"Invalid quality_preset: {value}. Must be one of: {', '.join(valid_presets)}"
-                )
-            if name == "max_concurrent":
-                value = int(value)
-                if not 1 <= value <= 10:
-                    raise ValueError(f"Invalid max_concurrent: {value}. Must be between 1 and 10")
+        # Keep the default API URL in step with the region
+        if key == "aws.region" and section_obj.async_api_url == default_async_api_url(
+            section_obj.region
+        ):
+            section_obj.async_api_url = default_async_api_url(value)
 
         setattr(section_obj, name, value)
 
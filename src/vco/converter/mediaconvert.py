@@ -1,13 +1,95 @@
 """AWS MediaConvert client for video conversion."""
 
+import bisect
+import copy
+import functools
+import json
+import os
+import sys
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# S3 transfer tuning for large video files. Files below the threshold are
+# sent with a single PutObject; larger ones are split into parts that are
+# transferred in parallel.
+S3_MULTIPART_THRESHOLD = 64 * 1024 * 1024  # 64 MiB
+S3_MULTIPART_CHUNKSIZE = int(os.environ.get("VCO_S3_PART_SIZE", 50 * 1024 * 1024))  # 50 MiB
+S3_MAX_CONCURRENCY = int(os.environ.get("VCO_S3_CONCURRENCY", 16))
+
+# botocore client settings shared by the MediaConvert and S3 clients.
+# Adaptive retries throttle on the client side before hitting the service
+# TPS limits, and the default pool of 10 connections would serialize
+# concurrent job calls and parallel multipart parts.
+AWS_MAX_POOL_CONNECTIONS = max(64, S3_MAX_CONCURRENCY * 2)
+AWS_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+)
+
+# Presigned uploads larger than this are split into presigned multipart parts
+PRESIGN_MULTIPART_THRESHOLD = 100 * 1024 * 1024  # 100 MiB
+
+# Server-side copy: CopyObject handles objects up to 5 GiB; larger ones are
+# copied as parallel UploadPartCopy byte ranges
+S3_COPY_OBJECT_MAX_SIZE = 5 * 1024 * 1024 * 1024  # 5 GiB
+S3_COPY_PART_SIZE = 16 * 1024 * 1024  # 16 MiB
+S3_MAX_PARTS = 10_000
+MAX_COPY_WORKERS = 32
+
+# Maximum number of keys accepted by a single DeleteObjects call
+S3_DELETE_BATCH_SIZE = 1000
+
+# Job statuses after which MediaConvert makes no further progress
+TERMINAL_JOB_STATUSES = frozenset({"COMPLETE", "ERROR", "CANCELED"})
+
+# SQS long-poll wait (the maximum SQS allows)
+SQS_WAIT_TIME_SECONDS = 20
+
+# Receives after which a terminal event for a job nobody is waiting on is
+# deleted instead of being returned to the queue for another consumer
+SQS_MAX_EVENT_RECEIVES = 5
+
+# Concurrent MediaConvert API calls. CreateJob has a low TPS quota, so
+# submissions use a smaller pool than GetJob lookups.
+MAX_SUBMIT_WORKERS = 5
+MAX_STATUS_WORKERS = 10
+
+# estimate_cost lookup tables: upper pixel bound of each tier (1280x720,
+# 1920x1080; anything larger is 4K) and the PRICING_PER_MINUTE keys in tier order
+_PRICING_TIER_MAX_PIXELS = (921600, 2073600)
+_PRICING_TIERS = ("sd", "hd", "4k")
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_endpoint(region: str, profile_name: str | None = None) -> str:
+    """Resolve the account-specific MediaConvert endpoint for a region.
+
+    The endpoint never changes for an account and region, so it is looked
+    up with DescribeEndpoints once per process.
+
+    Args:
+        region: AWS region
+        profile_name: AWS profile name (optional)
+
+    Returns:
+        MediaConvert endpoint URL
+    """
+    session = boto3.Session(profile_name=profile_name, region_name=region)
+    client = session.client("mediaconvert", region_name=region)
+    response = client.describe_endpoints()
+    return str(response["Endpoints"][0]["Url"])
+
 
 @dataclass
 class QualityPreset:
@@ -62,6 +144,115 @@ class ConversionJob:
     estimated_cost: float = 0.0
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    quality_preset: str = ""
+
+    def __post_init__(self):
+        """Intern the preset name so jobs in a batch share one string."""
+        self.quality_preset = sys.intern(self.quality_preset)
+
+    @property
+    def preset(self) -> QualityPreset | None:
+        """Get the shared QualityPreset for this job, if known."""
+        return QUALITY_PRESETS.get(self.quality_preset)
+
+
+# MediaConvert job settings shared by every job. _build_job_settings deep
+# copies this and fills in the fields marked "set per job".
+# NameModifier is appended to the input filename by MediaConvert:
+# {input_filename}{NameModifier}.{extension}; '_h265' marks H.265 output.
+_JOB_SETTINGS_TEMPLATE: dict = {
+    "Inputs": [
+        {
+            "FileInput": None,  # set per job
+            "AudioSelectors": {"Audio Selector 1": {"DefaultSelection": "DEFAULT"}},
+            "VideoSelector": {},
+            "TimecodeSource": "ZEROBASED",
+        }
+    ],
+    "OutputGroups": [
+        {
+            "Name": "File Group",
+            "OutputGroupSettings": {
+                "Type": "FILE_GROUP_SETTINGS",
+                "FileGroupSettings": {
+                    "Destination": None  # set per job
+                },
+            },
+            "Outputs": [
+                {
+                    "NameModifier": "_h265",
+                    "ContainerSettings": {
+                        "Container": "MP4",
+                        "Mp4Settings": {
+                            "CslgAtom": "INCLUDE",
+                            "FreeSpaceBox": "EXCLUDE",
+                            "MoovPlacement": "PROGRESSIVE_DOWNLOAD",
+                        },
+                    },
+                    "VideoDescription": {
+                        "CodecSettings": {
+                            "Codec": "H_265",
+                            "H265Settings": {
+                                "RateControlMode": "QVBR",
+                                "QvbrSettings": {
+                                    "QvbrQualityLevel": None,  # set per job
+                                    "QvbrQualityLevelFineTune": 0,
+                                },
+                                "MaxBitrate": None,  # set per job
+                                "GopSize": 90,
+                                "GopSizeUnits": "FRAMES",
+                                "ParNumerator": 1,
+                                "ParDenominator": 1,
+                                "ParControl": "SPECIFIED",
+                                "NumberBFramesBetweenReferenceFrames": 3,
+                                "NumberReferenceFrames": 3,
+                                "Slices": 1,
+                                "InterlaceMode": "PROGRESSIVE",
+                                "SceneChangeDetect": "ENABLED",
+                                "MinIInterval": 0,
+                                "AdaptiveQuantization": "HIGH",
+                                "FlickerAdaptiveQuantization": "ENABLED",
+                                "SpatialAdaptiveQuantization": "ENABLED",
+                                "TemporalAdaptiveQuantization": "ENABLED",
+                                "UnregisteredSeiTimecode": "DISABLED",
+                                "SampleAdaptiveOffsetFilterMode": "ADAPTIVE",
+                                "WriteMp4PackagingType": "HVC1",
+                                "AlternateTransferFunctionSei": "DISABLED",
+                            },
+                        },
+                        "ScalingBehavior": "DEFAULT",
+                        "TimecodeInsertion": "DISABLED",
+                        "AntiAlias": "ENABLED",
+                        "Sharpness": 50,
+                        "AfdSignaling": "NONE",
+                        "DropFrameTimecode": "ENABLED",
+                        "RespondToAfd": "NONE",
+                        "ColorMetadata": "INSERT",
+                    },
+                    "AudioDescriptions": [
+                        {
+                            "CodecSettings": {
+                                "Codec": "AAC",
+                                "AacSettings": {
+                                    "Bitrate": 128000,
+                                    "CodingMode": "CODING_MODE_2_0",
+                                    "SampleRate": 48000,
+                                    "RateControlMode": "CBR",
+                                    "RawFormat": "NONE",
+                                    "Specification": "MPEG4",
+                                    "AudioDescriptionBroadcasterMix": "NORMAL",
+                                },
+                            },
+                            "AudioSourceName": "Audio Selector 1",
+                        }
+                    ],
+                    "Extension": "mp4",
+                }
+            ],
+        }
+    ],
+    "TimecodeConfig": {"Source": "ZEROBASED"},
+}
 
 
 class MediaConvertClient:
@@ -75,7 +266,15 @@ class MediaConvertClient:
         "4k": 0.030,  # > 1080p
     }
 
-    def __init__(self, region: str, s3_bucket: str, role_arn: str, profile_name: str | None = None):
+    def __init__(
+        self,
+        region: str,
+        s3_bucket: str,
+        role_arn: str,
+        profile_name: str | None = None,
+        notification_queue_url: str | None = None,
+        use_accelerate: bool = False,
+    ):
         """Initialize MediaConvert client.
 
         Args:
@@ -83,10 +282,21 @@ class MediaConvertClient:
             s3_bucket: S3 bucket for video files
             role_arn: IAM role ARN for MediaConvert
             profile_name: AWS profile name (optional)
+            notification_queue_url: SQS queue receiving MediaConvert job state
+                change events from EventBridge (optional). When set,
+                wait_for_completion waits on the queue instead of polling GetJob.
+            use_accelerate: Use the S3 Transfer Acceleration endpoint. Speeds up
+                uploads from far outside the bucket's region; the bucket must
+                have acceleration enabled.
         """
         self.region = region
         self.s3_bucket = s3_bucket
         self.role_arn = role_arn
+        self.notification_queue_url = notification_queue_url
+
+        # Prefix of every S3 URI in this bucket, used to build and parse URIs
+        self._s3_prefix = f"s3://{s3_bucket}/"
+        self._s3_prefix_len = len(self._s3_prefix)
 
         # Create boto3 session
         session_kwargs = {"region_name": region}
@@ -95,21 +305,59 @@ class MediaConvertClient:
         self.session = boto3.Session(**session_kwargs)
 
         # Get MediaConvert endpoint
-        self._endpoint_url = self._get_mediaconvert_endpoint()
+        self._endpoint_url = _resolve_endpoint(region, profile_name)
 
         # Create clients
-        self.mediaconvert = self.session.client("mediaconvert", endpoint_url=self._endpoint_url)
-        self.s3 = self.session.client("s3")
+        self.mediaconvert = self.session.client(
+            "mediaconvert", endpoint_url=self._endpoint_url, config=AWS_CLIENT_CONFIG
+        )
+        s3_options: dict[str, bool | str] = {"use_accelerate_endpoint": use_accelerate}
+        if use_accelerate:
+            # The accelerate endpoint needs virtual-hosted addressing; otherwise
+            # keep botocore's "auto" so dotted bucket names use path style
+            s3_options["addressing_style"] = "virtual"
+        s3_config = AWS_CLIENT_CONFIG.merge(Config(s3=s3_options))
+        self.s3 = self.session.client("s3", config=s3_config)
+        self.sqs = self.session.client("sqs") if notification_queue_url else None
+
+        # Jobs this client is waiting on via the notification queue, and the
+        # terminal statuses one waiter received on behalf of another
+        self._event_lock = threading.Lock()
+        self._event_waiters: set[str] = set()
+        self._terminal_events: dict[str, str] = {}
+
+        # Shared multipart settings for upload/download
+        self._transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_MAX_CONCURRENCY,
+            use_threads=True,
+        )
 
-    def _get_mediaconvert_endpoint(self) -> str:
-        """Get the MediaConvert endpoint URL for the region."""
-        client = self.session.client("mediaconvert", region_name=self.region)
-        response = client.describe_endpoints()
-        return str(response["Endpoints"][0]["Url"])
+        # One transfer manager for the client's lifetime, so its worker
+        # threads are reused across uploads/downloads instead of being
+        # created per call. Released by close().
+        self._s3_transfer = create_transfer_manager(self.s3, self._transfer_config)
+
+    def close(self) -> None:
+        """Shut down the shared S3 transfer manager.
+
+        Waits for in-flight transfers to finish.
+        """
+        self._s3_transfer.shutdown()
+
+    def __enter__(self) -> "MediaConvertClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def upload_to_s3(self, local_path: Path, s3_key: str) -> str:
         """Upload a file to S3.
 
+        Files larger than S3_MULTIPART_THRESHOLD are uploaded as parallel
+        multipart transfers.
+
         Args:
             local_path: Local file path
             s3_key: S3 object key
@@ -117,8 +365,9 @@ class MediaConvertClient:
         Returns:
             S3 URI (s3://bucket/key)
         """
-        self.s3.upload_file(str(local_path), self.s3_bucket, s3_key)
-        return f"s3://{self.s3_bucket}/{s3_key}"
+        future = self._s3_transfer.upload(str(local_path), self.s3_bucket, s3_key)
+        future.result()
+        return f"{self._s3_prefix}{s3_key}"
 
     def download_from_s3(self, s3_key: str, local_path: Path) -> Path:
         """Download a file from S3.
@@ -131,9 +380,126 @@ class MediaConvertClient:
             Local file path
         """
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        self.s3.download_file(self.s3_bucket, s3_key, str(local_path))
+        future = self._s3_transfer.download(self.s3_bucket, s3_key, str(local_path))
+        future.result()
         return local_path
 
+    def copy_s3_object(self, src_key: str, dst_key: str, src_bucket: str | None = None) -> str:
+        """Copy an object within S3 without downloading it.
+
+        Objects up to 5 GiB use a single CopyObject call. Larger objects are
+        copied as a multipart upload whose parts are UploadPartCopy byte
+        ranges issued in parallel; the source's ContentType and Metadata are
+        set on the upload, as CopyObject would copy them.
+
+        Args:
+            src_key: Source S3 object key
+            dst_key: Destination S3 object key (in this client's bucket)
+            src_bucket: Source bucket (defaults to this client's bucket)
+
+        Returns:
+            S3 URI of the copy (s3://bucket/key)
+        """
+        copy_source = {"Bucket": src_bucket or self.s3_bucket, "Key": src_key}
+        head = self.s3.head_object(**copy_source)
+        size = head["ContentLength"]
+
+        if size <= S3_COPY_OBJECT_MAX_SIZE:
+            self.s3.copy_object(Bucket=self.s3_bucket, Key=dst_key, CopySource=copy_source)
+            return f"{self._s3_prefix}{dst_key}"
+
+        part_size = max(S3_COPY_PART_SIZE, -(-size // S3_MAX_PARTS))
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        object_attributes = {k: head[k] for k in ("ContentType", "Metadata") if k in head}
+        upload_id = self.s3.create_multipart_upload(
+            Bucket=self.s3_bucket, Key=dst_key, **object_attributes
+        )["UploadId"]
+
+        def copy_part(numbered_range: tuple[int, tuple[int, int]]) -> dict:
+            part_number, (first, last) = numbered_range
+            response = self.s3.upload_part_copy(
+                Bucket=self.s3_bucket,
+                Key=dst_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource=copy_source,
+                CopySourceRange=f"bytes={first}-{last}",
+            )
+            return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+                parts = list(executor.map(copy_part, enumerate(ranges, start=1)))
+        except Exception:
+            self.s3.abort_multipart_upload(Bucket=self.s3_bucket, Key=dst_key, UploadId=upload_id)
+            raise
+
+        return self.complete_multipart_upload(dst_key, upload_id, parts)
+
+    def presign_put(self, s3_key: str, size_hint: int | None = None, expires: int = 3600) -> dict:
+        """Create presigned URLs so a client can upload directly to S3.
+
+        Small (or unknown-size) files get a single PUT URL. Files of at least
+        PRESIGN_MULTIPART_THRESHOLD bytes get a multipart upload with one PUT
+        URL per part; the uploader must then report the part ETags so that
+        complete_multipart_upload can finalize the object.
+
+        Args:
+            s3_key: S3 object key
+            size_hint: Expected file size in bytes (optional)
+            expires: URL lifetime in seconds
+
+        Returns:
+            {"url": ...} for a single PUT, or
+            {"upload_id": ..., "part_size": ..., "part_urls": [...]} for multipart
+        """
+        if size_hint is None or size_hint < PRESIGN_MULTIPART_THRESHOLD:
+            url = self.s3.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": self.s3_bucket, "Key": s3_key},
+                ExpiresIn=expires,
+            )
+            return {"url": url}
+
+        response = self.s3.create_multipart_upload(Bucket=self.s3_bucket, Key=s3_key)
+        upload_id = response["UploadId"]
+        part_size = S3_MULTIPART_CHUNKSIZE
+        part_count = -(-size_hint // part_size)
+        part_urls = [
+            self.s3.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": self.s3_bucket,
+                    "Key": s3_key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires,
+            )
+            for part_number in range(1, part_count + 1)
+        ]
+        return {"upload_id": upload_id, "part_size": part_size, "part_urls": part_urls}
+
+    def complete_multipart_upload(self, s3_key: str, upload_id: str, parts: list[dict]) -> str:
+        """Finalize a multipart upload started by presign_put.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: Upload ID returned by presign_put
+            parts: List of {"PartNumber": int, "ETag": str} for each uploaded part
+
+        Returns:
+            S3 URI (s3://bucket/key)
+        """
+        self.s3.complete_multipart_upload(
+            Bucket=self.s3_bucket,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+        )
+        return f"{self._s3_prefix}{s3_key}"
+
     def delete_from_s3(self, s3_key: str) -> bool:
         """Delete a file from S3.
 
@@ -149,6 +515,92 @@ class MediaConvertClient:
         except ClientError:
             return False
 
+    def bulk_upload(
+        self, items: list[tuple[Path, str]], concurrency: int = 10
+    ) -> dict[str, str | Exception]:
+        """Upload several files to S3 in parallel.
+
+        Each worker still uses the multipart TransferConfig, so large files
+        are split into parts on top of the per-file parallelism.
+
+        Args:
+            items: List of (local_path, s3_key) pairs
+            concurrency: Maximum number of files transferred at once
+
+        Returns:
+            Dict mapping each S3 key to its S3 URI, or to the exception raised
+            if that upload failed
+        """
+        results: dict[str, str | Exception] = {}
+        if not items:
+            return results
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                s3_key: executor.submit(self.upload_to_s3, local_path, s3_key)
+                for local_path, s3_key in items
+            }
+            for s3_key, future in futures.items():
+                try:
+                    results[s3_key] = future.result()
+                except Exception as e:
+                    results[s3_key] = e
+
+        return results
+
+    def bulk_download(
+        self, items: list[tuple[str, Path]], concurrency: int = 10
+    ) -> dict[str, Path | Exception]:
+        """Download several files from S3 in parallel.
+
+        Args:
+            items: List of (s3_key, local_path) pairs
+            concurrency: Maximum number of files transferred at once
+
+        Returns:
+            Dict mapping each S3 key to its local path, or to the exception
+            raised if that download failed
+        """
+        results: dict[str, Path | Exception] = {}
+        if not items:
+            return results
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                s3_key: executor.submit(self.download_from_s3, s3_key, local_path)
+                for s3_key, local_path in items
+            }
+            for s3_key, future in futures.items():
+                try:
+                    results[s3_key] = future.result()
+                except Exception as e:
+                    results[s3_key] = e
+
+        return results
+
+    def bulk_delete(self, s3_keys: list[str]) -> list[str]:
+        """Delete several files from S3 using batched DeleteObjects calls.
+
+        Args:
+            s3_keys: S3 object keys
+
+        Returns:
+            Keys that could not be deleted
+        """
+        failed: list[str] = []
+        for start in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE):
+            batch = s3_keys[start : start + S3_DELETE_BATCH_SIZE]
+            try:
+                response = self.s3.delete_objects(
+                    Bucket=self.s3_bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except ClientError:
+                failed.extend(batch)
+                continue
+            failed.extend(error["Key"] for error in response.get("Errors", []))
+        return failed
+
     def submit_job(
         self,
         source_video_uuid: str,
@@ -178,7 +630,7 @@ class MediaConvertClient:
         response = self.mediaconvert.create_job(
             Role=self.role_arn,
             Settings=job_settings,
-            UserMetadata={"source_video_uuid": source_video_uuid, "quality_preset": quality_preset},
+            UserMetadata={"source_video_uuid": source_video_uuid, "quality_preset": preset.name},
         )
 
         job_id = response["Job"]["Id"]
@@ -190,8 +642,35 @@ class MediaConvertClient:
             output_s3_key=output_s3_key,
             status="SUBMITTED",
             progress_percent=0,
+            quality_preset=preset.name,
         )
 
+    def submit_jobs(
+        self, jobs: list[dict], concurrency: int = MAX_SUBMIT_WORKERS
+    ) -> list[ConversionJob | Exception]:
+        """Submit several conversion jobs in parallel.
+
+        Args:
+            jobs: List of submit_job keyword arguments (source_video_uuid,
+                source_s3_key, output_s3_key and optionally quality_preset)
+            concurrency: Maximum number of CreateJob calls in flight
+
+        Returns:
+            ConversionJob for each submitted job, or the exception raised if
+            that submission failed, in input order
+        """
+        if not jobs:
+            return []
+
+        def submit(kwargs: dict) -> ConversionJob | Exception:
+            try:
+                return self.submit_job(**kwargs)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+            return list(executor.map(submit, jobs))
+
     def _build_job_settings(
         self, source_s3_key: str, output_s3_key: str, preset: QualityPreset
     ) -> dict:
@@ -205,108 +684,20 @@ class MediaConvertClient:
         Returns:
             MediaConvert job settings dictionary
         """
-        # Extract output directory and filename
-        output_path = Path(output_s3_key)
-        output_dir = str(output_path.parent)
+        output_dir = str(Path(output_s3_key).parent)
 
-        # NameModifier is appended to the input filename by MediaConvert
-        # MediaConvert output: {input_filename}{NameModifier}.{extension}
-        # We use '_h265' as the modifier to indicate H.265 encoding
-        name_modifier = "_h265"
+        settings = copy.deepcopy(_JOB_SETTINGS_TEMPLATE)
+        settings["Inputs"][0]["FileInput"] = f"{self._s3_prefix}{source_s3_key}"
 
-        return {
-            "Inputs": [
-                {
-                    "FileInput": f"s3://{self.s3_bucket}/{source_s3_key}",
-                    "AudioSelectors": {"Audio Selector 1": {"DefaultSelection": "DEFAULT"}},
-                    "VideoSelector": {},
-                    "TimecodeSource": "ZEROBASED",
-                }
-            ],
-            "OutputGroups": [
-                {
-                    "Name": "File Group",
-                    "OutputGroupSettings": {
-                        "Type": "FILE_GROUP_SETTINGS",
-                        "FileGroupSettings": {
-                            "Destination": f"s3://{self.s3_bucket}/{output_dir}/"
-                        },
-                    },
-                    "Outputs": [
-                        {
-                            "NameModifier": name_modifier,
-                            "ContainerSettings": {
-                                "Container": "MP4",
-                                "Mp4Settings": {
-                                    "CslgAtom": "INCLUDE",
-                                    "FreeSpaceBox": "EXCLUDE",
-                                    "MoovPlacement": "PROGRESSIVE_DOWNLOAD",
-                                },
-                            },
-                            "VideoDescription": {
-                                "CodecSettings": {
-                                    "Codec": "H_265",
-                                    "H265Settings": {
-                                        "RateControlMode": "QVBR",
-                                        "QvbrSettings": {
-                                            "QvbrQualityLevel": preset.qvbr_quality_level,
-                                            "QvbrQualityLevelFineTune": 0,
-                                        },
-                                        "MaxBitrate": preset.qvbr_max_bitrate,
-                                        "GopSize": 90,
-                                        "GopSizeUnits": "FRAMES",
-                                        "ParNumerator": 1,
-                                        "ParDenominator": 1,
-                                        "ParControl": "SPECIFIED",
-                                        "NumberBFramesBetweenReferenceFrames": 3,
-                                        "NumberReferenceFrames": 3,
-                                        "Slices": 1,
-                                        "InterlaceMode": "PROGRESSIVE",
-                                        "SceneChangeDetect": "ENABLED",
-                                        "MinIInterval": 0,
-                                        "AdaptiveQuantization": "HIGH",
-                                        "FlickerAdaptiveQuantization": "ENABLED",
-                                        "SpatialAdaptiveQuantization": "ENABLED",
-                                        "TemporalAdaptiveQuantization": "ENABLED",
-                                        "UnregisteredSeiTimecode": "DISABLED",
-                                        "SampleAdaptiveOffsetFilterMode": "ADAPTIVE",
-                                        "WriteMp4PackagingType": "HVC1",
-                                        "AlternateTransferFunctionSei": "DISABLED",
-                                    },
-                                },
-                                "ScalingBehavior": "DEFAULT",
-                                "TimecodeInsertion": "DISABLED",
-                                "AntiAlias": "ENABLED",
-                                "Sharpness": 50,
-                                "AfdSignaling": "NONE",
-                                "DropFrameTimecode": "ENABLED",
-                                "RespondToAfd": "NONE",
-                                "ColorMetadata": "INSERT",
-                            },
-                            "AudioDescriptions": [
-                                {
-                                    "CodecSettings": {
-                                        "Codec": "AAC",
-                                        "AacSettings": {
-                                            "Bitrate": 128000,
-                                            "CodingMode": "CODING_MODE_2_0",
-                                            "SampleRate": 48000,
-                                            "RateControlMode": "CBR",
-                                            "RawFormat": "NONE",
-                                            "Specification": "MPEG4",
-                                            "AudioDescriptionBroadcasterMix": "NORMAL",
-                                        },
-                                    },
-                                    "AudioSourceName": "Audio Selector 1",
-                                }
-                            ],
-                            "Extension": "mp4",
-                        }
-                    ],
-                }
-            ],
-            "TimecodeConfig": {"Source": "ZEROBASED"},
-        }
+        output_group = settings["OutputGroups"][0]
+        output_group["OutputGroupSettings"]["FileGroupSettings"]["Destination"] = (
+            f"{self._s3_prefix}{output_dir}/"
+        )
+        h265 = output_group["Outputs"][0]["VideoDescription"]["CodecSettings"]["H265Settings"]
+        h265["QvbrSettings"]["QvbrQualityLevel"] = preset.qvbr_quality_level
+        h265["MaxBitrate"] = preset.qvbr_max_bitrate
+
+        return settings
 
     def get_job_status(self, job_id: str) -> ConversionJob:
         """Get the status of a conversion job.
@@ -318,8 +709,18 @@ class MediaConvertClient:
             ConversionJob with current status
         """
         response = self.mediaconvert.get_job(Id=job_id)
-        job = response["Job"]
+        return self._job_from_description(job_id, response["Job"])
+
+    def _job_from_description(self, job_id: str, job: dict) -> ConversionJob:
+        """Build a ConversionJob from a GetJob/ListJobs job description.
+
+        Args:
+            job_id: MediaConvert job ID
+            job: Job description dictionary
 
+        Returns:
+            ConversionJob with the described status
+        """
         status = job["Status"]
         progress = job.get("JobPercentComplete", 0)
         error_message = None
@@ -328,7 +729,7 @@ class MediaConvertClient:
         if status == "ERROR":
             error_message = job.get("ErrorMessage", "Unknown error")
 
-        if status in ("COMPLETE", "ERROR", "CANCELED"):
+        if status in TERMINAL_JOB_STATUSES:
             # Parse completion time if available
             if "Timing" in job and "FinishTime" in job["Timing"]:
                 completed_at = job["Timing"]["FinishTime"]
@@ -336,6 +737,7 @@ class MediaConvertClient:
         # Get metadata
         metadata = job.get("UserMetadata", {})
         source_video_uuid = metadata.get("source_video_uuid", "")
+        quality_preset = metadata.get("quality_preset", "")
 
         # Get input/output keys from job settings
         source_s3_key = ""
@@ -345,8 +747,8 @@ class MediaConvertClient:
             settings = job["Settings"]
             if "Inputs" in settings and settings["Inputs"]:
                 file_input = settings["Inputs"][0].get("FileInput", "")
-                if file_input.startswith(f"s3://{self.s3_bucket}/"):
-                    source_s3_key = file_input[len(f"s3://{self.s3_bucket}/") :]
+                if file_input.startswith(self._s3_prefix):
+                    source_s3_key = file_input[self._s3_prefix_len :]
 
             if "OutputGroups" in settings and settings["OutputGroups"]:
                 output_group = settings["OutputGroups"][0]
@@ -356,8 +758,8 @@ class MediaConvertClient:
                         .get("FileGroupSettings", {})
                         .get("Destination", "")
                     )
-                    if dest.startswith(f"s3://{self.s3_bucket}/"):
-                        output_dir = dest[len(f"s3://{self.s3_bucket}/") :]
+                    if dest.startswith(self._s3_prefix):
+                        output_dir = dest[self._s3_prefix_len :]
                         # Construct output key (MediaConvert adds the filename)
                         output_s3_key = output_dir.rstrip("/")
 
@@ -370,6 +772,7 @@ class MediaConvertClient:
             progress_percent=progress,
             error_message=error_message,
             completed_at=completed_at,
+            quality_preset=quality_preset,
         )
 
     def wait_for_completion(
@@ -377,9 +780,13 @@ class MediaConvertClient:
     ) -> ConversionJob:
         """Wait for a job to complete.
 
+        If a notification queue is configured, waits for the job's terminal
+        state change event on SQS and calls GetJob only once at the end.
+        Otherwise polls get_job_status every poll_interval seconds.
+
         Args:
             job_id: MediaConvert job ID
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds between status checks (polling mode only)
             timeout: Maximum seconds to wait
 
         Returns:
@@ -388,12 +795,15 @@ class MediaConvertClient:
         Raises:
             TimeoutError: If job doesn't complete within timeout
         """
+        if self.notification_queue_url:
+            return self._wait_for_completion_event(job_id, timeout)
+
         start_time = time.time()
 
         while True:
             job = self.get_job_status(job_id)
 
-            if job.status in ("COMPLETE", "ERROR", "CANCELED"):
+            if job.status in TERMINAL_JOB_STATUSES:
                 return job
 
             elapsed = time.time() - start_time
@@ -402,6 +812,100 @@ class MediaConvertClient:
 
             time.sleep(poll_interval)
 
+    def _wait_for_completion_event(self, job_id: str, timeout: int) -> ConversionJob:
+        """Wait for a job's terminal state change event on the notification queue.
+
+        Every message received is consumed except terminal events for jobs no
+        waiter of this client is waiting on: those are returned to the queue
+        at once for other consumers, and deleted after SQS_MAX_EVENT_RECEIVES
+        receives. Terminal events for this client's other waiters are handed
+        over to them.
+
+        Args:
+            job_id: MediaConvert job ID
+            timeout: Maximum seconds to wait
+
+        Returns:
+            ConversionJob with final status
+
+        Raises:
+            TimeoutError: If no terminal event arrives within timeout
+        """
+        with self._event_lock:
+            self._event_waiters.add(job_id)
+        try:
+            # The job may have finished before we started listening
+            job = self.get_job_status(job_id)
+            if job.status in TERMINAL_JOB_STATUSES:
+                return job
+
+            deadline = time.time() + timeout
+
+            while True:
+                with self._event_lock:
+                    if self._terminal_events.pop(job_id, None):
+                        return self.get_job_status(job_id)
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+
+                response = self.sqs.receive_message(  # type: ignore[union-attr]
+                    QueueUrl=self.notification_queue_url,
+                    WaitTimeSeconds=min(SQS_WAIT_TIME_SECONDS, max(1, int(remaining))),
+                    MaxNumberOfMessages=10,
+                    AttributeNames=["ApproximateReceiveCount"],
+                )
+
+                found = False
+                for message in response.get("Messages", []):
+                    found = self._dispatch_job_event(message, job_id) or found
+                if found:
+                    return self.get_job_status(job_id)
+        finally:
+            with self._event_lock:
+                self._event_waiters.discard(job_id)
+                self._terminal_events.pop(job_id, None)
+
+    def _dispatch_job_event(self, message: dict, job_id: str) -> bool:
+        """Consume or release one notification queue message.
+
+        Args:
+            message: Message from ReceiveMessage
+            job_id: Job the calling waiter is waiting on
+
+        Returns:
+            True if the message is job_id's terminal event
+        """
+        try:
+            detail = json.loads(message["Body"]).get("detail", {})
+            event_job_id = detail.get("jobId")
+            status = detail.get("status")
+        except (json.JSONDecodeError, AttributeError):
+            event_job_id = status = None
+
+        if status in TERMINAL_JOB_STATUSES and event_job_id != job_id:
+            with self._event_lock:
+                waited_on = event_job_id in self._event_waiters
+                if waited_on:
+                    self._terminal_events[event_job_id] = status
+            receive_count = int(message.get("Attributes", {}).get("ApproximateReceiveCount", 1))
+            if not waited_on and receive_count < SQS_MAX_EVENT_RECEIVES:
+                self.sqs.change_message_visibility(  # type: ignore[union-attr]
+                    QueueUrl=self.notification_queue_url,
+                    ReceiptHandle=message["ReceiptHandle"],
+                    VisibilityTimeout=0,
+                )
+                return False
+
+        # Progress events, unreadable messages and delivered terminal events
+        # are of no further use to anyone
+        self.sqs.delete_message(  # type: ignore[union-attr]
+            QueueUrl=self.notification_queue_url,
+            ReceiptHandle=message["ReceiptHandle"],
+        )
+        return event_job_id == job_id and status in TERMINAL_JOB_STATUSES
+
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a conversion job.
 
@@ -428,43 +932,55 @@ class MediaConvertClient:
             Estimated cost in USD
         """
         width, height = resolution
-        pixels = width * height
-
-        # Determine pricing tier based on resolution
-        if pixels <= 921600:  # 1280x720
-            tier = "sd"
-        elif pixels <= 2073600:  # 1920x1080
-            tier = "hd"
-        else:
-            tier = "4k"
+        tier = bisect.bisect_left(_PRICING_TIER_MAX_PIXELS, width * height)
+        price = self.PRICING_PER_MINUTE[_PRICING_TIERS[tier]]
+        return round(duration_seconds / 60 * price, 4)
 
-        duration_minutes = duration_seconds / 60
-        cost = duration_minutes * self.PRICING_PER_MINUTE[tier]
-
-        return round(cost, 4)
+    def list_jobs(
+        self,
+        status: str | None = None,
+        max_results: int | None = 20,
+        hydrate: bool = True,
+        page_size: int = 20,
+    ) -> Iterator[ConversionJob]:
+        """List recent conversion jobs, newest first.
 
-    def list_jobs(self, status: str | None = None, max_results: int = 20) -> list[ConversionJob]:
-        """List recent conversion jobs.
+        Jobs are fetched page by page as the caller iterates, so stopping
+        early skips the remaining ListJobs/GetJob calls.
 
         Args:
             status: Filter by status (SUBMITTED, PROGRESSING, COMPLETE, ERROR, CANCELED)
-            max_results: Maximum number of results
+            max_results: Maximum number of results (None for all)
+            hydrate: Re-read each job with GetJob. When False, jobs are built
+                from the ListJobs entries without extra API calls.
+            page_size: Number of jobs requested per ListJobs call
 
-        Returns:
-            List of ConversionJob objects
+        Yields:
+            ConversionJob objects
         """
-        kwargs = {"MaxResults": max_results, "Order": "DESCENDING"}
+        pagination_config = {"PageSize": page_size}
+        if max_results is not None:
+            pagination_config["MaxItems"] = max_results
+
+        kwargs: dict = {"Order": "DESCENDING", "PaginationConfig": pagination_config}
         if status:
             kwargs["Status"] = status
 
-        response = self.mediaconvert.list_jobs(**kwargs)
-
-        jobs = []
-        for job_data in response.get("Jobs", []):
-            job_id = job_data["Id"]
-            jobs.append(self.get_job_status(job_id))
-
-        return jobs
+        paginator = self.mediaconvert.get_paginator("list_jobs")
+        for page in paginator.paginate(**kwargs):
+            entries = page.get("Jobs", [])
+            if not entries:
+                continue
+
+            if not hydrate:
+                for entry in entries:
+                    yield self._job_from_description(entry["Id"], entry)
+                continue
+
+            # Fetch the page's job details concurrently; map() keeps the order
+            job_ids = [entry["Id"] for entry in entries]
+            with ThreadPoolExecutor(max_workers=min(MAX_STATUS_WORKERS, len(job_ids))) as executor:
+                yield from executor.map(self.get_job_status, job_ids)
 
 
 def get_quality_preset(name: str) -> QualityPreset:
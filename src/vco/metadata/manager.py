@@ -6,14 +6,229 @@ This module handles:
 3. Setting file system dates on video files
 """
 
+import asyncio
+import ctypes
+import functools
 import json
 import os
+import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from vco.models.base import _optional_datetime
+from vco.utils.json_io import dump_json, load_json
+
+# FFprobe arguments for reading container tags and stream info as JSON
+FFPROBE_ARGS = (
+    "-v",
+    "quiet",
+    "-print_format",
+    "json",
+    "-show_format",
+    "-show_streams",
+)
+
+# Container tags read by MetadataManager.extract_metadata
+FFPROBE_FORMAT_TAGS = (
+    "creation_time",
+    "date",
+    "com.apple.quicktime.creationdate",
+    "title",
+    "description",
+    "comment",
+    "com.apple.quicktime.location.ISO6709",
+)
+
+# FFprobe arguments for reading only the tags above; skipping the stream
+# list keeps the JSON output under a kilobyte
+FFPROBE_FORMAT_ARGS = (
+    "-v",
+    "quiet",
+    "-print_format",
+    "json",
+    "-show_entries",
+    f"format_tags={','.join(FFPROBE_FORMAT_TAGS)}",
+)
+
+# Seconds before an FFprobe call is abandoned
+FFPROBE_TIMEOUT = 60
+
+# One "key": "value" pair of the tags above in FFprobe's JSON output; the
+# value group keeps JSON escapes, which are decoded only when present
+_FFPROBE_TAG_RE = re.compile(
+    r'"(' + "|".join(map(re.escape, FFPROBE_FORMAT_TAGS)) + r')"\s*:\s*"((?:[^"\\]|\\.)*)"'
+)
+
+# Descriptors opened by Python are non-inheritable (PEP 446), so child
+# processes are started without the close-every-fd sweep, which is slow
+# when a batch run has many files open
+SUBPROCESS_CLOSE_FDS = False
+
+# CoreFoundation, used to set file creation dates in-process on macOS
+CORE_FOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+# Unix timestamp of the CFAbsoluteTime epoch (2001-01-01T00:00:00Z)
+_CF_ABSOLUTE_TIME_EPOCH = 978307200.0
+
+# Maximum concurrent SetFile/touch processes when copying dates in bulk
+MAX_DATE_COPY_WORKERS = 8
+
+# Date formats found in video metadata tags:
+#   2024-06-15T10:30:00.123456Z, 2024-06-15T10:30:00Z, 2024-06-15T10:30:00+09:00,
+#   2024-06-15T10:30:00, 2024-06-15 10:30:00, 2024-06-15
+# A trailing Z is accepted but yields a naive datetime; an explicit offset
+# yields an aware one.
+_DATE_RE = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"(?:[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})"
+    r"(?:\.(?P<fraction>\d{1,6}))?"
+    r"(?:Z|(?P<tz_sign>[+-])(?P<tz_hour>\d{2}):?(?P<tz_minute>\d{2}))?)?"
+)
+
+# ISO 6709 latitude and longitude prefix, e.g. +35.6762+139.6503/ (any
+# trailing altitude or CRS is ignored)
+_ISO6709_RE = re.compile(r"([+-]?\d+(?:\.\d*)?)([+-]\d+(?:\.\d*)?)")
+
+# VideoMetadata fields that can be embedded in the container, as
+# (attribute, FFmpeg metadata name, value formatter). Location is written
+# in ISO 6709 format: +DD.DDDD+DDD.DDDD/
+_METADATA_FIELD_MAP = (
+    ("capture_date", "creation_time", lambda v: v.strftime("%Y-%m-%dT%H:%M:%S")),
+    ("title", "title", str),
+    ("description", "description", str),
+    ("location", "com.apple.quicktime.location.ISO6709", lambda v: f"{v[0]:+.4f}{v[1]:+.4f}/"),
+)
+
+# Fixed parts of the FFmpeg remux command used to apply metadata
+_FFMPEG_PREFIX = ("ffmpeg", "-i")
+_FFMPEG_COPY_ARGS = ("-c", "copy")  # Copy streams without re-encoding
+_FFMPEG_SUFFIX = ("-y",)  # Overwrite output
+
+
+def _parse_format_tags(stdout: str) -> dict[str, Any]:
+    """Pick the known format tags out of FFPROBE_FORMAT_ARGS output.
+
+    The output only holds format tags, so a regex scan over it yields the
+    same result as json.loads without building the full document.
+
+    Args:
+        stdout: FFprobe stdout (JSON)
+
+    Returns:
+        FFprobe output as dictionary ({"format": {"tags": {...}}})
+    """
+    tags = {
+        key: json.loads(f'"{value}"') if "\\" in value else value
+        for key, value in _FFPROBE_TAG_RE.findall(stdout)
+    }
+    if not tags and '"tags"' in stdout:
+        # Unexpected layout; let the JSON parser have a go
+        data: dict[str, Any] = json.loads(stdout)
+        return data
+    return {"format": {"tags": tags}}
+
+
+@functools.lru_cache(maxsize=1)
+def _core_foundation() -> ctypes.CDLL | None:
+    """Load CoreFoundation with the signatures used below.
+
+    Returns:
+        The library, or None when not on macOS or it cannot be loaded
+    """
+    if sys.platform != "darwin":
+        return None
+    try:
+        cf = ctypes.CDLL(CORE_FOUNDATION_PATH)
+    except OSError:
+        return None
+
+    cf.CFURLCreateFromFileSystemRepresentation.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_long,
+        ctypes.c_bool,
+    ]
+    cf.CFURLCreateFromFileSystemRepresentation.restype = ctypes.c_void_p
+    cf.CFDateCreate.argtypes = [ctypes.c_void_p, ctypes.c_double]
+    cf.CFDateCreate.restype = ctypes.c_void_p
+    cf.CFURLSetResourcePropertyForKey.argtypes = [ctypes.c_void_p] * 4
+    cf.CFURLSetResourcePropertyForKey.restype = ctypes.c_bool
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.restype = None
+    return cf
+
+
+def _set_creation_date_native(video_path: Path, creation_date: datetime) -> bool:
+    """Set a file's creation date through CoreFoundation (macOS only).
+
+    This is a single in-process call instead of a SetFile subprocess.
+
+    Args:
+        video_path: Path to the video file
+        creation_date: File creation date to set (naive values are local time)
+
+    Returns:
+        True if the date was set; False if unsupported or the call failed
+    """
+    cf = _core_foundation()
+    if cf is None:
+        return False
+
+    raw_path = os.fsencode(video_path)
+    url = cf.CFURLCreateFromFileSystemRepresentation(None, raw_path, len(raw_path), False)
+    if not url:
+        return False
+    try:
+        date = cf.CFDateCreate(None, creation_date.timestamp() - _CF_ABSOLUTE_TIME_EPOCH)
+        if not date:
+            return False
+        try:
+            key = ctypes.c_void_p.in_dll(cf, "kCFURLCreationDateKey")
+            return bool(cf.CFURLSetResourcePropertyForKey(url, key, date, None))
+        finally:
+            cf.CFRelease(date)
+    finally:
+        cf.CFRelease(url)
+
+
+@functools.lru_cache(maxsize=512)
+def _ffprobe_cached(
+    path_str: str, size: int, mtime_ns: int, args: tuple[str, ...] = FFPROBE_ARGS
+) -> str:
+    """Run FFprobe and return its raw JSON output.
+
+    size and mtime_ns are not used by the call itself; they are part of the
+    cache key so that a modified file is probed again.
+
+    Args:
+        path_str: Path to video file
+        size: File size in bytes
+        mtime_ns: File modification time in nanoseconds
+        args: FFprobe arguments selecting what to report
+
+    Returns:
+        FFprobe stdout (JSON)
+    """
+    cmd = ["ffprobe", *args, path_str]
+
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=FFPROBE_TIMEOUT,
+        close_fds=SUBPROCESS_CLOSE_FDS,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(f"FFprobe failed: {result.stderr}")
+
+    return result.stdout
+
 
 @dataclass
 class VideoMetadata:
@@ -40,21 +255,13 @@ class VideoMetadata:
     @classmethod
     def from_dict(cls, data: dict) -> "VideoMetadata":
         """Create from dictionary."""
-        capture_date = None
-        if data.get("capture_date"):
-            capture_date = datetime.fromisoformat(data["capture_date"])
-
-        creation_date = None
-        if data.get("creation_date"):
-            creation_date = datetime.fromisoformat(data["creation_date"])
-
         location = None
-        if data.get("location"):
-            location = tuple(data["location"])
+        if loc := data.get("location"):
+            location = (loc[0], loc[1])
 
         return cls(
-            capture_date=capture_date,
-            creation_date=creation_date,
+            capture_date=_optional_datetime(data.get("capture_date")),
+            creation_date=_optional_datetime(data.get("creation_date")),
             albums=data.get("albums", []),
             title=data.get("title"),
             description=data.get("description"),
@@ -81,31 +288,80 @@ class MetadataManager:
         if not video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
+        try:
+            probe_data = self._run_ffprobe_format(video_path)
+        except Exception:
+            # If FFprobe fails, use file system dates only
+            probe_data = None
+
+        return self._build_metadata(video_path, probe_data)
+
+    async def extract_metadata_batch(
+        self, video_paths: list[Path], concurrency: int | None = None
+    ) -> list[VideoMetadata]:
+        """Extract metadata from several video files with concurrent FFprobe runs.
+
+        Args:
+            video_paths: Paths to the video files
+            concurrency: Maximum number of FFprobe processes at once
+                (defaults to the CPU count)
+
+        Returns:
+            VideoMetadata for each path, in input order
+
+        Raises:
+            FileNotFoundError: If any of the files does not exist
+        """
+        for video_path in video_paths:
+            if not video_path.exists():
+                raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+
+        async def extract(video_path: Path) -> VideoMetadata:
+            async with semaphore:
+                try:
+                    probe_data = await self._run_ffprobe_async(video_path)
+                except Exception:
+                    probe_data = None
+            return self._build_metadata(video_path, probe_data)
+
+        return list(await asyncio.gather(*(extract(path) for path in video_paths)))
+
+    def _build_metadata(self, video_path: Path, probe_data: dict[str, Any] | None) -> VideoMetadata:
+        """Build VideoMetadata from file system dates and FFprobe output.
+
+        Args:
+            video_path: Path to the video file
+            probe_data: FFprobe output, or None if FFprobe failed
+
+        Returns:
+            VideoMetadata with extracted information
+        """
         # Get file creation/modification times
         stat = video_path.stat()
         creation_date = datetime.fromtimestamp(stat.st_birthtime)
 
-        # Try to extract metadata using FFprobe
         capture_date = None
         title = None
         description = None
         location = None
 
-        try:
-            probe_data = self._run_ffprobe(video_path)
-
+        if probe_data is not None:
             # Extract creation_time from format tags
             format_tags = probe_data.get("format", {}).get("tags", {})
 
-            # Try various date fields
-            for date_field in ["creation_time", "date", "com.apple.quicktime.creationdate"]:
-                if date_field in format_tags:
-                    try:
-                        date_str = format_tags[date_field]
-                        capture_date = self._parse_date(date_str)
-                        break
-                    except (ValueError, TypeError):
-                        continue
+            # Try various date fields, in order of preference; a tag that
+            # fails to parse falls through to the next one
+            for date_field in ("creation_time", "date", "com.apple.quicktime.creationdate"):
+                date_str = format_tags.get(date_field)
+                if date_str is None:
+                    continue
+                try:
+                    capture_date = self._parse_date(date_str)
+                    break
+                except (ValueError, TypeError):
+                    continue
 
             # Extract title
             title = format_tags.get("title")
@@ -118,10 +374,6 @@ class MetadataManager:
             if location_str:
                 location = self._parse_location(location_str)
 
-        except Exception:
-            # If FFprobe fails, use file system dates only
-            pass
-
         return VideoMetadata(
             capture_date=capture_date,
             creation_date=creation_date,
@@ -131,7 +383,9 @@ class MetadataManager:
             location=location,
         )
 
-    def apply_metadata(self, video_path: Path, metadata: VideoMetadata) -> bool:
+    def apply_metadata(
+        self, video_path: Path, metadata: VideoMetadata, skip_if_tagged: bool = False
+    ) -> bool:
         """Apply metadata to a video file.
 
         Note: This uses FFmpeg to copy metadata. Some metadata like albums
@@ -140,6 +394,10 @@ class MetadataManager:
         Args:
             video_path: Path to the video file
             metadata: Metadata to apply
+            skip_if_tagged: Probe the file first and skip the remux if it already
+                carries every tag. Only worth it when re-applying metadata;
+                freshly converted files never have the tags, so the probe is
+                pure overhead there.
 
         Returns:
             True if successful
@@ -147,51 +405,48 @@ class MetadataManager:
         if not video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        # Build FFmpeg metadata arguments
-        metadata_args = []
-
-        if metadata.capture_date:
-            date_str = metadata.capture_date.strftime("%Y-%m-%dT%H:%M:%S")
-            metadata_args.extend(["-metadata", f"creation_time={date_str}"])
-
-        if metadata.title:
-            metadata_args.extend(["-metadata", f"title={metadata.title}"])
-
-        if metadata.description:
-            metadata_args.extend(["-metadata", f"description={metadata.description}"])
-
-        if metadata.location:
-            lat, lon = metadata.location
-            # ISO 6709 format: +DD.DDDD+DDD.DDDD/
-            location_str = f"{lat:+.4f}{lon:+.4f}/"
-            metadata_args.extend(
-                ["-metadata", f"com.apple.quicktime.location.ISO6709={location_str}"]
-            )
+        # Tags to write, keyed by FFmpeg metadata name
+        tags = {
+            key: fmt(value)
+            for name, key, fmt in _METADATA_FIELD_MAP
+            if (value := getattr(metadata, name))
+        }
 
-        if not metadata_args:
+        if not tags:
             return True  # Nothing to apply
 
+        # Applying tags means remuxing the whole file, so on a re-apply skip
+        # it when the file already carries them
+        if skip_if_tagged and self._has_tags(video_path, tags):
+            return True
+
         # Create temporary output file
         temp_path = video_path.with_suffix(".temp.mp4")
 
         try:
             cmd = [
-                "ffmpeg",
-                "-i",
+                *_FFMPEG_PREFIX,
                 str(video_path),
-                "-c",
-                "copy",  # Copy streams without re-encoding
-                *metadata_args,
-                "-y",  # Overwrite output
+                *_FFMPEG_COPY_ARGS,
+                *(arg for key, value in tags.items() for arg in ("-metadata", f"{key}={value}")),
+                *_FFMPEG_SUFFIX,
                 str(temp_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=300,
+                close_fds=SUBPROCESS_CLOSE_FDS,
+            )
 
             if result.returncode != 0:
+                temp_path.unlink(missing_ok=True)
                 return False
 
-            # Replace original with temp file
+            # Replace original with temp file; the temp file sits next to
+            # the original, so this is a rename rather than a copy
             temp_path.replace(video_path)
             return True
 
@@ -201,11 +456,42 @@ class MetadataManager:
                 temp_path.unlink()
             return False
 
+    def _has_tags(self, video_path: Path, tags: dict[str, str]) -> bool:
+        """Check whether a video file already carries the given metadata tags.
+
+        Args:
+            video_path: Path to the video file
+            tags: FFmpeg metadata names and values
+
+        Returns:
+            True if every tag is present with the same value
+        """
+        try:
+            format_tags = self._run_ffprobe_format(video_path).get("format", {}).get("tags", {})
+        except Exception:
+            return False
+
+        for name, value in tags.items():
+            current = format_tags.get(name)
+            if current is None:
+                return False
+            if name == "creation_time":
+                # FFprobe reports e.g. 2024-06-15T10:30:00.000000Z
+                try:
+                    current = self._parse_date(current).strftime("%Y-%m-%dT%H:%M:%S")
+                except ValueError:
+                    return False
+            if current != value:
+                return False
+
+        return True
+
     def set_file_dates(
         self,
         video_path: Path,
         creation_date: datetime | None = None,
         modification_date: datetime | None = None,
+        stat_result: os.stat_result | None = None,
     ) -> bool:
         """Set file system dates on a video file.
 
@@ -213,40 +499,93 @@ class MetadataManager:
             video_path: Path to the video file
             creation_date: File creation date to set
             modification_date: File modification date to set
+            stat_result: Stat of another file whose access and modification
+                times are copied with nanosecond precision (takes precedence
+                over modification_date)
 
         Returns:
             True if successful
         """
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path}")
-
+        # The utime call doubles as the existence check, so the file is only
+        # stat'ed separately when no times need setting
         try:
-            # Set modification time using os.utime
-            if modification_date:
+            if stat_result is not None:
+                os.utime(video_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+            elif modification_date:
                 mod_timestamp = modification_date.timestamp()
                 os.utime(video_path, (mod_timestamp, mod_timestamp))
+            elif not video_path.exists():
+                raise FileNotFoundError
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video file not found: {video_path}") from None
+        except Exception:
+            return False
+
+        if not creation_date:
+            return True
+
+        # Set creation time using SetFile on macOS
+        try:
+            return self._set_creation_date([video_path], creation_date)
+        except Exception:
+            return False
 
-            # Set creation time using SetFile on macOS
-            if creation_date:
-                # Format: MM/DD/YYYY HH:MM:SS
-                date_str = creation_date.strftime("%m/%d/%Y %H:%M:%S")
+    def set_creation_dates(self, video_paths: list[Path], creation_date: datetime) -> bool:
+        """Set the same creation date on several video files.
 
-                result = subprocess.run(
-                    ["SetFile", "-d", date_str, str(video_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
+        All files are updated by a single SetFile (or touch) process
+        instead of one process per file.
 
-                if result.returncode != 0:
-                    # SetFile might not be available, try touch
-                    return self._set_dates_with_touch(video_path, creation_date)
+        Args:
+            video_paths: Paths to the video files
+            creation_date: File creation date to set
+
+        Returns:
+            True if successful
+        """
+        for video_path in video_paths:
+            if not video_path.exists():
+                raise FileNotFoundError(f"Video file not found: {video_path}")
 
+        if not video_paths:
             return True
 
+        try:
+            return self._set_creation_date(video_paths, creation_date)
         except Exception:
             return False
 
+    def _set_creation_date(self, video_paths: list[Path], creation_date: datetime) -> bool:
+        """Set file creation dates natively, falling back to SetFile, then touch.
+
+        Args:
+            video_paths: Paths to the video files
+            creation_date: File creation date to set
+
+        Returns:
+            True if successful
+        """
+        video_paths = [p for p in video_paths if not _set_creation_date_native(p, creation_date)]
+        if not video_paths:
+            return True
+
+        # Format: MM/DD/YYYY HH:MM:SS
+        date_str = creation_date.strftime("%m/%d/%Y %H:%M:%S")
+
+        result = subprocess.run(
+            ["SetFile", "-d", date_str, *(str(p) for p in video_paths)],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            close_fds=SUBPROCESS_CLOSE_FDS,
+        )
+
+        if result.returncode != 0:
+            # SetFile might not be available, try touch
+            return self._set_dates_with_touch(video_paths, creation_date)
+
+        return True
+
     def copy_dates_from_original(self, original_path: Path, converted_path: Path) -> bool:
         """Copy file dates from original to converted video.
 
@@ -257,24 +596,48 @@ class MetadataManager:
         Returns:
             True if successful
         """
-        if not original_path.exists():
-            raise FileNotFoundError(f"Original file not found: {original_path}")
-        if not converted_path.exists():
-            raise FileNotFoundError(f"Converted file not found: {converted_path}")
-
         try:
-            # Get original file dates
             stat = original_path.stat()
-            creation_date = datetime.fromtimestamp(stat.st_birthtime)
-            modification_date = datetime.fromtimestamp(stat.st_mtime)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Original file not found: {original_path}") from None
 
+        try:
+            creation_date = datetime.fromtimestamp(stat.st_birthtime)
             return self.set_file_dates(
-                converted_path, creation_date=creation_date, modification_date=modification_date
+                converted_path, creation_date=creation_date, stat_result=stat
             )
-
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Converted file not found: {converted_path}") from None
         except Exception:
             return False
 
+    def copy_dates_from_original_batch(
+        self, pairs: list[tuple[Path, Path]], max_workers: int = MAX_DATE_COPY_WORKERS
+    ) -> list[bool]:
+        """Copy file dates for several original/converted pairs concurrently.
+
+        Each pair starts its own SetFile (or touch) process; running them on
+        a thread pool overlaps the subprocess waits.
+
+        Args:
+            pairs: (original_path, converted_path) tuples
+            max_workers: Maximum number of concurrent copies
+
+        Returns:
+            Result of copy_dates_from_original for each pair, in input order
+
+        Raises:
+            FileNotFoundError: If any original or converted file does not exist
+        """
+        if not pairs:
+            return []
+
+        def copy(pair: tuple[Path, Path]) -> bool:
+            return self.copy_dates_from_original(*pair)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(copy, pairs))
+
     def save_metadata_json(self, metadata: VideoMetadata, output_path: Path) -> bool:
         """Save metadata to a JSON file.
 
@@ -287,8 +650,7 @@ class MetadataManager:
         """
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                json.dump(metadata.to_dict(), f, indent=2)
+            output_path.write_bytes(dump_json(metadata.to_dict()))
             return True
         except Exception:
             return False
@@ -303,39 +665,79 @@ class MetadataManager:
             VideoMetadata if successful, None otherwise
         """
         try:
-            with open(json_path) as f:
-                data = json.load(f)
+            data = load_json(json_path.read_bytes())
             return VideoMetadata.from_dict(data)
         except Exception:
             return None
 
-    def _run_ffprobe(self, video_path: Path) -> dict[str, Any]:
+    @staticmethod
+    def clear_ffprobe_cache() -> None:
+        """Clear cached FFprobe results."""
+        _ffprobe_cached.cache_clear()
+
+    def _run_ffprobe(
+        self, video_path: Path, args: tuple[str, ...] = FFPROBE_ARGS
+    ) -> dict[str, Any]:
         """Run FFprobe to get video metadata.
 
+        Results are cached per path, size, modification time and arguments,
+        so probing an unchanged file again does not start another FFprobe
+        process.
+
         Args:
             video_path: Path to video file
+            args: FFprobe arguments (defaults to format and stream info)
 
         Returns:
             FFprobe output as dictionary
         """
-        cmd = [
+        stat = video_path.stat()
+        stdout = _ffprobe_cached(str(video_path), stat.st_size, stat.st_mtime_ns, args)
+        data: dict[str, Any] = json.loads(stdout)
+        return data
+
+    def _run_ffprobe_format(self, video_path: Path) -> dict[str, Any]:
+        """Run FFprobe for the container tags used by extract_metadata only.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            FFprobe output as dictionary ({"format": {"tags": {...}}})
+        """
+        stat = video_path.stat()
+        return _parse_format_tags(
+            _ffprobe_cached(str(video_path), stat.st_size, stat.st_mtime_ns, FFPROBE_FORMAT_ARGS)
+        )
+
+    async def _run_ffprobe_async(self, video_path: Path) -> dict[str, Any]:
+        """Run FFprobe for the container tags without blocking the event loop.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            FFprobe output as dictionary
+        """
+        process = await asyncio.create_subprocess_exec(
             "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_format",
-            "-show_streams",
+            *FFPROBE_FORMAT_ARGS,
             str(video_path),
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=SUBPROCESS_CLOSE_FDS,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=FFPROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
 
-        if result.returncode != 0:
-            raise RuntimeError(f"FFprobe failed: {result.stderr}")
+        if process.returncode != 0:
+            raise RuntimeError(f"FFprobe failed: {stderr.decode(errors='replace')}")
 
-        data: dict[str, Any] = json.loads(result.stdout)
-        return data
+        return _parse_format_tags(stdout.decode())
 
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string from various formats.
@@ -346,28 +748,32 @@ class MetadataManager:
         Returns:
             Parsed datetime
         """
-        # Try various formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-        raise ValueError(f"Unable to parse date: {date_str}")
+        match = _DATE_RE.fullmatch(date_str)
+        if match is None:
+            raise ValueError(f"Unable to parse date: {date_str}")
+
+        tzinfo = None
+        if match["tz_sign"]:
+            offset = timedelta(hours=int(match["tz_hour"]), minutes=int(match["tz_minute"]))
+            tzinfo = timezone(-offset if match["tz_sign"] == "-" else offset)
+
+        fraction = match["fraction"]
+        return datetime(
+            int(match["year"]),
+            int(match["month"]),
+            int(match["day"]),
+            int(match["hour"] or 0),
+            int(match["minute"] or 0),
+            int(match["second"] or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=tzinfo,
+        )
 
     def _parse_location(self, location_str: str) -> tuple[float, float] | None:
         """Parse ISO 6709 location string.
 
-        Format: +DD.DDDD+DDD.DDDD/ or +DD.DDDD-DDD.DDDD/
+        Format: +DD.DDDD+DDD.DDDD/ or +DD.DDDD-DDD.DDDD/, optionally
+        followed by an altitude (+DDD.DDD/)
 
         Args:
             location_str: ISO 6709 location string
@@ -375,34 +781,16 @@ class MetadataManager:
         Returns:
             Tuple of (latitude, longitude) or None
         """
-        try:
-            # Remove trailing slash
-            location_str = location_str.rstrip("/")
-
-            # Find the second +/- sign (start of longitude)
-            second_sign_idx = None
-
-            for i in range(1, len(location_str)):
-                if location_str[i] in ("+", "-"):
-                    second_sign_idx = i
-                    break
-
-            if second_sign_idx is None:
-                return None
-
-            lat_str = location_str[:second_sign_idx]
-            lon_str = location_str[second_sign_idx:]
-
-            return (float(lat_str), float(lon_str))
-
-        except (ValueError, IndexError):
+        match = _ISO6709_RE.match(location_str)
+        if match is None:
             return None
+        return (float(match.group(1)), float(match.group(2)))
 
-    def _set_dates_with_touch(self, video_path: Path, date: datetime) -> bool:
+    def _set_dates_with_touch(self, video_paths: list[Path], date: datetime) -> bool:
         """Set file dates using touch command (fallback).
 
         Args:
-            video_path: Path to video file
+            video_paths: Paths to video files
             date: Date to set
 
         Returns:
@@ -413,10 +801,11 @@ class MetadataManager:
             date_str = date.strftime("%Y%m%d%H%M.%S")
 
             result = subprocess.run(
-                ["touch", "-t", date_str, str(video_path)],
+                ["touch", "-t", date_str, *(str(p) for p in video_paths)],
                 capture_output=True,
                 text=True,
                 timeout=30,
+                close_fds=SUBPROCESS_CLOSE_FDS,
             )
 
             return result.returncode == 0
@@ -4,12 +4,14 @@ This module defines the data structures for managing asynchronous video
 conversion tasks that run on AWS Step Functions.
 """
 
+import functools
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
-from vco.models.base import BaseVideoMetadata
+from vco.models.base import BaseVideoMetadata, _optional_datetime, _parse_isoformat
 
 
 class TaskStatus(Enum):
@@ -45,7 +47,52 @@ class FileStatus(Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+# Enum members by value; a dict lookup is much cheaper than Enum.__call__
+# when deserializing tasks with thousands of files
+_FILE_STATUS_BY_VALUE = {member.value: member for member in FileStatus}
+_TASK_STATUS_BY_VALUE = {member.value: member for member in TaskStatus}
+
+
+def _file_status(value: str) -> FileStatus:
+    """Look up a FileStatus by value.
+
+    Raises:
+        ValueError: If value is not a valid FileStatus
+    """
+    status = _FILE_STATUS_BY_VALUE.get(value)
+    return status if status is not None else FileStatus(value)
+
+
+def _task_status(value: str) -> TaskStatus:
+    """Look up a TaskStatus by value.
+
+    Raises:
+        ValueError: If value is not a valid TaskStatus
+    """
+    status = _TASK_STATUS_BY_VALUE.get(value)
+    return status if status is not None else TaskStatus(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_isoformat(value: datetime, utcoffset: timedelta | None) -> str:
+    """Format a timestamp; utcoffset is part of the cache key only.
+
+    Aware datetimes for the same instant in different zones compare equal,
+    so the offset keeps them from sharing a cached string.
+    """
+    return value.isoformat()
+
+
+def _optional_isoformat(value: datetime | None) -> str | None:
+    """Format an optional timestamp as ISO 8601, mapping None to None.
+
+    Tasks are serialized on every progress update while most of their
+    timestamps stay unchanged, so the strings are memoized.
+    """
+    return _cached_isoformat(value, value.utcoffset()) if value is not None else None
+
+
+@dataclass(slots=True)
 class AsyncFile(BaseVideoMetadata):
     """An individual file within an async conversion task.
 
@@ -98,49 +145,53 @@ class AsyncFile(BaseVideoMetadata):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for DynamoDB storage."""
-        base_dict = super().to_dict()
-        base_dict.update(
-            {
-                "file_id": self.file_id,
-                "original_uuid": self.uuid,  # Keep for API compatibility
-                "source_s3_key": self.source_s3_key,
-                "output_s3_key": self.output_s3_key,
-                "metadata_s3_key": self.metadata_s3_key,
-                "status": self.status.value,
-                "mediaconvert_job_id": self.mediaconvert_job_id,
-                "quality_result": self.quality_result,
-                "error_code": self.error_code,
-                "error_message": self.error_message,
-                "retry_count": self.retry_count,
-                "preset_attempts": self.preset_attempts,
-                "source_size_bytes": self.source_size_bytes,
-                "output_size_bytes": self.output_size_bytes,
-                "output_checksum": self.output_checksum,
-                "checksum_algorithm": self.checksum_algorithm,
-                "downloaded_at": self.downloaded_at.isoformat() if self.downloaded_at else None,
-                "download_available": self.download_available,
-            }
-        )
-        return base_dict
+        return {
+            "uuid": self.uuid,
+            "filename": self.filename,
+            "file_size": self.file_size,
+            "capture_date": _optional_isoformat(self.capture_date),
+            "location": list(loc) if (loc := self.location) else None,
+            "file_id": self.file_id,
+            "original_uuid": self.uuid,  # Keep for API compatibility
+            "source_s3_key": self.source_s3_key,
+            "output_s3_key": self.output_s3_key,
+            "metadata_s3_key": self.metadata_s3_key,
+            "status": self.status.value,
+            "mediaconvert_job_id": self.mediaconvert_job_id,
+            "quality_result": self.quality_result,
+            "error_code": self.error_code,
+            "error_message": self.error_message,
+            "retry_count": self.retry_count,
+            "preset_attempts": self.preset_attempts,
+            "source_size_bytes": self.source_size_bytes,
+            "output_size_bytes": self.output_size_bytes,
+            "output_checksum": self.output_checksum,
+            "checksum_algorithm": self.checksum_algorithm,
+            "downloaded_at": _optional_isoformat(self.downloaded_at),
+            "download_available": self.download_available,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AsyncFile":
         """Create from dictionary (DynamoDB data)."""
+        # The fallback keys are only read when the primary one is missing
+        file_size = data.get("file_size")
+        if file_size is None:
+            file_size = data.get("source_size_bytes", 0)
+        location = data.get("location")
         return cls(
             # Base fields
-            uuid=data.get("original_uuid", data.get("uuid", "")),
+            uuid=data.get("original_uuid") or data.get("uuid", ""),
             filename=data.get("filename", ""),
-            file_size=data.get("file_size", data.get("source_size_bytes", 0)),
-            capture_date=datetime.fromisoformat(data["capture_date"])
-            if data.get("capture_date")
-            else None,
-            location=tuple(data["location"]) if data.get("location") else None,
+            file_size=file_size,
+            capture_date=_optional_datetime(data.get("capture_date")),
+            location=(location[0], location[1]) if location else None,
             # AsyncFile specific fields
             file_id=data["file_id"],
             source_s3_key=data["source_s3_key"],
             output_s3_key=data.get("output_s3_key"),
             metadata_s3_key=data.get("metadata_s3_key"),
-            status=FileStatus(data.get("status", "PENDING")),
+            status=_file_status(data.get("status", "PENDING")),
             mediaconvert_job_id=data.get("mediaconvert_job_id"),
             quality_result=data.get("quality_result"),
             error_code=data.get("error_code"),
@@ -151,14 +202,12 @@ class AsyncFile(BaseVideoMetadata):
             output_size_bytes=data.get("output_size_bytes"),
             output_checksum=data.get("output_checksum"),
             checksum_algorithm=data.get("checksum_algorithm", "ETag"),
-            downloaded_at=datetime.fromisoformat(data["downloaded_at"])
-            if data.get("downloaded_at")
-            else None,
+            downloaded_at=_optional_datetime(data.get("downloaded_at")),
             download_available=data.get("download_available", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AsyncTask:
     """An async conversion task managed by Step Functions.
 
@@ -200,26 +249,23 @@ class AsyncTask:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for DynamoDB storage."""
+        iso = _optional_isoformat
         return {
             "task_id": self.task_id,
             "user_id": self.user_id,
             "status": self.status.value,
             "quality_preset": self.quality_preset,
-            "files": [f.to_dict() for f in self.files],
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "files": list(map(AsyncFile.to_dict, self.files)),
+            "created_at": iso(self.created_at),
+            "updated_at": iso(self.updated_at),
+            "started_at": iso(self.started_at),
+            "completed_at": iso(self.completed_at),
             "execution_arn": self.execution_arn,
             "error_message": self.error_message,
             "ttl": self.ttl,
             "progress_percentage": self.progress_percentage,
             "current_step": self.current_step,
-            "estimated_completion_time": (
-                self.estimated_completion_time.isoformat()
-                if self.estimated_completion_time
-                else None
-            ),
+            "estimated_completion_time": iso(self.estimated_completion_time),
             "max_concurrent": self.max_concurrent,
         }
 
@@ -229,27 +275,19 @@ class AsyncTask:
         return cls(
             task_id=data["task_id"],
             user_id=data["user_id"],
-            status=TaskStatus(data["status"]),
+            status=_task_status(data["status"]),
             quality_preset=data["quality_preset"],
-            files=[AsyncFile.from_dict(f) for f in data.get("files", [])],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            started_at=(
-                datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None
-            ),
-            completed_at=(
-                datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None
-            ),
+            files=list(map(AsyncFile.from_dict, data.get("files", ()))),
+            created_at=_parse_isoformat(data["created_at"]),
+            updated_at=_parse_isoformat(data["updated_at"]),
+            started_at=_optional_datetime(data.get("started_at")),
+            completed_at=_optional_datetime(data.get("completed_at")),
             execution_arn=data.get("execution_arn"),
             error_message=data.get("error_message"),
             ttl=data.get("ttl"),
             progress_percentage=data.get("progress_percentage", 0),
             current_step=data.get("current_step"),
-            estimated_completion_time=(
-                datetime.fromisoformat(data["estimated_completion_time"])
-                if data.get("estimated_completion_time")
-                else None
-            ),
+            estimated_completion_time=_optional_datetime(data.get("estimated_completion_time")),
             max_concurrent=data.get("max_concurrent", 5),
         )
 
@@ -266,27 +304,33 @@ class AsyncTask:
         Returns:
             Progress percentage (0-100)
         """
-        if self.status == TaskStatus.PENDING:
+        status = self.status
+        if status is TaskStatus.PENDING:
             return 0
-        elif self.status == TaskStatus.UPLOADING:
+        if status is TaskStatus.UPLOADING:
             return 10
-        elif self.status == TaskStatus.CONVERTING:
-            if not self.files:
+        if status is TaskStatus.CONVERTING:
+            total = len(self.files)
+            if not total:
                 return 10
-            completed = sum(
-                1 for f in self.files if f.status in (FileStatus.COMPLETED, FileStatus.FAILED)
-            )
-            file_progress = completed / len(self.files)
-            return 10 + int(file_progress * 70)
-        elif self.status == TaskStatus.VERIFYING:
-            if not self.files:
+            finished = 0
+            for f in self.files:
+                file_status = f.status
+                if file_status is FileStatus.COMPLETED or file_status is FileStatus.FAILED:
+                    finished += 1
+            return 10 + int(finished / total * 70)
+        if status is TaskStatus.VERIFYING:
+            total = len(self.files)
+            if not total:
                 return 80
-            verified = sum(1 for f in self.files if f.quality_result is not None)
-            verify_progress = verified / len(self.files)
-            return 80 + int(verify_progress * 15)
-        elif self.status in (TaskStatus.COMPLETED, TaskStatus.PARTIALLY_COMPLETED):
+            verified = 0
+            for f in self.files:
+                if f.quality_result is not None:
+                    verified += 1
+            return 80 + int(verified / total * 15)
+        if status is TaskStatus.COMPLETED or status is TaskStatus.PARTIALLY_COMPLETED:
             return 100
-        elif self.status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+        if status is TaskStatus.FAILED or status is TaskStatus.CANCELLED:
             return self.progress_percentage  # Keep last known progress
         return 0
 
@@ -313,9 +357,8 @@ class AsyncTask:
         if not self.files:
             return None
 
-        remaining = sum(
-            1 for f in self.files if f.status in (FileStatus.PENDING, FileStatus.CONVERTING)
-        )
+        counts = self.status_counts()
+        remaining = counts[FileStatus.PENDING] + counts[FileStatus.CONVERTING]
 
         if remaining == 0:
             return datetime.now()
@@ -324,20 +367,37 @@ class AsyncTask:
         batches = (remaining + self.max_concurrent - 1) // self.max_concurrent
         estimated_seconds = batches * avg_conversion_time_per_file
 
-        from datetime import timedelta
-
         return datetime.now() + timedelta(seconds=estimated_seconds)
 
+    def status_counts(self) -> Counter[FileStatus]:
+        """Count files per status in a single pass.
+
+        Returns:
+            Counter of file statuses (missing statuses count as 0)
+        """
+        return Counter(f.status for f in self.files)
+
+    def get_files_by_status(self) -> dict[FileStatus, list[AsyncFile]]:
+        """Group files by status in a single pass.
+
+        Returns:
+            Dict mapping each status present to its files, in task order
+        """
+        groups: dict[FileStatus, list[AsyncFile]] = {}
+        for f in self.files:
+            groups.setdefault(f.status, []).append(f)
+        return groups
+
     def get_completed_files(self) -> list[AsyncFile]:
         """Get list of successfully completed files."""
-        return [f for f in self.files if f.status == FileStatus.COMPLETED]
+        return [f for f in self.files if f.status is FileStatus.COMPLETED]
 
     def get_failed_files(self) -> list[AsyncFile]:
         """Get list of failed files."""
-        return [f for f in self.files if f.status == FileStatus.FAILED]
+        return [f for f in self.files if f.status is FileStatus.FAILED]
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadProgress:
     """Download progress for resume functionality.
 
@@ -386,7 +446,7 @@ class DownloadProgress:
             "local_temp_path": self.local_temp_path,
             "s3_key": self.s3_key,
             "checksum": self.checksum,
-            "last_updated": self.last_updated.isoformat(),
+            "last_updated": _optional_isoformat(self.last_updated),
         }
 
     @classmethod
@@ -419,13 +479,13 @@ def aggregate_task_status(file_statuses: list[FileStatus]) -> TaskStatus:
     if not file_statuses:
         return TaskStatus.FAILED
 
-    completed_count = sum(1 for s in file_statuses if s == FileStatus.COMPLETED)
-    failed_count = sum(1 for s in file_statuses if s == FileStatus.FAILED)
+    # list.count compares members in C (identity first), so each count is a
+    # single native pass; the failed count is only needed when not all done
     total = len(file_statuses)
 
-    if completed_count == total:
+    if file_statuses.count(FileStatus.COMPLETED) == total:
         return TaskStatus.COMPLETED
-    elif failed_count == total:
+    elif file_statuses.count(FileStatus.FAILED) == total:
         return TaskStatus.FAILED
     else:
         return TaskStatus.PARTIALLY_COMPLETED
@@ -6,14 +6,51 @@ to ensure consistency and type safety across the application.
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+# ciso8601 is an optional speedup (pip install video-compression-optimizer[fast])
+try:
+    from ciso8601 import parse_datetime as _ciso8601_parse_datetime
+
+    _HAS_CISO8601 = True
+except ImportError:
+    _HAS_CISO8601 = False
+
 __all__ = ["BaseVideoMetadata"]
 
+# datetime.isoformat() output. ciso8601 also accepts basic and partial forms
+# that datetime.fromisoformat rejects, so it only gets strings of this shape
+_CANONICAL_ISOFORMAT = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{6})?(?:[+-]\d{2}:\d{2})?", re.ASCII
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_isoformat(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp.
+
+    Videos from one import batch and files in one task mostly share the
+    same timestamps, so parsed values are memoized by their raw string
+    (datetimes are immutable). Uncached strings in the canonical isoformat()
+    shape are parsed with ciso8601 when it is installed; everything else goes
+    through datetime.fromisoformat, so the accepted inputs do not depend on
+    the optional dependency.
+    """
+    if _HAS_CISO8601 and _CANONICAL_ISOFORMAT.fullmatch(value):
+        return _ciso8601_parse_datetime(value)
+    return datetime.fromisoformat(value)
+
+
+def _optional_datetime(value: str | None) -> datetime | None:
+    """Parse an optional ISO 8601 timestamp, mapping empty values to None."""
+    return _parse_isoformat(value) if value else None
 
-@dataclass
+
+@dataclass(slots=True)
 class BaseVideoMetadata:
     """Base class for all video metadata models.
 
@@ -37,6 +74,10 @@ class BaseVideoMetadata:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format.
 
+        Subclasses repeat these fields in their own to_dict literal (as their
+        from_dict methods do) instead of extending this dict, so a change
+        here must be mirrored there.
+
         Returns:
             Dictionary with all fields explicitly converted
         """
@@ -44,8 +85,8 @@ class BaseVideoMetadata:
             "uuid": self.uuid,
             "filename": self.filename,
             "file_size": self.file_size,
-            "capture_date": self.capture_date.isoformat() if self.capture_date else None,
-            "location": list(self.location) if self.location else None,
+            "capture_date": cd.isoformat() if (cd := self.capture_date) else None,
+            "location": list(loc) if (loc := self.location) else None,
         }
 
     @classmethod
@@ -66,8 +107,6 @@ class BaseVideoMetadata:
             uuid=data["uuid"],
             filename=data["filename"],
             file_size=data["file_size"],
-            capture_date=datetime.fromisoformat(data["capture_date"])
-            if data.get("capture_date")
-            else None,
-            location=tuple(data["location"]) if data.get("location") else None,
+            capture_date=_optional_datetime(data.get("capture_date")),
+            location=(loc[0], loc[1]) if (loc := data.get("location")) else None,
         )
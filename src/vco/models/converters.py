@@ -6,13 +6,89 @@ CLI models and API request/response formats.
 Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
 """
 
-import uuid
-from datetime import datetime
+import os
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from vco.models.async_task import AsyncFile, AsyncTask, FileStatus, TaskStatus
+from vco.models.async_task import (
+    AsyncFile,
+    AsyncTask,
+    FileStatus,
+    _file_status,
+    _optional_datetime,
+    _optional_isoformat,
+    _parse_isoformat,
+    _task_status,
+)
 from vco.models.types import ConversionResult, VideoInfo
+from vco.utils.json_io import dump_json_compact
+
+# API keys of an AsyncFile, in response order, with the attribute each is
+# read from; non-JSON values are converted after the bulk read
+_ASYNC_FILE_API_FIELDS = (
+    ("file_id", "file_id"),
+    ("original_uuid", "uuid"),  # For backward compatibility
+    ("filename", "filename"),
+    ("file_size", "file_size"),  # Include base field
+    ("capture_date", "capture_date"),
+    ("location", "location"),
+    ("source_s3_key", "source_s3_key"),
+    ("output_s3_key", "output_s3_key"),
+    ("metadata_s3_key", "metadata_s3_key"),
+    ("status", "status"),
+    ("mediaconvert_job_id", "mediaconvert_job_id"),
+    ("quality_result", "quality_result"),
+    ("error_code", "error_code"),
+    ("error_message", "error_message"),
+    ("retry_count", "retry_count"),
+    ("preset_attempts", "preset_attempts"),
+    ("source_size_bytes", "source_size_bytes"),
+    ("output_size_bytes", "output_size_bytes"),
+    ("output_checksum", "output_checksum"),
+    ("checksum_algorithm", "checksum_algorithm"),
+    ("downloaded_at", "downloaded_at"),
+    ("download_available", "download_available"),
+)
+_ASYNC_FILE_API_KEYS = tuple(key for key, _ in _ASYNC_FILE_API_FIELDS)
+_ASYNC_FILE_GETTER = attrgetter(*(attr for _, attr in _ASYNC_FILE_API_FIELDS))
+
+# API keys of an AsyncTask, in response order; each is read from the
+# attribute of the same name
+_ASYNC_TASK_API_KEYS = (
+    "task_id",
+    "user_id",
+    "status",
+    "quality_preset",
+    "files",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "completed_at",
+    "execution_arn",
+    "error_message",
+    "progress_percentage",
+    "current_step",
+    "estimated_completion_time",
+    "max_concurrent",
+)
+_ASYNC_TASK_GETTER = attrgetter(*_ASYNC_TASK_API_KEYS)
+
+
+def _uuid4_str() -> str:
+    """Generate a random (version 4) UUID string.
+
+    Equivalent to str(uuid.uuid4()) without constructing and validating a
+    UUID object, which is noticeable when onboarding thousands of files.
+
+    Returns:
+        UUID in canonical 8-4-4-4-12 hex form
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def async_file_to_api(file: AsyncFile) -> dict[str, Any]:
@@ -28,30 +104,12 @@ def async_file_to_api(file: AsyncFile) -> dict[str, Any]:
 
     Requirements: 2.1, 2.3
     """
-    return {
-        "file_id": file.file_id,
-        "original_uuid": file.uuid,  # For backward compatibility
-        "filename": file.filename,
-        "file_size": file.file_size,  # Include base field
-        "capture_date": file.capture_date.isoformat() if file.capture_date else None,
-        "location": list(file.location) if file.location else None,
-        "source_s3_key": file.source_s3_key,
-        "output_s3_key": file.output_s3_key,
-        "metadata_s3_key": file.metadata_s3_key,
-        "status": file.status.value,
-        "mediaconvert_job_id": file.mediaconvert_job_id,
-        "quality_result": file.quality_result,
-        "error_code": file.error_code,
-        "error_message": file.error_message,
-        "retry_count": file.retry_count,
-        "preset_attempts": file.preset_attempts,
-        "source_size_bytes": file.source_size_bytes,
-        "output_size_bytes": file.output_size_bytes,
-        "output_checksum": file.output_checksum,
-        "checksum_algorithm": file.checksum_algorithm,
-        "downloaded_at": file.downloaded_at.isoformat() if file.downloaded_at else None,
-        "download_available": file.download_available,
-    }
+    result = dict(zip(_ASYNC_FILE_API_KEYS, _ASYNC_FILE_GETTER(file)))
+    result["capture_date"] = _optional_isoformat(file.capture_date)
+    result["location"] = list(loc) if (loc := file.location) else None
+    result["status"] = file.status.value
+    result["downloaded_at"] = _optional_isoformat(file.downloaded_at)
+    return result
 
 
 def api_to_async_file(data: dict[str, Any]) -> AsyncFile:
@@ -67,35 +125,38 @@ def api_to_async_file(data: dict[str, Any]) -> AsyncFile:
 
     Requirements: 2.2, 2.4
     """
+    # Bound once: this runs for every file in a task listing
+    get = data.get
+    location = get("location")
+    # The fallback keys are only read when the primary one is missing
+    file_size = get("file_size")
+    if file_size is None:
+        file_size = get("source_size_bytes", 0)
     return AsyncFile(
         # Base fields - use uuid instead of original_uuid
-        uuid=data.get("original_uuid", data.get("uuid", "")),
+        uuid=get("original_uuid") or get("uuid", ""),
         filename=data["filename"],
-        file_size=data.get("file_size", data.get("source_size_bytes", 0)),
-        capture_date=datetime.fromisoformat(data["capture_date"])
-        if data.get("capture_date")
-        else None,
-        location=tuple(data["location"]) if data.get("location") else None,
+        file_size=file_size,
+        capture_date=_optional_datetime(get("capture_date")),
+        location=(location[0], location[1]) if location else None,
         # AsyncFile specific fields
         file_id=data["file_id"],
-        source_s3_key=data.get("source_s3_key", ""),
-        output_s3_key=data.get("output_s3_key"),
-        metadata_s3_key=data.get("metadata_s3_key"),
-        status=FileStatus(data.get("status", "PENDING")),
-        mediaconvert_job_id=data.get("mediaconvert_job_id"),
-        quality_result=data.get("quality_result"),
-        error_code=data.get("error_code"),
-        error_message=data.get("error_message"),
-        retry_count=data.get("retry_count", 0),
-        preset_attempts=data.get("preset_attempts", []),
-        source_size_bytes=data.get("source_size_bytes"),
-        output_size_bytes=data.get("output_size_bytes"),
-        output_checksum=data.get("output_checksum"),
-        checksum_algorithm=data.get("checksum_algorithm", "ETag"),
-        downloaded_at=datetime.fromisoformat(data["downloaded_at"])
-        if data.get("downloaded_at")
-        else None,
-        download_available=data.get("download_available", False),
+        source_s3_key=get("source_s3_key", ""),
+        output_s3_key=get("output_s3_key"),
+        metadata_s3_key=get("metadata_s3_key"),
+        status=_file_status(get("status", "PENDING")),
+        mediaconvert_job_id=get("mediaconvert_job_id"),
+        quality_result=get("quality_result"),
+        error_code=get("error_code"),
+        error_message=get("error_message"),
+        retry_count=get("retry_count", 0),
+        preset_attempts=get("preset_attempts", []),
+        source_size_bytes=get("source_size_bytes"),
+        output_size_bytes=get("output_size_bytes"),
+        output_checksum=get("output_checksum"),
+        checksum_algorithm=get("checksum_algorithm", "ETag"),
+        downloaded_at=_optional_datetime(get("downloaded_at")),
+        download_available=get("download_available", False),
     )
 
 
@@ -112,25 +173,32 @@ def async_task_to_api(task: AsyncTask) -> dict[str, Any]:
 
     Requirements: 2.1, 2.3
     """
-    return {
-        "task_id": task.task_id,
-        "user_id": task.user_id,
-        "status": task.status.value,
-        "quality_preset": task.quality_preset,
-        "files": [async_file_to_api(f) for f in task.files],
-        "created_at": task.created_at.isoformat(),
-        "updated_at": task.updated_at.isoformat(),
-        "started_at": task.started_at.isoformat() if task.started_at else None,
-        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-        "execution_arn": task.execution_arn,
-        "error_message": task.error_message,
-        "progress_percentage": task.progress_percentage,
-        "current_step": task.current_step,
-        "estimated_completion_time": (
-            task.estimated_completion_time.isoformat() if task.estimated_completion_time else None
-        ),
-        "max_concurrent": task.max_concurrent,
-    }
+    # Bound once: called for each of the five timestamps
+    iso = _optional_isoformat
+    result = dict(zip(_ASYNC_TASK_API_KEYS, _ASYNC_TASK_GETTER(task)))
+    result["status"] = task.status.value
+    result["files"] = list(map(async_file_to_api, task.files))
+    result["created_at"] = iso(task.created_at)
+    result["updated_at"] = iso(task.updated_at)
+    result["started_at"] = iso(task.started_at)
+    result["completed_at"] = iso(task.completed_at)
+    result["estimated_completion_time"] = iso(task.estimated_completion_time)
+    return result
+
+
+def async_task_to_json_bytes(task: AsyncTask) -> bytes:
+    """Serialize AsyncTask to compact API-format JSON.
+
+    Uses orjson when it is installed, which encodes the nested file dicts
+    much faster than the json module.
+
+    Args:
+        task: AsyncTask object to serialize
+
+    Returns:
+        UTF-8 JSON of async_task_to_api(task)
+    """
+    return dump_json_compact(async_task_to_api(task))
 
 
 def api_to_async_task(data: dict[str, Any]) -> AsyncTask:
@@ -146,29 +214,24 @@ def api_to_async_task(data: dict[str, Any]) -> AsyncTask:
 
     Requirements: 2.2, 2.4
     """
+    get = data.get
     return AsyncTask(
         task_id=data["task_id"],
         user_id=data["user_id"],
-        status=TaskStatus(data["status"]),
+        status=_task_status(data["status"]),
         quality_preset=data["quality_preset"],
-        files=[api_to_async_file(f) for f in data.get("files", [])],
-        created_at=datetime.fromisoformat(data["created_at"]),
-        updated_at=datetime.fromisoformat(data["updated_at"]),
-        started_at=(datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None),
-        completed_at=(
-            datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None
-        ),
-        execution_arn=data.get("execution_arn"),
-        error_message=data.get("error_message"),
-        ttl=data.get("ttl"),
-        progress_percentage=data.get("progress_percentage", 0),
-        current_step=data.get("current_step"),
-        estimated_completion_time=(
-            datetime.fromisoformat(data["estimated_completion_time"])
-            if data.get("estimated_completion_time")
-            else None
-        ),
-        max_concurrent=data.get("max_concurrent", 5),
+        files=list(map(api_to_async_file, get("files", ()))),
+        created_at=_parse_isoformat(data["created_at"]),
+        updated_at=_parse_isoformat(data["updated_at"]),
+        started_at=_optional_datetime(get("started_at")),
+        completed_at=_optional_datetime(get("completed_at")),
+        execution_arn=get("execution_arn"),
+        error_message=get("error_message"),
+        ttl=get("ttl"),
+        progress_percentage=get("progress_percentage", 0),
+        current_step=get("current_step"),
+        estimated_completion_time=_optional_datetime(get("estimated_completion_time")),
+        max_concurrent=get("max_concurrent", 5),
     )
 
 
@@ -190,7 +253,7 @@ def video_info_to_async_file(video: VideoInfo, file_id: str | None = None) -> As
         AsyncFile object ready for async processing
     """
     if file_id is None:
-        file_id = str(uuid.uuid4())
+        file_id = _uuid4_str()
 
     return AsyncFile(
         # Base fields from VideoInfo
@@ -226,14 +289,13 @@ def async_file_to_conversion_result(async_file: AsyncFile, original_path: Path)
         file_size=async_file.file_size,
         capture_date=async_file.capture_date,
         location=async_file.location,
-        # ConversionResult specific fields
-        success=async_file.status == FileStatus.COMPLETED,
+        # ConversionResult specific fields; converted_path (set after
+        # download), quality_result and best_effort (derived from
+        # async_file.quality_result) keep their defaults here
+        success=async_file.status is FileStatus.COMPLETED,
         original_path=original_path,
-        converted_path=None,  # Will be set after download
-        quality_result=None,  # Will be populated from async_file.quality_result
         error_message=async_file.error_message,
         mediaconvert_job_id=async_file.mediaconvert_job_id,
-        best_effort=False,  # Will be determined from quality_result
     )
 
 
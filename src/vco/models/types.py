@@ -1,12 +1,28 @@
 """Core data models for Video Compression Optimizer."""
 
-from dataclasses import dataclass, field
+import functools
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from vco.models.base import BaseVideoMetadata
+from vco.models.base import BaseVideoMetadata, _optional_datetime, _parse_isoformat
+
+
+@functools.cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a dataclass, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _fields_dict(obj: Any) -> dict[str, Any]:
+    """Map a dataclass instance's field names to its values (shallow).
+
+    Stands in for __dict__, which slotted dataclasses do not have.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
 
 
 class VideoStatus(Enum):
@@ -23,6 +39,11 @@ class VideoStatus(Enum):
     ERROR = "error"
 
 
+# VideoStatus members by value; a dict lookup is much cheaper than
+# Enum.__call__ when loading scan results with thousands of candidates
+_VIDEO_STATUS_BY_VALUE = {member.value: member for member in VideoStatus}
+
+
 class QualityPresetName(Enum):
     """Quality preset names for conversion."""
 
@@ -31,7 +52,7 @@ class QualityPresetName(Enum):
     COMPRESSION = "compression"
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo(BaseVideoMetadata):
     """Video file information from Apple Photos library.
 
@@ -65,50 +86,51 @@ class VideoInfo(BaseVideoMetadata):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format including base fields."""
-        base_dict = super().to_dict()
-        base_dict.update(
-            {
-                "path": str(self.path),
-                "codec": self.codec,
-                "resolution": list(self.resolution),
-                "bitrate": self.bitrate,
-                "duration": self.duration,
-                "frame_rate": self.frame_rate,
-                "creation_date": self.creation_date.isoformat(),
-                "albums": self.albums,
-                "is_in_icloud": self.is_in_icloud,
-                "is_local": self.is_local,
-            }
-        )
-        return base_dict
+        return {
+            "uuid": self.uuid,
+            "filename": self.filename,
+            "file_size": self.file_size,
+            "capture_date": cd.isoformat() if (cd := self.capture_date) else None,
+            "location": list(loc) if (loc := self.location) else None,
+            "path": str(self.path),
+            "codec": self.codec,
+            "resolution": list(self.resolution),
+            "bitrate": self.bitrate,
+            "duration": self.duration,
+            "frame_rate": self.frame_rate,
+            "creation_date": self.creation_date.isoformat(),
+            "albums": self.albums,
+            "is_in_icloud": self.is_in_icloud,
+            "is_local": self.is_local,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "VideoInfo":
         """Create instance from dictionary."""
+        get = data.get
+        resolution = data["resolution"]
         return cls(
             # Base fields
             uuid=data["uuid"],
             filename=data["filename"],
             file_size=data["file_size"],
-            capture_date=datetime.fromisoformat(data["capture_date"])
-            if data.get("capture_date")
-            else None,
-            location=tuple(data["location"]) if data.get("location") else None,
+            capture_date=_optional_datetime(get("capture_date")),
+            location=(loc[0], loc[1]) if (loc := get("location")) else None,
             # VideoInfo specific fields
             path=Path(data["path"]),
             codec=data["codec"],
-            resolution=tuple(data["resolution"]),
+            resolution=(resolution[0], resolution[1]),
             bitrate=data["bitrate"],
             duration=data["duration"],
             frame_rate=data["frame_rate"],
-            creation_date=datetime.fromisoformat(data["creation_date"]),
-            albums=data.get("albums", []),
-            is_in_icloud=data.get("is_in_icloud", False),
-            is_local=data.get("is_local", True),
+            creation_date=_parse_isoformat(data["creation_date"]),
+            albums=get("albums", []),
+            is_in_icloud=get("is_in_icloud", False),
+            is_local=get("is_local", True),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionCandidate:
     """A video identified as a candidate for conversion.
 
@@ -127,7 +149,7 @@ class ConversionCandidate:
     status: VideoStatus = VideoStatus.PENDING
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityResult:
     """Result of quality verification after conversion.
 
@@ -157,8 +179,8 @@ class QualityResult:
     rejection_reason: str | None = None
     converted_metadata: dict | None = None
 
-    @classmethod
-    def calculate_compression_ratio(cls, original_size: int, converted_size: int) -> float:
+    @staticmethod
+    def calculate_compression_ratio(original_size: int, converted_size: int) -> float:
         """Calculate compression ratio.
 
         Args:
@@ -172,8 +194,8 @@ class QualityResult:
             return 0.0
         return original_size / converted_size
 
-    @classmethod
-    def calculate_space_saved_percent(cls, original_size: int, converted_size: int) -> float:
+    @staticmethod
+    def calculate_space_saved_percent(original_size: int, converted_size: int) -> float:
         """Calculate space saved as percentage.
 
         Args:
@@ -187,8 +209,47 @@ class QualityResult:
             return 0.0
         return (original_size - converted_size) / original_size * 100
 
+    @staticmethod
+    def calculate_compression_ratios(
+        original_sizes: Sequence[int], converted_sizes: Sequence[int]
+    ) -> list[float]:
+        """Calculate compression ratios for many files in one call.
 
-@dataclass
+        Same formula as calculate_compression_ratio, evaluated in a single
+        comprehension instead of one method call per file.
+
+        Args:
+            original_sizes: Original file sizes in bytes
+            converted_sizes: Converted file sizes in bytes (same length)
+
+        Returns:
+            Compression ratio for each pair, in input order
+        """
+        return [
+            original / converted if converted > 0 else 0.0
+            for original, converted in zip(original_sizes, converted_sizes, strict=True)
+        ]
+
+    @staticmethod
+    def calculate_space_saved_percents(
+        original_sizes: Sequence[int], converted_sizes: Sequence[int]
+    ) -> list[float]:
+        """Calculate space saved percentages for many files in one call.
+
+        Args:
+            original_sizes: Original file sizes in bytes
+            converted_sizes: Converted file sizes in bytes (same length)
+
+        Returns:
+            Space saved percentage for each pair, in input order
+        """
+        return [
+            (original - converted) / original * 100 if original > 0 else 0.0
+            for original, converted in zip(original_sizes, converted_sizes, strict=True)
+        ]
+
+
+@dataclass(slots=True)
 class VideoMetadata:
     """Metadata extracted from a video file.
 
@@ -211,16 +272,16 @@ class VideoMetadata:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            "capture_date": self.capture_date.isoformat() if self.capture_date else None,
+            "capture_date": cd.isoformat() if (cd := self.capture_date) else None,
             "creation_date": self.creation_date.isoformat() if self.creation_date else None,
             "albums": self.albums,
             "title": self.title,
             "description": self.description,
-            "location": list(self.location) if self.location else None,
+            "location": list(loc) if (loc := self.location) else None,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionJob:
     """Information about a MediaConvert conversion job.
 
@@ -245,7 +306,7 @@ class ConversionJob:
     estimated_cost: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewItem:
     """An item in the review queue awaiting user approval.
 
@@ -270,7 +331,7 @@ class ReviewItem:
     status: str = "pending_review"  # pending_review, approved, rejected
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Result of importing a single video to Photos.
 
@@ -291,7 +352,7 @@ class ImportResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchImportResult:
     """Result of batch importing multiple videos.
 
@@ -313,7 +374,7 @@ class BatchImportResult:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportableItem:
     """Unified representation of importable items from local and AWS sources.
 
@@ -364,7 +425,7 @@ class ImportableItem:
         return self.item_id
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedListResult:
     """Result of listing all importable items from local and AWS sources.
 
@@ -391,7 +452,7 @@ class UnifiedListResult:
         return self.local_items + self.aws_items
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedImportResult:
     """Result of importing a single item from local or AWS source.
 
@@ -424,7 +485,7 @@ class UnifiedImportResult:
     s3_deleted: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedBatchResult:
     """Result of batch importing items from local and AWS sources.
 
@@ -462,7 +523,7 @@ class UnifiedBatchResult:
         return self.local_failed + self.aws_failed
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedRemoveResult:
     """Result of removing an item from local or AWS source.
 
@@ -485,7 +546,7 @@ class UnifiedRemoveResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClearResult:
     """Result of clearing the local queue.
 
@@ -504,7 +565,7 @@ class ClearResult:
     error_details: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedClearResult:
     """Result of clearing both local and AWS queues.
 
@@ -549,7 +610,7 @@ class UnifiedClearResult:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionProgress:
     """Progress information for a conversion.
 
@@ -572,7 +633,7 @@ class ConversionProgress:
     quality_job_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AttemptResult:
     """Result of a single preset attempt in adaptive conversion.
 
@@ -600,7 +661,7 @@ class AttemptResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult(BaseVideoMetadata):
     """Result of a single video conversion.
 
@@ -622,7 +683,7 @@ class ConversionResult(BaseVideoMetadata):
 
     # ConversionResult specific fields (all with defaults to avoid dataclass issues)
     success: bool = False
-    original_path: Path = field(default_factory=Path)
+    original_path: Path = Path()
     converted_path: Path | None = None
     quality_result: QualityResult | None = None
     metadata: VideoMetadata | None = None
@@ -634,25 +695,26 @@ class ConversionResult(BaseVideoMetadata):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format including base fields."""
-        base_dict = super().to_dict()
-        base_dict.update(
-            {
-                "success": self.success,
-                "original_path": str(self.original_path),
-                "converted_path": str(self.converted_path) if self.converted_path else None,
-                "quality_result": self.quality_result.__dict__ if self.quality_result else None,
-                "metadata": self.metadata.__dict__ if self.metadata else None,
-                "error_message": self.error_message,
-                "mediaconvert_job_id": self.mediaconvert_job_id,
-                "quality_job_id": self.quality_job_id,
-                "best_effort": self.best_effort,
-                "selected_preset": self.selected_preset,
-            }
-        )
-        return base_dict
+        return {
+            "uuid": self.uuid,
+            "filename": self.filename,
+            "file_size": self.file_size,
+            "capture_date": cd.isoformat() if (cd := self.capture_date) else None,
+            "location": list(loc) if (loc := self.location) else None,
+            "success": self.success,
+            "original_path": str(self.original_path),
+            "converted_path": str(self.converted_path) if self.converted_path else None,
+            "quality_result": _fields_dict(self.quality_result) if self.quality_result else None,
+            "metadata": _fields_dict(self.metadata) if self.metadata else None,
+            "error_message": self.error_message,
+            "mediaconvert_job_id": self.mediaconvert_job_id,
+            "quality_job_id": self.quality_job_id,
+            "best_effort": self.best_effort,
+            "selected_preset": self.selected_preset,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchConversionResult:
     """Result of batch conversion.
 
@@ -679,10 +741,6 @@ class BatchConversionResult:
             "successful": self.successful,
             "failed": self.failed,
             "added_to_queue": self.added_to_queue,
-            "results": [self._result_to_dict(r) for r in self.results],
+            "results": list(map(ConversionResult.to_dict, self.results)),
             "errors": self.errors,
         }
-
-    def _result_to_dict(self, result: ConversionResult) -> dict:
-        """Convert a result to dictionary."""
-        return result.to_dict()
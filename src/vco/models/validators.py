@@ -27,11 +27,12 @@ def validate_base_metadata(metadata: BaseVideoMetadata) -> None:
     if metadata.file_size <= 0:
         raise ValueError("file_size must be positive")
 
-    if metadata.location is not None:
-        if len(metadata.location) != 2:
+    location = metadata.location
+    if location is not None:
+        if len(location) != 2:
             raise ValueError("location must be (latitude, longitude)")
 
-        lat, lon = metadata.location
+        lat, lon = location
         if not (-90 <= lat <= 90):
             raise ValueError("latitude must be between -90 and 90")
         if not (-180 <= lon <= 180):
@@ -4,12 +4,24 @@ This module provides access to Apple Photos library using osxphotos for reading
 and photoscript for writing operations.
 """
 
+import functools
 import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from vco.models.types import VideoInfo
 
+# Concurrent ffprobe processes when detecting codecs left unknown by a scan
+MAX_CODEC_PROBE_WORKERS = 8
+
+# Threads extracting video info during a library scan; each extraction is
+# mostly waiting on file stats and metadata reads
+MAX_SCAN_WORKERS = 8
+
 
 class PhotosAccessError(Exception):
     """Exception raised for Photos library access errors."""
@@ -27,14 +39,25 @@ class PhotosAccessManager:
     # Video file extensions supported by Photos
     VIDEO_EXTENSIONS = {".mov", ".mp4", ".m4v", ".avi", ".mkv", ".wmv", ".mpg", ".mpeg"}
 
-    def __init__(self, library_path: Path | None = None):
+    def __init__(self, library_path: Path | None = None, exif_bruteforce: bool = False):
         """Initialize PhotosAccessManager.
 
         Args:
             library_path: Path to Photos library (None for default system library)
+            exif_bruteforce: Run ffprobe on local files whose codec is missing from
+                both exif_info and exiftool. Off by default: probing is by far the
+                slowest per-video step, and videos left as "unknown" are still
+                treated as conversion candidates by the analyzer.
         """
         self._library_path = library_path
         self._photosdb = None
+        self._exif_bruteforce = exif_bruteforce
+        self._photos_app = None
+        # Album name -> photoscript Album, loaded on first album lookup
+        self._album_cache: dict[str, Any] | None = None
+        # photo.exiftool talks to a single stay-open exiftool process shared by
+        # all PhotoInfo objects, so scan threads must not read it concurrently
+        self._exiftool_lock = threading.Lock()
 
     @property
     def photosdb(self):
@@ -55,18 +78,23 @@ class PhotosAccessManager:
                 raise PhotosAccessError(f"Failed to open Photos library: {e}")
         return self._photosdb
 
-    def _extract_codec(self, photo) -> str:
+    def _extract_codec(self, photo, use_ffprobe: bool = True, exif: dict | None = None) -> str:
         """Extract video codec from photo object.
 
         Args:
             photo: osxphotos PhotoInfo object
+            use_ffprobe: Fall back to ffprobe when exiftool has no codec (only
+                when the manager was created with exif_bruteforce=True)
+            exif: exiftool data already read for the photo (read from
+                photo.exiftool when None)
 
         Returns:
             Codec name (lowercase)
         """
         # Try to get codec from exiftool data
         try:
-            exif = photo.exiftool
+            if exif is None:
+                exif = self._read_exiftool(photo)
             if exif:
                 # Check various codec fields
                 codec = (
@@ -81,13 +109,25 @@ class PhotosAccessManager:
             pass
 
         # Fallback: try to detect from file using ffprobe
-        if photo.path:
+        if use_ffprobe and self._exif_bruteforce and photo.path:
             codec = self._get_codec_from_ffprobe(Path(photo.path))
             if codec:
                 return codec
 
         return "unknown"
 
+    def _read_exiftool(self, photo) -> dict | None:
+        """Read exiftool metadata for a photo, one photo at a time.
+
+        Args:
+            photo: osxphotos PhotoInfo object
+
+        Returns:
+            exiftool data, or None if unavailable
+        """
+        with self._exiftool_lock:
+            return photo.exiftool
+
     def _get_codec_from_ffprobe(self, video_path: Path) -> str | None:
         """Get video codec using ffprobe.
 
@@ -121,11 +161,32 @@ class PhotosAccessManager:
             pass
         return None
 
-    def _extract_video_info(self, photo) -> VideoInfo | None:
+    def _batch_get_codecs(self, paths: list[Path]) -> dict[Path, str]:
+        """Get video codecs for many files using concurrent ffprobe runs.
+
+        ffprobe reads one input per process, so the probes are overlapped
+        rather than merged into a single invocation.
+
+        Args:
+            paths: Paths to video files
+
+        Returns:
+            Codec name by path, for the files whose codec was detected
+        """
+        if not paths:
+            return {}
+        workers = min(MAX_CODEC_PROBE_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            codecs = executor.map(self._get_codec_from_ffprobe, paths)
+            return {path: codec for path, codec in zip(paths, codecs) if codec}
+
+    def _extract_video_info(self, photo, probe_codec: bool = True) -> VideoInfo | None:
         """Extract VideoInfo from osxphotos PhotoInfo object.
 
         Args:
             photo: osxphotos PhotoInfo object
+            probe_codec: Run ffprobe when metadata has no codec. Library scans
+                pass False and probe the remaining files in one batch.
 
         Returns:
             VideoInfo object or None if extraction failed
@@ -135,51 +196,33 @@ class PhotosAccessManager:
             path = Path(photo.path) if photo.path else None
             is_local = path is not None and path.exists()
 
+            # photo.exif_info and photo.exiftool re-read metadata on each
+            # access, so each is read at most once per video
+            try:
+                exif_info = photo.exif_info
+            except Exception:
+                exif_info = None
+
             # Get codec from exif_info first, then try exiftool/ffprobe
             codec = "unknown"
             try:
-                exif_info = photo.exif_info
                 if exif_info and exif_info.codec:
                     codec = exif_info.codec.lower()
             except Exception:
                 pass
 
-            # If codec still unknown and file is local, try other methods
-            if codec == "unknown" and is_local:
-                codec = self._extract_codec(photo)
-
-            # Get resolution
-            width = photo.width or 0
-            height = photo.height or 0
-
             # Get duration from exif_info (in seconds)
             duration = 0.0
             try:
-                exif_info = photo.exif_info
                 if exif_info and exif_info.duration:
                     duration = exif_info.duration
             except Exception:
                 pass
 
-            # Get file size - from local file or estimate from photo metadata
-            if is_local and path:
-                file_size = path.stat().st_size
-            else:
-                # For iCloud files, try to get size from photo metadata
-                file_size = getattr(photo, "original_filesize", 0) or 0
-
-            # Get dates
-            capture_date = photo.date
-            creation_date = photo.date_added or datetime.now()
-
-            # Get albums (osxphotos returns album names as strings directly)
-            albums = list(photo.albums) if photo.albums else []
-
             # Get bitrate and frame rate from exif_info first
             bitrate = 0
             frame_rate = 0.0
             try:
-                exif_info = photo.exif_info
                 if exif_info:
                     if exif_info.bit_rate:
                         bitrate = int(exif_info.bit_rate)
@@ -188,18 +231,46 @@ class PhotosAccessManager:
             except Exception:
                 pass
 
+            # Read exiftool once for whatever exif_info did not provide
+            exif = None
+            if is_local and (codec == "unknown" or bitrate == 0 or frame_rate == 0.0):
+                try:
+                    exif = self._read_exiftool(photo)
+                except Exception:
+                    pass
+
+            # If codec still unknown and file is local, try other methods
+            if codec == "unknown" and is_local:
+                codec = self._extract_codec(photo, use_ffprobe=probe_codec, exif=exif or {})
+
             # Fallback to exiftool if available and local
-            if is_local and (bitrate == 0 or frame_rate == 0.0):
+            if exif and (bitrate == 0 or frame_rate == 0.0):
                 try:
-                    exif = photo.exiftool
-                    if exif:
-                        if bitrate == 0:
-                            bitrate = int(exif.get("AvgBitrate", 0) or 0)
-                        if frame_rate == 0.0:
-                            frame_rate = float(exif.get("VideoFrameRate", 0) or 0)
+                    if bitrate == 0:
+                        bitrate = int(exif.get("AvgBitrate", 0) or 0)
+                    if frame_rate == 0.0:
+                        frame_rate = float(exif.get("VideoFrameRate", 0) or 0)
                 except Exception:
                     pass
 
+            # Get resolution
+            width = photo.width or 0
+            height = photo.height or 0
+
+            # Get file size - from local file or estimate from photo metadata
+            if is_local and path:
+                file_size = path.stat().st_size
+            else:
+                # For iCloud files, try to get size from photo metadata
+                file_size = getattr(photo, "original_filesize", 0) or 0
+
+            # Get dates
+            capture_date = photo.date
+            creation_date = photo.date_added or datetime.now()
+
+            # Get albums (osxphotos returns album names as strings directly)
+            albums = list(photo.albums) if photo.albums else []
+
             # Check iCloud status
             is_in_icloud = photo.iscloudasset
 
@@ -233,19 +304,32 @@ class PhotosAccessManager:
             print(f"Warning: Failed to extract info for {photo.uuid}: {e}")
             return None
 
-    def get_all_videos(self) -> list[VideoInfo]:
+    def get_all_videos(self, photo_filter: Callable[[Any], bool] | None = None) -> list[VideoInfo]:
         """Get all videos from Photos library.
 
+        Args:
+            photo_filter: Optional predicate on osxphotos PhotoInfo objects;
+                videos it rejects are skipped before any metadata is extracted
+
         Returns:
             List of VideoInfo objects for all videos
         """
-        videos = []
-
         # Get all photos that are videos
-        for photo in self.photosdb.photos(movies=True, images=False):
-            video_info = self._extract_video_info(photo)
-            if video_info:
-                videos.append(video_info)
+        photos = self.photosdb.photos(movies=True, images=False)
+        if photo_filter is not None:
+            photos = [photo for photo in photos if photo_filter(photo)]
+        extract = functools.partial(self._extract_video_info, probe_codec=False)
+        with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+            videos = [video for video in executor.map(extract, photos) if video]
+
+        if not self._exif_bruteforce:
+            return videos
+
+        # Probe the local files whose metadata had no codec together
+        unknown = [v for v in videos if v.codec == "unknown" and v.is_local]
+        codecs = self._batch_get_codecs([v.path for v in unknown])
+        for video in unknown:
+            video.codec = codecs.get(video.path, "unknown")
 
         return videos
 
@@ -265,39 +349,37 @@ class PhotosAccessManager:
         Returns:
             List of VideoInfo objects within the date range
         """
-        all_videos = self.get_all_videos()
-
         if from_date is None and to_date is None:
-            return all_videos
-
-        filtered = []
-        for video in all_videos:
-            # Select date based on type
-            if date_type == "capture":
-                video_date = video.capture_date
-            else:
-                video_date = video.creation_date
+            return self.get_all_videos()
 
+        def in_range(video_date: datetime | None) -> bool:
             # Skip if no date available
             if video_date is None:
-                continue
+                return False
 
             # Normalize timezone for comparison
             # If video_date has timezone but filter dates don't, remove timezone
             if video_date.tzinfo is not None:
-                video_date_naive = video_date.replace(tzinfo=None)
-            else:
-                video_date_naive = video_date
+                video_date = video_date.replace(tzinfo=None)
 
             # Apply filters using naive datetime
-            if from_date and video_date_naive < from_date:
-                continue
-            if to_date and video_date_naive > to_date:
-                continue
+            if from_date and video_date < from_date:
+                return False
+            if to_date and video_date > to_date:
+                return False
+            return True
 
-            filtered.append(video)
+        # Select date based on type. Filtering on the library dates first
+        # (the sources of capture_date/creation_date in _extract_video_info)
+        # means videos outside the range are never extracted.
+        if date_type == "capture":
+            videos = self.get_all_videos(photo_filter=lambda photo: in_range(photo.date))
+            return [video for video in videos if in_range(video.capture_date)]
 
-        return filtered
+        videos = self.get_all_videos(
+            photo_filter=lambda photo: in_range(photo.date_added or datetime.now())
+        )
+        return [video for video in videos if in_range(video.creation_date)]
 
     def get_photos_app_link(self, video: VideoInfo) -> str:
         """Generate a Photos app link to open the video directly.
@@ -413,9 +495,7 @@ class PhotosAccessManager:
             raise PhotosAccessError(f"Video file not found: {video_path}")
 
         try:
-            import photoscript
-
-            photos_app = photoscript.PhotosLibrary()
+            photos_app = self._get_photos_app()
 
             # Import the video
             imported = photos_app.import_photos([str(video_path)])
@@ -454,50 +534,93 @@ class PhotosAccessManager:
             Uses AppleScript with the UUID directly (media item id).
             The osxphotos UUID format works with AppleScript's media item id.
         """
-        try:
-            import subprocess
+        error = self._delete_media_items([uuid])[uuid]
+        if error:
+            raise PhotosAccessError(f"AppleScript error: {error}")
+        return True
+
+    def delete_videos(self, uuids: list[str]) -> dict[str, bool]:
+        """Move several videos to Photos trash with a single osascript run.
+
+        Args:
+            uuids: UUIDs of the videos to delete (osxphotos format)
+
+        Returns:
+            Mapping of UUID to True if the video was deleted (or was already
+            gone), False if Photos reported an error for it
+
+        Raises:
+            PhotosAccessError: If the AppleScript run itself fails
+        """
+        if not uuids:
+            return {}
+        errors = self._delete_media_items(uuids)
+        return {uuid: error is None for uuid, error in errors.items()}
+
+    def _delete_media_items(self, uuids: list[str]) -> dict[str, str | None]:
+        """Delete media items by UUID in one AppleScript.
+
+        Spawning osascript dominates the cost of a single delete, so every
+        UUID is handled inside one "tell application" block and each item
+        reports its own result line.
 
+        Args:
+            uuids: UUIDs of the videos to delete (osxphotos format)
+
+        Returns:
+            Mapping of UUID to the AppleScript error line, or None on success
+
+        Raises:
+            PhotosAccessError: If osascript fails or times out
+        """
+        try:
             # Use AppleScript to delete by UUID (safest method)
             # The osxphotos UUID works directly with AppleScript's media item id
-            script = f'''
+            item_ids = ", ".join(f'"{uuid}"' for uuid in uuids)
+            script = f"""
             tell application "Photos"
-                try
-                    set theItem to media item id "{uuid}"
-                    delete theItem
-                    return "deleted"
-                on error errMsg
-                    return "error: " & errMsg
-                end try
+                set results to {{}}
+                repeat with itemId in {{{item_ids}}}
+                    try
+                        set theItem to media item id (contents of itemId)
+                        delete theItem
+                        set end of results to "deleted"
+                    on error errMsg
+                        set end of results to "error: " & errMsg
+                    end try
+                end repeat
+                set AppleScript's text item delimiters to linefeed
+                return results as text
             end tell
-            '''
+            """
 
             result = subprocess.run(
-                ["osascript", "-e", script], capture_output=True, text=True, timeout=30
+                ["osascript", "-e", script],
+                capture_output=True,
+                text=True,
+                timeout=30 + 2 * len(uuids),
             )
-
-            if result.returncode != 0:
-                raise PhotosAccessError(f"AppleScript error: {result.stderr}")
-
-            output = result.stdout.strip()
-
-            if output == "deleted":
-                return True
-            elif "error:" in output:
-                # Check if already deleted (not found)
-                if "取り出すことはできません" in output or "can't get" in output.lower():
-                    # Video already deleted or not found - treat as success
-                    return True
-                raise PhotosAccessError(f"AppleScript error: {output}")
-
-            return True
-
         except subprocess.TimeoutExpired:
             raise PhotosAccessError("Timeout while deleting video")
-        except PhotosAccessError:
-            raise
         except Exception as e:
             raise PhotosAccessError(f"Failed to delete video: {e}")
 
+        if result.returncode != 0:
+            raise PhotosAccessError(f"AppleScript error: {result.stderr}")
+
+        # One line per UUID, in order; a UUID without a line has no result
+        errors: dict[str, str | None] = dict.fromkeys(uuids, "error: no result from AppleScript")
+        for uuid, line in zip(uuids, result.stdout.strip().splitlines()):
+            line = line.strip()
+            if line == "deleted":
+                errors[uuid] = None
+            elif "取り出すことはできません" in line or "can't get" in line.lower():
+                # Video already deleted or not found - treat as success
+                errors[uuid] = None
+            else:
+                errors[uuid] = line
+        return errors
+
     def add_to_albums(self, uuid: str, album_names: list[str]) -> bool:
         """Add a video to multiple albums.
 
@@ -515,9 +638,7 @@ class PhotosAccessManager:
             return True
 
         try:
-            import photoscript
-
-            photos_app = photoscript.PhotosLibrary()
+            photos_app = self._get_photos_app()
 
             # Find the photo by UUID
             photos = list(photos_app.photos(uuid=[uuid]))
@@ -539,6 +660,26 @@ class PhotosAccessManager:
         except Exception as e:
             raise PhotosAccessError(f"Failed to add video to albums: {e}")
 
+    def _get_photos_app(self):
+        """Lazy-load the photoscript PhotosLibrary.
+
+        Raises:
+            ImportError: If photoscript is not installed
+        """
+        if self._photos_app is None:
+            import photoscript
+
+            self._photos_app = photoscript.PhotosLibrary()
+        return self._photos_app
+
+    def refresh_album_cache(self) -> None:
+        """Forget cached albums so the next lookup reloads them from Photos.
+
+        Call this after albums are created, renamed or deleted outside this
+        manager.
+        """
+        self._album_cache = None
+
     def _add_to_album_by_name(self, photo, album_name: str) -> None:
         """Add a photo to an album by name, creating the album if needed.
 
@@ -546,20 +687,19 @@ class PhotosAccessManager:
             photo: photoscript Photo object
             album_name: Name of the album
         """
-        import photoscript
-
-        photos_app = photoscript.PhotosLibrary()
+        photos_app = self._get_photos_app()
 
-        # Try to find existing album by iterating all albums
-        album = None
-        for a in photos_app.albums():
-            if a.name == album_name:
-                album = a
-                break
+        # Build the name lookup once; the first album wins on duplicate names
+        if self._album_cache is None:
+            self._album_cache = {}
+            for a in photos_app.albums():
+                self._album_cache.setdefault(a.name, a)
 
+        album = self._album_cache.get(album_name)
         if album is None:
             # Create new album
             album = photos_app.create_album(album_name)
+            self._album_cache[album_name] = album
 
         # Add photo to album
         album.add([photo])
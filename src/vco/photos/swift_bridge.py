@@ -163,19 +163,21 @@ class SwiftBridge:
 
         # Parse location
         location = None
-        if data.get("location") and len(data["location"]) == 2:
-            location = tuple(data["location"])
+        if (loc := data.get("location")) and len(loc) == 2:
+            location = (loc[0], loc[1])
 
         # Parse resolution
         resolution = (0, 0)
-        if data.get("resolution") and len(data["resolution"]) == 2:
-            resolution = tuple(data["resolution"])
+        if (res := data.get("resolution")) and len(res) == 2:
+            resolution = (res[0], res[1])
 
+        # codec and album names repeat across the whole library; interning
+        # keeps one copy of each instead of one per decoded video
         return VideoInfo(
             uuid=data.get("uuid", ""),
             filename=data.get("filename", ""),
             path=Path(data.get("path", "")) if data.get("path") else Path("/unknown"),
-            codec=data.get("codec", "unknown"),
+            codec=sys.intern(data.get("codec", "unknown")),
             resolution=resolution,
             bitrate=data.get("bitrate", 0),
             duration=data.get("duration", 0.0),
@@ -183,7 +185,7 @@ class SwiftBridge:
             file_size=data.get("file_size", 0),
             capture_date=capture_date,
             creation_date=creation_date,
-            albums=data.get("albums", []),
+            albums=[sys.intern(album) for album in data.get("albums", ())],
             is_in_icloud=data.get("is_in_icloud", False),
             is_local=data.get("is_local", True),
             location=location,
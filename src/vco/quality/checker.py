@@ -14,7 +14,7 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityResult:
     """Quality check result from Lambda function."""
 
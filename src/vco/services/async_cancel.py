@@ -14,6 +14,8 @@ from typing import Any
 
 import boto3
 
+from vco.utils.retry import with_backoff
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,8 @@ class CancelCommand:
         api_url: str,
         region: str = "ap-northeast-1",
         profile_name: str | None = None,
+        session: boto3.Session | None = None,
+        http_session: Any | None = None,
     ):
         """Initialize CancelCommand.
 
@@ -50,13 +54,16 @@ class CancelCommand:
             api_url: API Gateway URL for async workflow
             region: AWS region
             profile_name: AWS profile name (optional)
+            session: Shared boto3 session to reuse (optional)
+            http_session: Shared requests session for API calls (optional)
         """
         self.api_url = api_url.rstrip("/")
         self.region = region
         self.profile_name = profile_name
 
         # Initialize AWS session for signing
-        self.session = boto3.Session(profile_name=profile_name, region_name=region)
+        self.session = session or boto3.Session(profile_name=profile_name, region_name=region)
+        self.http_session = http_session
 
     def cancel(self, task_id: str, user_id: str | None = None) -> CancelResult:
         """Cancel a running task.
@@ -147,16 +154,24 @@ class CancelCommand:
         if user_id:
             headers["X-User-Id"] = user_id
 
-        response = requests.request(
-            method=method,
-            url=url,
-            params=params,
-            json=body if body else None,
-            auth=auth,
-            headers=headers,
-            timeout=30,
-        )
-        response.raise_for_status()
+        http = self.http_session or requests
+
+        def send() -> Any:
+            response = http.request(
+                method=method,
+                url=url,
+                params=params,
+                json=body if body else None,
+                auth=auth,
+                headers=headers,
+                timeout=30,
+            )
+            response.raise_for_status()
+            return response
+
+        # Cancel is not safe to repeat once the server may have processed it,
+        # so only throttling and connection failures are retried
+        response = with_backoff(send, idempotent=False)
 
         result: dict[str, Any] = response.json()
         return result
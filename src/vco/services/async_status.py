@@ -15,10 +15,12 @@ from typing import Any
 
 import boto3
 
+from vco.utils.retry import with_backoff
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSummary:
     """Summary of a task for list display."""
 
@@ -32,7 +34,7 @@ class TaskSummary:
     quality_preset: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDetail:
     """Detail of a file in a task."""
 
@@ -50,7 +52,7 @@ class FileDetail:
     space_saved_percent: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDetail:
     """Detailed task information."""
 
@@ -82,6 +84,8 @@ class StatusCommand:
         api_url: str,
         region: str = "ap-northeast-1",
         profile_name: str | None = None,
+        session: boto3.Session | None = None,
+        http_session: Any | None = None,
     ):
         """Initialize StatusCommand.
 
@@ -89,13 +93,16 @@ class StatusCommand:
             api_url: API Gateway URL for async workflow
             region: AWS region
             profile_name: AWS profile name (optional)
+            session: Shared boto3 session to reuse (optional)
+            http_session: Shared requests session for API calls (optional)
         """
         self.api_url = api_url.rstrip("/")
         self.region = region
         self.profile_name = profile_name
 
         # Initialize AWS session for signing
-        self.session = boto3.Session(profile_name=profile_name, region_name=region)
+        self.session = session or boto3.Session(profile_name=profile_name, region_name=region)
+        self.http_session = http_session
 
     def list_tasks(
         self,
@@ -286,16 +293,22 @@ class StatusCommand:
         if user_id:
             headers["X-User-Id"] = user_id
 
-        response = requests.request(
-            method=method,
-            url=url,
-            params=params if params else None,
-            json=body,
-            auth=auth,
-            headers=headers,
-            timeout=30,
-        )
-        response.raise_for_status()
+        http = self.http_session or requests
+
+        def send() -> Any:
+            response = http.request(
+                method=method,
+                url=url,
+                params=params if params else None,
+                json=body,
+                auth=auth,
+                headers=headers,
+                timeout=30,
+            )
+            response.raise_for_status()
+            return response
+
+        response = with_backoff(send)
 
         result: dict[str, Any] = response.json()
         return result
@@ -71,6 +71,8 @@ class AwsImportService:
         profile_name: str | None = None,
         progress_store: DownloadProgressStore | None = None,
         output_dir: Path | None = None,
+        session: boto3.Session | None = None,
+        http_session: Any | None = None,
     ):
         """Initialize AwsImportService.
 
@@ -81,6 +83,8 @@ class AwsImportService:
             profile_name: AWS profile name (optional)
             progress_store: Store for download progress
             output_dir: Output directory for downloads
+            session: Shared boto3 session to reuse (optional)
+            http_session: Shared requests session for API calls (optional)
         """
         self.api_url = api_url.rstrip("/")
         self.s3_bucket = s3_bucket
@@ -95,16 +99,19 @@ class AwsImportService:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize AWS clients
-        session = boto3.Session(profile_name=profile_name, region_name=region)
+        session = session or boto3.Session(profile_name=profile_name, region_name=region)
         config = Config(retries={"max_attempts": 3, "mode": "adaptive"})
         self.s3_client = session.client("s3", config=config)
         self.session = session
+        self.http_session = http_session
 
         # Initialize status command for listing
         self.status_command = StatusCommand(
             api_url=api_url,
             region=region,
             profile_name=profile_name,
+            session=session,
+            http_session=http_session,
         )
 
     def list_completed_files(self, user_id: str | None = None) -> list[ImportableItem]:
@@ -524,14 +531,11 @@ class AwsImportService:
             )
 
         try:
-            import boto3
             import requests  # type: ignore[import-untyped]
             from botocore.auth import SigV4Auth
             from botocore.awsrequest import AWSRequest
 
-            # Create AWS session
-            session = boto3.Session(profile_name=self.profile_name, region_name=self.region)
-            credentials = session.get_credentials()
+            credentials = self.session.get_credentials()
 
             # Build request URL
             url = f"{self.api_url}/tasks/{task_id}/files/{file_id}/cleanup"
@@ -552,7 +556,8 @@ class AwsImportService:
             SigV4Auth(credentials, "execute-api", self.region).add_auth(request)
 
             # Make request
-            response = requests.post(
+            http = self.http_session or requests
+            response = http.post(
                 url,
                 data=body,
                 headers=dict(request.headers),
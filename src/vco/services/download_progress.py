@@ -15,6 +15,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from vco.utils.json_io import dump_json, load_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,8 +109,7 @@ class DownloadProgressStore:
             return
 
         try:
-            with open(self.db_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(self.db_path.read_bytes())
 
             for task_id, files in data.items():
                 # Validate that files is a dict
@@ -142,8 +143,7 @@ class DownloadProgressStore:
                 for file_id, progress in files.items():
                     data[task_id][file_id] = progress.to_dict()
 
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self.db_path.write_bytes(dump_json(data))
 
             logger.debug(f"Saved download progress to {self.db_path}")
 
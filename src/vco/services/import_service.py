@@ -16,7 +16,7 @@ from vco.services.review import ReviewItem, ReviewService
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDeleteResult:
     """Result of deleting files associated with a review item."""
 
@@ -26,7 +26,7 @@ class FileDeleteResult:
     metadata_error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoveResult:
     """Result of removing an item from the review queue."""
 
@@ -37,7 +37,7 @@ class RemoveResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClearResult:
     """Result of clearing all items from the review queue."""
 
@@ -48,7 +48,7 @@ class ClearResult:
     error_details: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Result of importing a single video to Photos."""
 
@@ -60,7 +60,7 @@ class ImportResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchImportResult:
     """Result of batch importing multiple videos."""
 
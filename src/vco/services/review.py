@@ -7,7 +7,6 @@ This service manages the review queue:
 4. Reject conversions (delete converted file)
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -16,11 +15,12 @@ from pathlib import Path
 from vco.metadata.manager import MetadataManager, VideoMetadata
 from vco.models.types import ConversionResult
 from vco.photos.manager import PhotosAccessManager
+from vco.utils.json_io import dump_json, load_json
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewItem:
     """Item in the review queue."""
 
@@ -335,8 +335,7 @@ class ReviewService:
             return ReviewQueue()
 
         try:
-            with open(self.queue_path) as f:
-                data = json.load(f)
+            data = load_json(self.queue_path.read_bytes())
             return ReviewQueue.from_dict(data)
         except Exception as e:
             logger.warning(f"Failed to load review queue: {e}")
@@ -353,8 +352,7 @@ class ReviewService:
         """
         try:
             self.queue_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.queue_path, "w") as f:
-                json.dump(queue.to_dict(), f, indent=2)
+            self.queue_path.write_bytes(dump_json(queue.to_dict()))
             return True
         except Exception as e:
             logger.exception(f"Failed to save review queue: {e}")
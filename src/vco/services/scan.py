@@ -6,14 +6,16 @@ This service orchestrates the scanning workflow:
 3. Generate candidates.json report
 """
 
-import json
+import heapq
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from vco.analyzer.analyzer import CompressionAnalyzer, ConversionCandidate
-from vco.models.types import VideoStatus
+from vco.models.base import _optional_datetime
+from vco.models.types import _VIDEO_STATUS_BY_VALUE, VideoStatus
 from vco.photos.manager import PhotosAccessManager, VideoInfo
+from vco.utils.json_io import dump_json, load_json
 
 
 @dataclass
@@ -96,6 +98,7 @@ class ScanService:
         photos_manager: PhotosAccessManager | None = None,
         analyzer: CompressionAnalyzer | None = None,
         output_dir: Path | None = None,
+        exif_bruteforce: bool = False,
     ):
         """Initialize ScanService.
 
@@ -103,8 +106,10 @@ class ScanService:
             photos_manager: PhotosAccessManager instance (created if not provided)
             analyzer: CompressionAnalyzer instance (created if not provided)
             output_dir: Directory for output files (default: ~/.config/vco)
+            exif_bruteforce: Probe videos without codec metadata with ffprobe
+                when creating the default PhotosAccessManager
         """
-        self.photos_manager = photos_manager or PhotosAccessManager()
+        self.photos_manager = photos_manager or PhotosAccessManager(exif_bruteforce=exif_bruteforce)
         self.analyzer = analyzer or CompressionAnalyzer()
         self.output_dir = output_dir or Path.home() / ".config" / "vco"
 
@@ -178,8 +183,7 @@ class ScanService:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        output_path.write_bytes(dump_json(result.to_dict()))
 
         return output_path
 
@@ -199,8 +203,7 @@ class ScanService:
             return None
 
         try:
-            with open(input_path) as f:
-                data = json.load(f)
+            data = load_json(input_path.read_bytes())
 
             # Parse summary
             summary_data = data.get("summary", {})
@@ -224,29 +227,24 @@ class ScanService:
                     filename=c_data.get("filename", ""),
                     path=Path(c_data.get("path", "")),
                     codec=c_data.get("codec", ""),
-                    resolution=tuple(c_data.get("resolution", [0, 0])),
+                    resolution=(res[0], res[1]) if (res := c_data.get("resolution")) else (0, 0),
                     bitrate=c_data.get("bitrate", 0),
                     duration=c_data.get("duration", 0.0),
                     frame_rate=c_data.get("frame_rate", 0.0),
                     file_size=c_data.get("file_size", 0),
-                    capture_date=datetime.fromisoformat(c_data["capture_date"])
-                    if c_data.get("capture_date")
-                    else None,
-                    creation_date=datetime.fromisoformat(c_data["creation_date"])
-                    if c_data.get("creation_date")
-                    else datetime.now(),
+                    capture_date=_optional_datetime(c_data.get("capture_date")),
+                    creation_date=_optional_datetime(c_data.get("creation_date")) or datetime.now(),
                     albums=c_data.get("albums", []),
                     is_in_icloud=c_data.get("is_in_icloud", False),
                     is_local=c_data.get("is_local", False),
-                    location=tuple(c_data["location"]) if c_data.get("location") else None,
+                    location=(loc[0], loc[1]) if (loc := c_data.get("location")) else None,
                 )
 
-                # Convert status string to VideoStatus enum
-                status_str = c_data.get("status", "pending")
-                try:
-                    status = VideoStatus(status_str)
-                except ValueError:
-                    status = VideoStatus.PENDING
+                # Convert status string to VideoStatus enum; unknown values
+                # fall back to pending
+                status = _VIDEO_STATUS_BY_VALUE.get(
+                    c_data.get("status", "pending"), VideoStatus.PENDING
+                )
 
                 candidate = ConversionCandidate(
                     video=video,
@@ -346,11 +344,9 @@ class ScanService:
         if n <= 0:
             raise ValueError("n must be a positive integer")
 
-        # Sort by file size in descending order
-        sorted_candidates = sorted(candidates, key=lambda c: c.video.file_size, reverse=True)
-
-        # Return top N (or all if fewer than N)
-        return sorted_candidates[:n]
+        # Largest N by file size, descending; equivalent to a full sort
+        # followed by [:n] (ties keep input order) without sorting the rest
+        return heapq.nlargest(n, candidates, key=lambda c: c.video.file_size)
 
     def calculate_top_n_summary(self, candidates: list[ConversionCandidate]) -> dict:
         """Calculate summary statistics for a list of candidates.
@@ -271,14 +271,7 @@ class UnifiedImportService:
 
     def _get_local_items(self) -> list[ImportableItem]:
         """Convert local ReviewItems to ImportableItems."""
-        items: list[ImportableItem] = []
-        pending = self.local_service.list_pending()
-
-        for review_item in pending:
-            item = self._review_item_to_importable(review_item)
-            items.append(item)
-
-        return items
+        return list(map(self._review_item_to_importable, self.local_service.list_pending()))
 
     def _review_item_to_importable(self, review_item: ReviewItem) -> ImportableItem:
         """Convert ReviewItem to ImportableItem."""
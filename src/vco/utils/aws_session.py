@@ -0,0 +1,49 @@
+"""Process-wide AWS session and HTTP connection pool.
+
+CLI commands that talk to the async API (status, cancel, import) share one
+boto3 session per (region, profile) and one requests session, so credential
+resolution and TLS connections are set up once per process instead of once
+per command object.
+"""
+
+import atexit
+import functools
+
+import boto3
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+# Connection pool size for the shared HTTP session
+HTTP_POOL_MAXSIZE = 50
+
+
+@functools.lru_cache(maxsize=4)
+def get_session(region: str, profile_name: str | None = None) -> boto3.Session:
+    """Get the shared boto3 session for a region and profile.
+
+    Args:
+        region: AWS region
+        profile_name: AWS profile name (optional)
+
+    Returns:
+        Cached boto3 Session
+    """
+    return boto3.Session(profile_name=profile_name, region_name=region)
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Get the shared requests session used for API Gateway calls.
+
+    The session keeps connections alive between requests and is closed
+    at interpreter exit.
+
+    Returns:
+        Cached requests Session
+    """
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+    atexit.register(http.close)
+    return http
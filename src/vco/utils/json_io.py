@@ -0,0 +1,60 @@
+"""JSON file encoding shared by the local state files.
+
+Scan results, the review queue and metadata sidecars are written as
+indented UTF-8 JSON; API payloads are written compact. orjson is used when
+installed (pip install video-compression-optimizer[fast]); otherwise the
+standard json module produces equivalent documents.
+"""
+
+import json
+from typing import Any
+
+# orjson is an optional speedup (pip install video-compression-optimizer[fast])
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: JSON-compatible value (dicts, lists, str, int, float, bool, None)
+
+    Returns:
+        Encoded JSON document
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_compact(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: JSON-compatible value (dicts, lists, str, int, float, bool, None)
+
+    Returns:
+        Encoded JSON document without insignificant whitespace
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Decoded value
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -0,0 +1,115 @@
+"""Bounded exponential backoff for transient AWS / API Gateway failures.
+
+Used by the async API clients so that a throttled or briefly unavailable
+endpoint does not abort the user's command.
+"""
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# botocore error codes that indicate throttling
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "SlowDown",
+    }
+)
+
+# HTTP status returned by API Gateway when the request was throttled
+HTTP_TOO_MANY_REQUESTS = 429
+
+
+def _status_code(error: BaseException) -> int | None:
+    """Extract an HTTP status code from a requests or botocore error."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    if isinstance(response, dict):
+        status: int | None = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status
+    return getattr(response, "status_code", None)
+
+
+def is_retryable_error(error: BaseException, idempotent: bool = True) -> bool:
+    """Check whether an error is worth retrying.
+
+    Args:
+        error: Exception raised by the call
+        idempotent: Whether the call is safe to repeat. When False, only
+            failures where the server cannot have processed the request
+            (throttling, connect timeouts) are retried; 5xx responses, read
+            timeouts and dropped connections, which may happen after the
+            request was sent, are not.
+
+    Returns:
+        True if the call should be retried
+    """
+    import requests  # type: ignore[import-untyped]
+    from botocore.exceptions import ClientError
+
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return idempotent
+
+    if isinstance(error, ClientError):
+        if error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            return True
+
+    status = _status_code(error)
+    if status is None:
+        return False
+    if status == HTTP_TOO_MANY_REQUESTS:
+        return True
+    return idempotent and 500 <= status < 600
+
+
+def with_backoff(
+    fn: Callable[[], T],
+    max_attempts: int = 5,
+    base: float = 0.25,
+    cap: float = 4.0,
+    idempotent: bool = True,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """Call fn, retrying transient failures with jittered exponential backoff.
+
+    The delay before attempt n is drawn from [0, min(cap, base * 2**n)]
+    ("full jitter"), so retries spread out instead of hammering the
+    endpoint in lockstep. Non-retryable errors are raised immediately.
+
+    Args:
+        fn: Zero-argument callable to invoke
+        max_attempts: Total number of attempts including the first
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+        idempotent: Whether fn is safe to repeat (see is_retryable_error)
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Return value of fn
+
+    Raises:
+        The last exception raised by fn once attempts are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            attempt += 1
+            if attempt >= max_attempts or not is_retryable_error(e, idempotent):
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+            logger.debug(f"Transient error (attempt {attempt}/{max_attempts}): {e}")
+            sleep(delay)
@@ -115,3 +115,24 @@ class TestCompressionRatioCalculation:
         """When sizes are equal, compression ratio is 1."""
         ratio = QualityResult.calculate_compression_ratio(original_size, original_size)
         assert abs(ratio - 1.0) < 1e-10, "Compression ratio should be 1 when sizes are equal"
+
+    @given(
+        sizes=st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=10_000_000_000),
+                st.integers(min_value=0, max_value=10_000_000_000),
+            ),
+            max_size=50,
+        )
+    )
+    def test_batch_matches_scalar(self, sizes: list[tuple[int, int]]):
+        """Batch calculations equal the per-file results in input order."""
+        originals = [original for original, _ in sizes]
+        converted = [converted for _, converted in sizes]
+
+        assert QualityResult.calculate_compression_ratios(originals, converted) == [
+            QualityResult.calculate_compression_ratio(o, c) for o, c in sizes
+        ]
+        assert QualityResult.calculate_space_saved_percents(originals, converted) == [
+            QualityResult.calculate_space_saved_percent(o, c) for o, c in sizes
+        ]
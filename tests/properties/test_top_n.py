@@ -165,6 +165,24 @@ class TestTopNSelectionAccuracy:
             f"Expected sizes {expected_sizes}, got {result_sizes}"
         )
 
+    @given(
+        file_sizes=st.lists(st.integers(min_value=1, max_value=5), min_size=1, max_size=50),
+        n=st.integers(min_value=1, max_value=100),
+    )
+    @settings(max_examples=100)
+    def test_ties_keep_input_order(self, file_sizes: list[int], n: int):
+        """Top-N matches a stable descending sort, so equal sizes keep scan order."""
+        candidates = [
+            create_candidate(uuid=f"uuid-{i}", filename=f"video_{i}.mov", file_size=size)
+            for i, size in enumerate(file_sizes)
+        ]
+
+        scan_service = ScanService()
+        result = scan_service.select_top_n(candidates, n)
+
+        expected = sorted(candidates, key=lambda c: c.video.file_size, reverse=True)[:n]
+        assert [c.video.uuid for c in result] == [c.video.uuid for c in expected]
+
     def test_n_must_be_positive(self):
         """select_top_n raises ValueError for non-positive n."""
         candidates = [create_candidate()]
@@ -1,10 +1,22 @@
 """Tests for base data models."""
 
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from vco.models import base
+from vco.models.async_task import AsyncFile
 from vco.models.base import BaseVideoMetadata
+from vco.models.types import ConversionResult, VideoInfo, VideoMetadata
+
+BASE_FIELDS = {
+    "uuid": "test-uuid-123",
+    "filename": "test_video.mp4",
+    "file_size": 1024000,
+    "capture_date": datetime(2024, 6, 15, 10, 30),
+    "location": (35.6762, 139.6503),
+}
 
 
 class TestBaseVideoMetadata:
@@ -150,3 +162,95 @@ class TestBaseVideoMetadata:
         # Should create object but location will be invalid characters
         assert metadata.uuid == "test-uuid-123"
         assert metadata.location == ("a", "b")  # Characters, not coordinates
+
+
+class TestSubclassToDict:
+    """Test subclasses serialize the base fields like BaseVideoMetadata."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            VideoInfo(**BASE_FIELDS),
+            ConversionResult(**BASE_FIELDS),
+            AsyncFile(file_id="file-1", source_s3_key="input/test.mov", **BASE_FIELDS),
+        ],
+        ids=["VideoInfo", "ConversionResult", "AsyncFile"],
+    )
+    def test_base_fields_match(self, instance):
+        """Subclass dicts should carry the base fields unchanged."""
+        expected = BaseVideoMetadata(**BASE_FIELDS).to_dict()
+        result = instance.to_dict()
+
+        assert {key: result[key] for key in expected} == expected
+
+    def test_models_are_slotted(self):
+        """Base and subclass instances should not carry a per-instance __dict__."""
+        for instance in (
+            BaseVideoMetadata(**BASE_FIELDS),
+            VideoInfo(**BASE_FIELDS),
+            ConversionResult(**BASE_FIELDS),
+            AsyncFile(file_id="file-1", source_s3_key="input/test.mov", **BASE_FIELDS),
+        ):
+            assert not hasattr(instance, "__dict__")
+
+    def test_conversion_result_nested_fields(self):
+        """ConversionResult should expand nested dataclasses into plain dicts."""
+        metadata = VideoMetadata(capture_date=None, creation_date=datetime(2024, 6, 15))
+        result = ConversionResult(metadata=metadata, **BASE_FIELDS).to_dict()
+
+        assert result["metadata"] == {
+            "capture_date": None,
+            "creation_date": datetime(2024, 6, 15),
+            "albums": [],
+            "title": None,
+            "description": None,
+            "location": None,
+        }
+
+
+class TestFromDictTimestamps:
+    """Test timestamp parsing shared by the from_dict methods."""
+
+    def test_video_info_from_dict_reuses_parsed_dates(self):
+        """Records from one import batch should share parsed datetimes."""
+        video = VideoInfo(creation_date=datetime(2024, 6, 15, 10, 30), **BASE_FIELDS)
+        data = video.to_dict()
+
+        first = VideoInfo.from_dict(data)
+        second = VideoInfo.from_dict(dict(data))
+
+        assert first.capture_date == BASE_FIELDS["capture_date"]
+        assert first.creation_date == datetime(2024, 6, 15, 10, 30)
+        assert second.capture_date is first.capture_date
+        assert second.creation_date is first.creation_date
+
+    def test_empty_capture_date_is_none(self):
+        """Empty capture_date strings should map to None."""
+        data = BaseVideoMetadata(**BASE_FIELDS).to_dict()
+        data["capture_date"] = ""
+
+        assert BaseVideoMetadata.from_dict(data).capture_date is None
+
+    @pytest.mark.parametrize(
+        "value,uses_ciso8601",
+        [
+            ("2024-06-15T10:30:00", True),
+            ("2024-06-15T10:30:00.123456+09:00", True),
+            ("20240615T103000", False),
+            ("2024-06-15", False),
+        ],
+    )
+    def test_ciso8601_only_parses_canonical_form(self, value, uses_ciso8601):
+        """ciso8601 should only see isoformat()-shaped strings."""
+        fake_parse = MagicMock(side_effect=datetime.fromisoformat)
+        base._parse_isoformat.cache_clear()
+        try:
+            with (
+                patch.object(base, "_HAS_CISO8601", True),
+                patch.object(base, "_ciso8601_parse_datetime", fake_parse, create=True),
+            ):
+                assert base._parse_isoformat(value) == datetime.fromisoformat(value)
+        finally:
+            base._parse_isoformat.cache_clear()
+
+        assert fake_parse.called is uses_ciso8601
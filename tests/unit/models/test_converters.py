@@ -1,5 +1,6 @@
 """Tests for data model converters."""
 
+import uuid
 from datetime import datetime
 from pathlib import Path
 
@@ -72,6 +73,19 @@ class TestVideoInfoToAsyncFile:
         assert len(result.file_id) == 36  # UUID format
         assert "-" in result.file_id
 
+    def test_generated_file_ids_are_unique_uuid4(self):
+        """Test generated file IDs are distinct RFC 4122 version 4 UUIDs."""
+        video = VideoInfo(uuid="test-uuid-123", filename="test_video.mp4")
+
+        ids = {video_info_to_async_file(video).file_id for _ in range(1000)}
+
+        assert len(ids) == 1000
+        for file_id in ids:
+            parsed = uuid.UUID(file_id)
+            assert str(parsed) == file_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
 
 class TestAsyncFileToConversionResult:
     """Test cases for async_file_to_conversion_result converter."""
@@ -11,9 +11,11 @@ Requirements: 2.3, 2.4
 import json
 import subprocess
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import pytest
+
 from vco.models.async_task import (
     AsyncFile,
     AsyncTask,
@@ -316,6 +318,80 @@ class TestAsyncTaskEstimateCompletionTime:
         )
 
 
+class TestSlottedModels:
+    """Test AsyncTask and DownloadProgress use __slots__."""
+
+    def test_async_task_has_no_instance_dict(self):
+        """AsyncTask instances should not carry a per-instance __dict__."""
+        now = datetime.now()
+        task = AsyncTask(
+            task_id="test-task",
+            user_id="test-user",
+            status=TaskStatus.PENDING,
+            quality_preset="balanced",
+            files=[],
+            created_at=now,
+            updated_at=now,
+        )
+        assert not hasattr(task, "__dict__")
+        assert AsyncTask.from_dict(task.to_dict()) == task
+
+    def test_download_progress_has_no_instance_dict(self):
+        """DownloadProgress instances should not carry a per-instance __dict__."""
+        progress = DownloadProgress(
+            task_id="t",
+            file_id="f",
+            total_bytes=10,
+            downloaded_bytes=5,
+            local_temp_path="/tmp/x",
+            s3_key="output/x.mp4",
+        )
+        assert not hasattr(progress, "__dict__")
+        assert progress.progress_percentage == 50
+
+
+class TestTimestampSerialization:
+    """Test memoized timestamp formatting in to_dict."""
+
+    def test_same_instant_in_other_zone_keeps_its_offset(self):
+        """Equal instants in different zones should serialize differently."""
+        utc = datetime(2024, 6, 15, 1, 30, tzinfo=timezone.utc)
+        jst = utc.astimezone(timezone(timedelta(hours=9)))
+        tasks = [
+            AsyncTask(
+                task_id="test-task",
+                user_id="test-user",
+                status=TaskStatus.PENDING,
+                quality_preset="balanced",
+                files=[],
+                created_at=dt,
+                updated_at=dt,
+            )
+            for dt in (utc, jst)
+        ]
+
+        assert tasks[0].to_dict()["created_at"] == "2024-06-15T01:30:00+00:00"
+        assert tasks[1].to_dict()["created_at"] == "2024-06-15T10:30:00+09:00"
+
+    def test_reassigned_timestamp_is_reformatted(self):
+        """Memoization is keyed by value, so updating a field needs no invalidation."""
+        task = AsyncTask(
+            task_id="test-task",
+            user_id="test-user",
+            status=TaskStatus.PENDING,
+            quality_preset="balanced",
+            files=[],
+            created_at=datetime(2024, 6, 15, 1, 30),
+            updated_at=datetime(2024, 6, 15, 1, 30),
+        )
+        assert task.to_dict()["updated_at"] == "2024-06-15T01:30:00"
+
+        task.updated_at = datetime(2024, 6, 15, 1, 45)
+
+        assert task.to_dict()["updated_at"] == "2024-06-15T01:45:00"
+        assert task.to_dict()["created_at"] == "2024-06-15T01:30:00"
+
+
 class TestAsyncTaskGetFiles:
     """Test AsyncTask.get_completed_files() and get_failed_files() methods."""
 
@@ -361,6 +437,25 @@ class TestAsyncTaskGetFiles:
         assert len(failed) == 2
         assert all(f.status == FileStatus.FAILED for f in failed)
 
+    def test_status_counts_and_groups(self):
+        """status_counts() and get_files_by_status() agree with the filters."""
+        files = [
+            self._create_file("f1", FileStatus.COMPLETED),
+            self._create_file("f2", FileStatus.FAILED),
+            self._create_file("f3", FileStatus.COMPLETED),
+            self._create_file("f4", FileStatus.PENDING),
+        ]
+        task = self._create_task(files)
+
+        counts = task.status_counts()
+        groups = task.get_files_by_status()
+
+        assert counts[FileStatus.COMPLETED] == 2
+        assert counts[FileStatus.CONVERTING] == 0
+        assert groups[FileStatus.COMPLETED] == task.get_completed_files()
+        assert groups[FileStatus.FAILED] == task.get_failed_files()
+        assert FileStatus.CONVERTING not in groups
+
     def _create_task(self, files: list[AsyncFile]) -> AsyncTask:
         """Helper to create a task with given files."""
         return AsyncTask(
@@ -654,3 +749,15 @@ class TestFileStatusDownloaded:
         restored = AsyncFile.from_dict(data)
 
         assert restored.status == original.status
+
+    def test_from_dict_rejects_unknown_status(self):
+        """from_dict should still raise ValueError for an unknown status."""
+        data = {
+            "file_id": "file-1",
+            "original_uuid": "uuid-1",
+            "filename": "test.mp4",
+            "source_s3_key": "source/test.mp4",
+            "status": "UNKNOWN",
+        }
+        with pytest.raises(ValueError):
+            AsyncFile.from_dict(data)
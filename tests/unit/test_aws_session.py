@@ -0,0 +1,60 @@
+"""Unit tests for shared AWS session helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from vco.utils.aws_session import get_http_session, get_session
+
+
+class TestGetSession:
+    """Tests for get_session."""
+
+    def setup_method(self):
+        get_session.cache_clear()
+
+    def teardown_method(self):
+        get_session.cache_clear()
+
+    def test_same_arguments_reuse_session(self):
+        """Test that repeated calls return the same session object."""
+        with patch("boto3.Session") as mock_session:
+            first = get_session("ap-northeast-1", None)
+            second = get_session("ap-northeast-1", None)
+
+        assert first is second
+        mock_session.assert_called_once_with(profile_name=None, region_name="ap-northeast-1")
+
+    def test_different_region_creates_new_session(self):
+        """Test that each region gets its own session."""
+        with patch("boto3.Session") as mock_session:
+            get_session("ap-northeast-1", None)
+            get_session("us-west-2", None)
+
+        assert mock_session.call_count == 2
+
+
+class TestGetHttpSession:
+    """Tests for get_http_session."""
+
+    def test_returns_shared_session(self):
+        """Test that the HTTP session is created once per process."""
+        assert get_http_session() is get_http_session()
+
+
+class TestCommandsUseSharedSession:
+    """Tests that commands accept injected sessions."""
+
+    def test_status_command_uses_injected_session(self):
+        """Test StatusCommand reuses the given sessions."""
+        from vco.services.async_status import StatusCommand
+
+        session = MagicMock()
+        http = MagicMock()
+        http.request.return_value.json.return_value = {"tasks": []}
+
+        cmd = StatusCommand(api_url="https://api.example.com", session=session, http_session=http)
+        assert cmd.session is session
+
+        with patch("requests_aws4auth.AWS4Auth"):
+            cmd.list_tasks(user_id="user-1")
+
+        http.request.assert_called_once()
@@ -103,6 +103,23 @@ class TestParseDate:
             parse_date("invalid")
 
 
+class TestTruncate:
+    """Tests for _truncate helper function."""
+
+    def test_short_text_unchanged(self):
+        """Test text within width is returned as-is."""
+        from vco.cli.main import _truncate
+
+        assert _truncate("video.mov", 30) == "video.mov"
+        assert _truncate("a" * 30, 30) == "a" * 30
+
+    def test_long_text_truncated_with_ellipsis(self):
+        """Test text over width is cut and suffixed."""
+        from vco.cli.main import _truncate
+
+        assert _truncate("a" * 31, 30) == "a" * 30 + "..."
+
+
 class TestCliGroup:
     """Tests for CLI group command."""
 
@@ -385,3 +402,41 @@ class TestConvertCommand:
         assert result.exit_code == 0
         assert "Dry run mode" in result.output
         assert "Would Convert" in result.output
+
+
+class TestTaskIdValidation:
+    """Tests for client-side task ID validation in status/cancel."""
+
+    @patch("vco.services.async_cancel.CancelCommand")
+    @patch("vco.cli.main.ConfigManager")
+    def test_cancel_rejects_malformed_task_id(self, mock_config, mock_cancel):
+        """Test cancel exits before any API call on a malformed task ID."""
+        from vco.cli.main import cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["cancel", "not-a-task"])
+
+        assert result.exit_code == 2
+        assert "Invalid task ID" in result.output
+        mock_cancel.assert_not_called()
+
+    @patch("vco.services.async_status.StatusCommand")
+    @patch("vco.cli.main.ConfigManager")
+    def test_status_rejects_malformed_task_id(self, mock_config, mock_status):
+        """Test status detail exits before any API call on a malformed task ID."""
+        from vco.cli.main import cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["status", "abc123"])
+
+        assert result.exit_code == 2
+        assert "Invalid task ID" in result.output
+        mock_status.assert_not_called()
+
+    def test_uuid4_task_id_accepted(self):
+        """Test the UUID4 format generated on submit passes validation."""
+        import uuid
+
+        from vco.cli.main import _require_valid_task_id
+
+        _require_valid_task_id(str(uuid.uuid4()))
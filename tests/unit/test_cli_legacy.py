@@ -32,6 +32,19 @@ class TestScanLegacyOption:
             # Check for deprecation warning in output
             assert "deprecated" in result.output.lower()
 
+    @pytest.mark.parametrize("args", [["--exif-bruteforce"], []])
+    def test_scan_legacy_passes_exif_bruteforce(self, runner, args):
+        """Test that --exif-bruteforce reaches the legacy PhotosAccessManager."""
+        cli_main = __import__("vco.cli.main", fromlist=["cli"])
+        with patch.object(cli_main, "PhotosAccessManager") as mock_legacy:
+            manager = MagicMock()
+            manager.get_all_videos.return_value = []
+            mock_legacy.return_value = manager
+
+            runner.invoke(cli_main.cli, ["scan", "--legacy", *args])
+
+            mock_legacy.assert_called_once_with(exif_bruteforce=bool(args))
+
     def test_scan_swift_fallback_shows_warning(self, runner):
         """Test that Swift fallback shows warning message."""
         with patch("vco.photos.swift_bridge.SwiftBridge") as mock_swift:
@@ -51,6 +64,21 @@ class TestScanLegacyOption:
                 # Should show fallback warning in output
                 assert "Swift implementation unavailable" in result.output
 
+    def test_scan_swift_fallback_passes_exif_bruteforce(self, runner):
+        """Test that --exif-bruteforce reaches the fallback PhotosAccessManager."""
+        cli_main = __import__("vco.cli.main", fromlist=["cli"])
+        with patch("vco.photos.swift_bridge.SwiftBridge") as mock_swift:
+            mock_swift.side_effect = Exception("Binary not found")
+
+            with patch.object(cli_main, "PhotosAccessManager") as mock_legacy:
+                manager = MagicMock()
+                manager.get_all_videos.return_value = []
+                mock_legacy.return_value = manager
+
+                runner.invoke(cli_main.cli, ["scan", "--exif-bruteforce"])
+
+                mock_legacy.assert_called_once_with(exif_bruteforce=True)
+
     def test_scan_swift_success_no_fallback(self, runner):
         """Test that successful Swift initialization doesn't fall back."""
         with patch("vco.photos.swift_bridge.SwiftBridge") as mock_swift:
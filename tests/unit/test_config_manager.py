@@ -45,6 +45,16 @@ class TestAWSConfig:
         assert config.profile == "my-profile"
         assert config.quality_checker_function == "my-function"
 
+    def test_async_api_url_defaults_to_region_endpoint(self):
+        """Test async_api_url is derived from region when not set."""
+        config = AWSConfig(region="us-west-2")
+        assert config.async_api_url == "https://dln48ri1di.execute-api.us-west-2.amazonaws.com/dev"
+
+    def test_async_api_url_custom_value_kept(self):
+        """Test an explicit async_api_url is not overridden."""
+        config = AWSConfig(async_api_url="https://api.example.com/prod")
+        assert config.async_api_url == "https://api.example.com/prod"
+
 
 class TestConversionConfig:
     """Tests for ConversionConfig dataclass."""
@@ -62,6 +72,14 @@ class TestConversionConfig:
             config = ConversionConfig(quality_preset=preset)
             assert config.quality_preset == preset
 
+    def test_all_quality_config_presets_accepted(self):
+        """Test every preset defined in quality_config is accepted."""
+        from vco.config.quality_config import QUALITY_PRESETS
+
+        for preset in QUALITY_PRESETS:
+            config = ConversionConfig(quality_preset=preset)
+            assert config.quality_preset == preset
+
     def test_invalid_quality_preset_raises_error(self):
         """Test invalid quality preset raises ValueError."""
         with pytest.raises(ValueError, match="Invalid quality_preset"):
@@ -189,6 +207,55 @@ class TestConfigManager:
         saved_data = json.loads(config_path.read_text())
         assert saved_data["aws"]["s3_bucket"] == "new-bucket"
 
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Test save writes via a temp file that is renamed into place."""
+        config_path = tmp_path / "config.json"
+        manager = ConfigManager(config_path=config_path)
+
+        manager.save()
+
+        assert config_path.exists()
+        assert not (tmp_path / "config.json.tmp").exists()
+
+    def test_save_skips_unchanged_config(self, tmp_path):
+        """Test a second save without changes does not rewrite the file."""
+        config_path = tmp_path / "config.json"
+        manager = ConfigManager(config_path=config_path)
+        manager.save()
+
+        with patch("vco.config.manager.os.replace") as mock_replace:
+            manager.save()
+            mock_replace.assert_not_called()
+
+            manager.config.aws.s3_bucket = "changed"
+            manager.save()
+            mock_replace.assert_called_once()
+
+    def test_save_default_api_url_follows_region_edit(self, tmp_path):
+        """Test the default API URL is not pinned in the file and tracks aws.region."""
+        config_path = tmp_path / "config.json"
+        manager = ConfigManager(config_path=config_path)
+        manager.save()
+
+        saved_data = json.loads(config_path.read_text())
+        assert saved_data["aws"]["async_api_url"] == ""
+
+        saved_data["aws"]["region"] = "eu-west-1"
+        config_path.write_text(json.dumps(saved_data))
+
+        reloaded = ConfigManager(config_path=config_path)
+        assert "eu-west-1" in reloaded.config.aws.async_api_url
+
+    def test_save_keeps_custom_api_url(self, tmp_path):
+        """Test a custom API URL is written to the file as is."""
+        config_path = tmp_path / "config.json"
+        manager = ConfigManager(config_path=config_path)
+        manager.set("aws.async_api_url", "https://api.example.com/prod")
+        manager.save()
+
+        saved_data = json.loads(config_path.read_text())
+        assert saved_data["aws"]["async_api_url"] == "https://api.example.com/prod"
+
     def test_save_creates_parent_directories(self, tmp_path):
         """Test save creates parent directories if needed."""
         config_path = tmp_path / "nested" / "dir" / "config.json"
@@ -240,6 +307,21 @@ class TestConfigManager:
         manager.set("aws.region", "eu-west-1")
         assert manager.config.aws.region == "eu-west-1"
 
+    def test_set_region_updates_default_api_url(self, tmp_path):
+        """Test changing region moves the default API URL along with it."""
+        manager = ConfigManager(config_path=tmp_path / "config.json")
+
+        manager.set("aws.region", "eu-west-1")
+        assert "eu-west-1" in manager.config.aws.async_api_url
+
+    def test_set_region_keeps_custom_api_url(self, tmp_path):
+        """Test changing region does not touch a custom API URL."""
+        manager = ConfigManager(config_path=tmp_path / "config.json")
+        manager.set("aws.async_api_url", "https://api.example.com/prod")
+
+        manager.set("aws.region", "eu-west-1")
+        assert manager.config.aws.async_api_url == "https://api.example.com/prod"
+
     def test_set_invalid_key_format_raises_error(self, tmp_path):
         """Test set with invalid key format raises KeyError."""
         manager = ConfigManager(config_path=tmp_path / "config.json")
@@ -282,6 +364,18 @@ class TestConfigManager:
         manager.set("conversion.max_concurrent", "7")
         assert manager.config.conversion.max_concurrent == 7
 
+    def test_every_saved_key_is_accessible(self, tmp_path):
+        """Test every dotted key in get_all() can be read and written back."""
+        manager = ConfigManager(config_path=tmp_path / "config.json")
+
+        for section, values in manager.get_all().items():
+            if not isinstance(values, dict):
+                continue
+            for name, value in values.items():
+                key = f"{section}.{name}"
+                assert manager.get(key) == value
+                manager.set(key, value)
+
     def test_get_all(self, tmp_path):
         """Test get_all returns complete config as dict."""
         manager = ConfigManager(config_path=tmp_path / "config.json")
@@ -5,7 +5,9 @@ Tests the conversion functions between CLI models and API formats.
 Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
 """
 
+import json
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -15,7 +17,9 @@ from vco.models.converters import (
     api_to_async_task,
     async_file_to_api,
     async_task_to_api,
+    async_task_to_json_bytes,
 )
+from vco.utils import json_io
 
 
 class TestAsyncFileConversion:
@@ -192,6 +196,67 @@ class TestAsyncTaskConversion:
         assert result["progress_percentage"] == 0
         assert result["max_concurrent"] == 5
 
+    def test_async_task_to_api_key_order(self):
+        """Test the API response keeps its documented key order."""
+        now = datetime.now()
+        task = AsyncTask(
+            task_id="task-123",
+            user_id="user-456",
+            status=TaskStatus.PENDING,
+            quality_preset="balanced",
+            files=[],
+            created_at=now,
+            updated_at=now,
+        )
+
+        assert list(async_task_to_api(task)) == [
+            "task_id",
+            "user_id",
+            "status",
+            "quality_preset",
+            "files",
+            "created_at",
+            "updated_at",
+            "started_at",
+            "completed_at",
+            "execution_arn",
+            "error_message",
+            "progress_percentage",
+            "current_step",
+            "estimated_completion_time",
+            "max_concurrent",
+        ]
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_async_task_to_json_bytes(self, has_orjson):
+        """Test the JSON bytes decode to the API dict with either encoder."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        now = datetime.now()
+        task = AsyncTask(
+            task_id="task-123",
+            user_id="user-456",
+            status=TaskStatus.CONVERTING,
+            quality_preset="balanced",
+            files=[
+                AsyncFile(
+                    file_id="file-1",
+                    uuid="uuid-1",
+                    filename="東京.mov",
+                    source_s3_key="input/file-1.mov",
+                    capture_date=now,
+                )
+            ],
+            created_at=now,
+            updated_at=now,
+        )
+
+        with patch.object(json_io, "_HAS_ORJSON", has_orjson):
+            raw = async_task_to_json_bytes(task)
+
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == async_task_to_api(task)
+
     def test_async_task_to_api_with_files(self):
         """Test AsyncTask to API conversion with files."""
         now = datetime.now()
@@ -280,6 +345,25 @@ class TestAsyncTaskConversion:
         assert result.progress_percentage == 100
         assert result.current_step == "completed"
 
+    def test_api_to_async_task_reuses_parsed_timestamps(self):
+        """Test repeated timestamp strings parse to equal, shared values."""
+        data = {
+            "task_id": "task-123",
+            "user_id": "user-456",
+            "status": "CONVERTING",
+            "quality_preset": "balanced",
+            "files": [],
+            "created_at": "2024-06-15T10:30:00+09:00",
+            "updated_at": "2024-06-15T10:30:00+09:00",
+            "started_at": "2024-06-15T10:30:00+09:00",
+        }
+
+        task = api_to_async_task(data)
+
+        assert task.created_at == datetime.fromisoformat("2024-06-15T10:30:00+09:00")
+        assert task.updated_at is task.created_at
+        assert task.started_at is task.created_at
+
     def test_async_task_roundtrip(self):
         """Test AsyncTask -> API -> AsyncTask roundtrip preserves data."""
         now = datetime.now()
@@ -374,6 +458,42 @@ class TestEdgeCases:
         assert result["error_code"] is None
         assert result["error_message"] is None
 
+    @pytest.mark.parametrize("status", list(FileStatus))
+    def test_api_to_async_file_every_status(self, status):
+        """Test every status value maps back to its enum member."""
+        data = {"file_id": "file-123", "filename": "test.mov", "status": status.value}
+
+        assert api_to_async_file(data).status is status
+
+    @pytest.mark.parametrize("status", list(TaskStatus))
+    def test_api_to_async_task_every_status(self, status):
+        """Test every task status value maps back to its enum member."""
+        now = datetime.now().isoformat()
+        data = {
+            "task_id": "task-123",
+            "user_id": "user-456",
+            "status": status.value,
+            "quality_preset": "balanced",
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        assert api_to_async_task(data).status is status
+
+    def test_api_to_async_file_fallback_keys(self):
+        """Test uuid and source_size_bytes are used when the primary keys are absent."""
+        data = {
+            "file_id": "file-123",
+            "filename": "test.mov",
+            "uuid": "uuid-456",
+            "source_size_bytes": 2048,
+        }
+
+        result = api_to_async_file(data)
+
+        assert result.uuid == "uuid-456"
+        assert result.file_size == 2048
+
     def test_api_to_async_file_invalid_status(self):
         """Test conversion raises error for invalid status."""
         data = {
@@ -11,6 +11,9 @@ Requirements: 4.5
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from vco.services.download_progress import DownloadProgress, DownloadProgressStore
 
@@ -477,14 +480,19 @@ class TestDownloadProgressStoreListIncompleteTasks:
 class TestDownloadProgressStoreCorruptedFile:
     """Tests for handling corrupted JSON file."""
 
-    def test_corrupted_json_file_recovers(self, tmp_path):
-        """Store recovers from corrupted JSON file."""
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_corrupted_json_file_recovers(self, tmp_path, has_orjson):
+        """Store recovers from corrupted JSON file with either JSON backend."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+
         # Create corrupted JSON file
         db_path = tmp_path / "download_progress.json"
         db_path.write_text("{ invalid json }")
 
         # Should not raise, should recover with empty data
-        store = DownloadProgressStore(cache_dir=tmp_path)
+        with patch("vco.utils.json_io._HAS_ORJSON", has_orjson):
+            store = DownloadProgressStore(cache_dir=tmp_path)
 
         result = store.get_progress("task-123", "file-456")
         assert result is None
@@ -152,6 +152,20 @@ class TestCancelMediaConvertJobs:
         assert result == []
         mock_client.get_job.assert_not_called()
 
+    @patch.object(cancel_app, "get_mediaconvert_client")
+    def test_cancel_multiple_jobs_preserves_order(self, mock_mc):
+        """Only running jobs are cancelled and results keep file order."""
+        statuses = {"job-1": "PROGRESSING", "job-2": "COMPLETE", "job-3": "SUBMITTED"}
+        mock_client = MagicMock()
+        mock_client.get_job.side_effect = lambda **kw: {"Job": {"Status": statuses[kw["Id"]]}}
+        mock_mc.return_value = mock_client
+
+        files = [{"file_id": f"file-{i}", "mediaconvert_job_id": f"job-{i}"} for i in (1, 2, 3)]
+        result = cancel_app.cancel_mediaconvert_jobs(files)
+
+        assert result == ["job-1", "job-3"]
+        assert mock_client.cancel_job.call_count == 2
+
 
 class TestCleanupS3Files:
     """Tests for cleanup_s3_files function."""
@@ -328,6 +342,9 @@ class TestLambdaHandler:
         assert body["status"] == "CANCELLED"
         assert body["sfn_stopped"] is True
         assert "job-123" in body["cancelled_jobs"]
+        assert body["previous_status"] == "PROCESSING"
+        assert body["mediaconvert_cancelled"] is True
+        assert body["s3_files_deleted"] is True
         assert body["deleted_files"] == 5
 
     @pytest.mark.parametrize(
@@ -0,0 +1,749 @@
+"""Unit tests for MediaConvertClient.
+
+AWS calls are replaced with mocks; see tests/integration/aws for tests
+against real MediaConvert.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vco.converter import mediaconvert
+from vco.converter.mediaconvert import (
+    _JOB_SETTINGS_TEMPLATE,
+    PRESIGN_MULTIPART_THRESHOLD,
+    QUALITY_PRESETS,
+    S3_COPY_OBJECT_MAX_SIZE,
+    S3_COPY_PART_SIZE,
+    S3_MAX_CONCURRENCY,
+    S3_MULTIPART_CHUNKSIZE,
+    S3_MULTIPART_THRESHOLD,
+    ConversionJob,
+    MediaConvertClient,
+    _resolve_endpoint,
+)
+
+
+@pytest.fixture
+def mock_session():
+    """Patch boto3.Session and return the session mock."""
+    _resolve_endpoint.cache_clear()
+    with (
+        patch("boto3.Session") as session_cls,
+        # Patch the module these tests imported; other tests may re-import vco.*
+        patch.object(mediaconvert, "create_transfer_manager"),
+    ):
+        session = session_cls.return_value
+        session.client.return_value.describe_endpoints.return_value = {
+            "Endpoints": [{"Url": "https://abc123.mediaconvert.ap-northeast-1.amazonaws.com"}]
+        }
+        yield session
+    _resolve_endpoint.cache_clear()
+
+
+@pytest.fixture
+def client(mock_session):
+    """Create a MediaConvertClient backed by mocks."""
+    return MediaConvertClient(
+        region="ap-northeast-1",
+        s3_bucket="test-bucket",
+        role_arn="arn:aws:iam::123456789012:role/test",
+    )
+
+
+class TestEndpointResolution:
+    """Tests for MediaConvert endpoint caching."""
+
+    def test_endpoint_resolved_once_per_region(self, mock_session):
+        """Test DescribeEndpoints is called once for repeated client construction."""
+        kwargs = {"s3_bucket": "test-bucket", "role_arn": "arn:aws:iam::123456789012:role/test"}
+
+        first = MediaConvertClient(region="ap-northeast-1", **kwargs)
+        second = MediaConvertClient(region="ap-northeast-1", **kwargs)
+        MediaConvertClient(region="us-east-1", **kwargs)
+
+        assert first._endpoint_url == second._endpoint_url
+        assert mock_session.client.return_value.describe_endpoints.call_count == 2
+
+
+class TestConversionJobPreset:
+    """Tests for ConversionJob preset handling."""
+
+    def test_preset_resolves_shared_instance(self):
+        """Test preset returns the shared QualityPreset object."""
+        job = ConversionJob(
+            job_id="job-1",
+            source_video_uuid="uuid",
+            source_s3_key="input/a.mov",
+            output_s3_key="output/a.mp4",
+            status="SUBMITTED",
+            quality_preset="high",
+        )
+        assert job.preset is QUALITY_PRESETS["high"]
+
+    def test_preset_unknown_is_none(self):
+        """Test preset is None when no preset name was recorded."""
+        job = ConversionJob(
+            job_id="job-1",
+            source_video_uuid="uuid",
+            source_s3_key="input/a.mov",
+            output_s3_key="output/a.mp4",
+            status="SUBMITTED",
+        )
+        assert job.preset is None
+
+    def test_created_at_is_datetime(self):
+        """Test created_at defaults to the local time the job was created."""
+        before = datetime.now()
+        job = ConversionJob(
+            job_id="job-1",
+            source_video_uuid="uuid",
+            source_s3_key="input/a.mov",
+            output_s3_key="output/a.mp4",
+            status="SUBMITTED",
+        )
+
+        assert isinstance(job.created_at, datetime)
+        assert before <= job.created_at <= datetime.now()
+
+
+class TestSubmitJob:
+    """Tests for submit_job."""
+
+    def test_submit_job_records_preset(self, client):
+        """Test the submitted job carries the resolved preset name."""
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.create_job.return_value = {"Job": {"Id": "job-1"}}
+
+        job = client.submit_job("uuid", "input/a.mov", "output/a.mp4", quality_preset="unknown")
+
+        assert job.job_id == "job-1"
+        assert job.quality_preset == "balanced"
+        user_metadata = client.mediaconvert.create_job.call_args.kwargs["UserMetadata"]
+        assert user_metadata["quality_preset"] == "balanced"
+
+
+class TestBuildJobSettings:
+    """Tests for _build_job_settings."""
+
+    def test_fills_per_job_fields(self, client):
+        """Test job-specific fields are filled from the keys and preset."""
+        settings = client._build_job_settings(
+            "input/a.mov", "output/dir/a.mp4", QUALITY_PRESETS["high"]
+        )
+
+        assert settings["Inputs"][0]["FileInput"] == "s3://test-bucket/input/a.mov"
+        group = settings["OutputGroups"][0]
+        assert (
+            group["OutputGroupSettings"]["FileGroupSettings"]["Destination"]
+            == "s3://test-bucket/output/dir/"
+        )
+        h265 = group["Outputs"][0]["VideoDescription"]["CodecSettings"]["H265Settings"]
+        assert h265["QvbrSettings"]["QvbrQualityLevel"] == 9
+        assert h265["MaxBitrate"] == 50_000_000
+
+    def test_settings_do_not_share_state(self, client):
+        """Test each call returns an independent copy of the template."""
+        first = client._build_job_settings("a.mov", "out/a.mp4", QUALITY_PRESETS["high"])
+        second = client._build_job_settings("b.mov", "out/b.mp4", QUALITY_PRESETS["compression"])
+
+        assert first["Inputs"][0]["FileInput"] == "s3://test-bucket/a.mov"
+        assert second["Inputs"][0]["FileInput"] == "s3://test-bucket/b.mov"
+        assert _JOB_SETTINGS_TEMPLATE["Inputs"][0]["FileInput"] is None
+
+
+class TestGetJobStatus:
+    """Tests for get_job_status."""
+
+    def test_parses_keys_and_preset(self, client):
+        """Test S3 keys and preset are recovered from the job description."""
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.return_value = {
+            "Job": {
+                "Status": "COMPLETE",
+                "JobPercentComplete": 100,
+                "UserMetadata": {"source_video_uuid": "uuid", "quality_preset": "high"},
+                "Settings": {
+                    "Inputs": [{"FileInput": "s3://test-bucket/input/a.mov"}],
+                    "OutputGroups": [
+                        {
+                            "OutputGroupSettings": {
+                                "FileGroupSettings": {"Destination": "s3://test-bucket/output/"}
+                            }
+                        }
+                    ],
+                },
+            }
+        }
+
+        job = client.get_job_status("job-1")
+
+        assert job.status == "COMPLETE"
+        assert job.source_s3_key == "input/a.mov"
+        assert job.output_s3_key == "output"
+        assert job.preset is QUALITY_PRESETS["high"]
+
+    def test_other_bucket_keys_ignored(self, client):
+        """Test URIs outside the client's bucket are not parsed as keys."""
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.return_value = {
+            "Job": {
+                "Status": "PROGRESSING",
+                "Settings": {
+                    "Inputs": [{"FileInput": "s3://test-bucket-2/input/a.mov"}],
+                    "OutputGroups": [
+                        {
+                            "OutputGroupSettings": {
+                                "FileGroupSettings": {"Destination": "s3://other/output/"}
+                            }
+                        }
+                    ],
+                },
+            }
+        }
+
+        job = client.get_job_status("job-1")
+
+        assert job.source_s3_key == ""
+        assert job.output_s3_key == ""
+
+
+class TestS3Transfers:
+    """Tests for S3 upload/download."""
+
+    def _s3_config(self, session):
+        for c in session.client.call_args_list:
+            if c.args == ("s3",):
+                return c.kwargs["config"]
+        raise AssertionError("S3 client was not created")
+
+    def test_s3_client_defaults(self, client, mock_session):
+        """Test the S3 client uses a larger pool and no acceleration by default."""
+        config = self._s3_config(mock_session)
+        assert config.s3["use_accelerate_endpoint"] is False
+        assert "addressing_style" not in config.s3
+        assert config.max_pool_connections >= S3_MAX_CONCURRENCY
+        assert config.retries["mode"] == "adaptive"
+
+    def test_mediaconvert_client_config(self, client, mock_session):
+        """Test the MediaConvert client uses adaptive retries and a larger pool."""
+        mc_call = next(c for c in mock_session.client.call_args_list if "endpoint_url" in c.kwargs)
+        config = mc_call.kwargs["config"]
+        assert config.retries == {"max_attempts": 10, "mode": "adaptive"}
+        assert config.max_pool_connections >= 64
+
+    def test_s3_client_accelerate(self, mock_session):
+        """Test use_accelerate switches the S3 client to the accelerated endpoint."""
+        MediaConvertClient(
+            region="ap-northeast-1",
+            s3_bucket="test-bucket",
+            role_arn="arn:aws:iam::123456789012:role/test",
+            use_accelerate=True,
+        )
+        config = self._s3_config(mock_session)
+        assert config.s3["use_accelerate_endpoint"] is True
+        assert config.s3["addressing_style"] == "virtual"
+
+    def test_transfer_manager_uses_multipart_config(self, mock_session):
+        """Test the shared transfer manager is built from the tuned TransferConfig."""
+        with patch.object(mediaconvert, "create_transfer_manager") as create:
+            client = MediaConvertClient(
+                region="ap-northeast-1",
+                s3_bucket="test-bucket",
+                role_arn="arn:aws:iam::123456789012:role/test",
+            )
+
+        create.assert_called_once_with(client.s3, client._transfer_config)
+        assert client._transfer_config.multipart_threshold == S3_MULTIPART_THRESHOLD
+        assert client._transfer_config.max_concurrency == S3_MAX_CONCURRENCY
+
+    def test_upload_waits_for_transfer(self, client, tmp_path):
+        """Test upload goes through the shared transfer manager."""
+        local = tmp_path / "a.mov"
+
+        uri = client.upload_to_s3(local, "input/a.mov")
+
+        assert uri == "s3://test-bucket/input/a.mov"
+        client._s3_transfer.upload.assert_called_once_with(str(local), "test-bucket", "input/a.mov")
+        client._s3_transfer.upload.return_value.result.assert_called_once()
+
+    def test_download_waits_for_transfer(self, client, tmp_path):
+        """Test download creates the parent directory and uses the transfer manager."""
+        local = tmp_path / "out" / "a.mp4"
+
+        result = client.download_from_s3("output/a.mp4", local)
+
+        assert result == local
+        assert local.parent.is_dir()
+        client._s3_transfer.download.assert_called_once_with(
+            "test-bucket", "output/a.mp4", str(local)
+        )
+        client._s3_transfer.download.return_value.result.assert_called_once()
+
+    def test_context_manager_shuts_down_transfers(self, client):
+        """Test leaving the context shuts down the transfer manager."""
+        with client as entered:
+            assert entered is client
+
+        client._s3_transfer.shutdown.assert_called_once()
+
+
+class TestPresignedUpload:
+    """Tests for presigned direct uploads."""
+
+    def test_small_file_single_put(self, client):
+        """Test small uploads get a single presigned PUT URL."""
+        client.s3.generate_presigned_url.return_value = "https://put"
+
+        result = client.presign_put("input/a.mov", size_hint=1024, expires=60)
+
+        assert result == {"url": "https://put"}
+        client.s3.generate_presigned_url.assert_called_once_with(
+            "put_object", Params={"Bucket": "test-bucket", "Key": "input/a.mov"}, ExpiresIn=60
+        )
+        client.s3.create_multipart_upload.assert_not_called()
+
+    def test_large_file_multipart(self, client):
+        """Test large uploads get one presigned URL per part."""
+        client.s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        client.s3.generate_presigned_url.side_effect = lambda op, **kwargs: (
+            f"https://part/{kwargs['Params']['PartNumber']}"
+        )
+        size = PRESIGN_MULTIPART_THRESHOLD + 1
+
+        result = client.presign_put("input/a.mov", size_hint=size)
+
+        expected_parts = -(-size // S3_MULTIPART_CHUNKSIZE)
+        assert result["upload_id"] == "up-1"
+        assert result["part_size"] == S3_MULTIPART_CHUNKSIZE
+        assert result["part_urls"] == [f"https://part/{n}" for n in range(1, expected_parts + 1)]
+
+    def test_complete_multipart_sorts_parts(self, client):
+        """Test parts are sent to S3 in part-number order."""
+        uri = client.complete_multipart_upload(
+            "input/a.mov",
+            "up-1",
+            [{"PartNumber": 2, "ETag": "b"}, {"PartNumber": 1, "ETag": "a"}],
+        )
+
+        assert uri == "s3://test-bucket/input/a.mov"
+        kwargs = client.s3.complete_multipart_upload.call_args.kwargs
+        assert [p["PartNumber"] for p in kwargs["MultipartUpload"]["Parts"]] == [1, 2]
+
+
+class TestCopyObject:
+    """Tests for server-side S3 copies."""
+
+    def test_small_object_uses_copy_object(self, client):
+        """Test objects up to 5 GiB are copied with one CopyObject call."""
+        client.s3.head_object.return_value = {"ContentLength": 1024}
+
+        uri = client.copy_s3_object("staging/a.mov", "input/a.mov")
+
+        assert uri == "s3://test-bucket/input/a.mov"
+        client.s3.copy_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="input/a.mov",
+            CopySource={"Bucket": "test-bucket", "Key": "staging/a.mov"},
+        )
+        client.s3.create_multipart_upload.assert_not_called()
+
+    def test_large_object_uses_part_copy(self, client):
+        """Test large objects are copied as contiguous UploadPartCopy ranges."""
+        size = S3_COPY_OBJECT_MAX_SIZE + 1
+        client.s3.head_object.return_value = {"ContentLength": size}
+        client.s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        client.s3.upload_part_copy.side_effect = lambda **kw: {
+            "CopyPartResult": {"ETag": f"etag-{kw['PartNumber']}"}
+        }
+
+        client.copy_s3_object("a.mov", "b.mov", src_bucket="other-bucket")
+
+        calls = sorted(
+            (c.kwargs for c in client.s3.upload_part_copy.call_args_list),
+            key=lambda kw: kw["PartNumber"],
+        )
+        assert calls[0]["CopySourceRange"] == f"bytes=0-{S3_COPY_PART_SIZE - 1}"
+        assert calls[-1]["CopySourceRange"].endswith(f"-{size - 1}")
+        assert calls[0]["CopySource"] == {"Bucket": "other-bucket", "Key": "a.mov"}
+        parts = client.s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [p["PartNumber"] for p in parts] == list(range(1, len(calls) + 1))
+
+    def test_large_object_keeps_content_type_and_metadata(self, client):
+        """Test the multipart copy carries over the source's ContentType and Metadata."""
+        client.s3.head_object.return_value = {
+            "ContentLength": S3_COPY_OBJECT_MAX_SIZE + 1,
+            "ContentType": "video/quicktime",
+            "Metadata": {"uuid": "video-1"},
+        }
+        client.s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        client.s3.upload_part_copy.return_value = {"CopyPartResult": {"ETag": "etag"}}
+
+        client.copy_s3_object("a.mov", "b.mov")
+
+        client.s3.create_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="b.mov",
+            ContentType="video/quicktime",
+            Metadata={"uuid": "video-1"},
+        )
+
+    def test_failed_part_aborts_upload(self, client):
+        """Test the multipart upload is aborted when a part copy fails."""
+        client.s3.head_object.return_value = {"ContentLength": S3_COPY_OBJECT_MAX_SIZE + 1}
+        client.s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        client.s3.upload_part_copy.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            client.copy_s3_object("a.mov", "b.mov")
+
+        client.s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="b.mov", UploadId="up-1"
+        )
+        client.s3.complete_multipart_upload.assert_not_called()
+
+
+class TestBulkTransfers:
+    """Tests for bulk S3 helpers."""
+
+    @pytest.fixture
+    def transfer(self, client):
+        """Give the client its own transfer manager mock."""
+        client._s3_transfer = MagicMock()
+        return client._s3_transfer
+
+    def test_bulk_upload_reports_partial_failure(self, client, transfer, tmp_path):
+        """Test failed uploads are returned alongside successful ones."""
+        error = RuntimeError("network down")
+
+        def upload(path, bucket, key):
+            future = MagicMock()
+            if key == "input/b.mov":
+                future.result.side_effect = error
+            return future
+
+        transfer.upload.side_effect = upload
+
+        results = client.bulk_upload(
+            [(tmp_path / "a.mov", "input/a.mov"), (tmp_path / "b.mov", "input/b.mov")]
+        )
+
+        assert results["input/a.mov"] == "s3://test-bucket/input/a.mov"
+        assert results["input/b.mov"] is error
+
+    def test_bulk_download_returns_paths(self, client, transfer, tmp_path):
+        """Test every downloaded key maps to its local path."""
+        items = [(f"output/{i}.mp4", tmp_path / f"{i}.mp4") for i in range(5)]
+
+        results = client.bulk_download(items, concurrency=2)
+
+        assert results == dict(items)
+        assert transfer.download.call_count == 5
+
+    def test_bulk_empty(self, client, transfer):
+        """Test empty input makes no S3 calls."""
+        assert client.bulk_upload([]) == {}
+        assert client.bulk_download([]) == {}
+        assert client.bulk_delete([]) == []
+        transfer.upload.assert_not_called()
+        client.s3.delete_objects.assert_not_called()
+
+    def test_bulk_delete_batches_keys(self, client):
+        """Test keys are split into DeleteObjects batches of 1000."""
+        keys = [f"output/{i}.mp4" for i in range(2500)]
+        client.s3.delete_objects.return_value = {"Errors": [{"Key": "output/7.mp4"}]}
+
+        failed = client.bulk_delete(keys)
+
+        sizes = [
+            len(c.kwargs["Delete"]["Objects"]) for c in client.s3.delete_objects.call_args_list
+        ]
+        assert sizes == [1000, 1000, 500]
+        assert failed == ["output/7.mp4"] * 3
+
+    def test_bulk_delete_client_error(self, client):
+        """Test a failed batch reports all of its keys."""
+        from botocore.exceptions import ClientError
+
+        client.s3.delete_objects.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteObjects"
+        )
+
+        assert client.bulk_delete(["a", "b"]) == ["a", "b"]
+
+
+def _job_response(status):
+    return {"Job": {"Status": status, "UserMetadata": {}}}
+
+
+def _event(job_id, status):
+    return json.dumps(
+        {
+            "detail-type": "MediaConvert Job State Change",
+            "detail": {"jobId": job_id, "status": status},
+        }
+    )
+
+
+class TestWaitForCompletion:
+    """Tests for wait_for_completion."""
+
+    def test_polling_without_queue(self, client):
+        """Test GetJob is polled until a terminal status."""
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.side_effect = [
+            _job_response("PROGRESSING"),
+            _job_response("COMPLETE"),
+        ]
+
+        with patch("vco.converter.mediaconvert.time.sleep") as mock_sleep:
+            job = client.wait_for_completion("job-1", poll_interval=5)
+
+        assert job.status == "COMPLETE"
+        mock_sleep.assert_called_once_with(5)
+
+    def test_event_path_ignores_other_jobs(self, mock_session):
+        """Test the queue is read until this job's terminal event arrives."""
+        client = MediaConvertClient(
+            region="ap-northeast-1",
+            s3_bucket="test-bucket",
+            role_arn="arn:aws:iam::123456789012:role/test",
+            notification_queue_url="https://sqs.example/queue",
+        )
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.side_effect = [
+            _job_response("PROGRESSING"),
+            _job_response("COMPLETE"),
+        ]
+        client.sqs = MagicMock()
+        client.sqs.receive_message.side_effect = [
+            {"Messages": [{"Body": _event("job-2", "COMPLETE"), "ReceiptHandle": "r0"}]},
+            {
+                "Messages": [
+                    {"Body": "not json", "ReceiptHandle": "r1"},
+                    {"Body": _event("job-1", "PROGRESSING"), "ReceiptHandle": "r2"},
+                    {"Body": _event("job-1", "COMPLETE"), "ReceiptHandle": "r3"},
+                ]
+            },
+        ]
+
+        job = client.wait_for_completion("job-1")
+
+        assert job.status == "COMPLETE"
+        assert client.mediaconvert.get_job.call_count == 2
+        deleted = [c.kwargs["ReceiptHandle"] for c in client.sqs.delete_message.call_args_list]
+        assert deleted == ["r1", "r2", "r3"]
+        client.sqs.change_message_visibility.assert_called_once_with(
+            QueueUrl="https://sqs.example/queue", ReceiptHandle="r0", VisibilityTimeout=0
+        )
+
+    def test_event_path_other_jobs_events(self, mock_session):
+        """Test other jobs' events are consumed or released, never left in flight."""
+        client = MediaConvertClient(
+            region="ap-northeast-1",
+            s3_bucket="test-bucket",
+            role_arn="arn:aws:iam::123456789012:role/test",
+            notification_queue_url="https://sqs.example/queue",
+        )
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.side_effect = [
+            _job_response("PROGRESSING"),
+            _job_response("COMPLETE"),
+        ]
+        client.sqs = MagicMock()
+        orphan_receives = str(mediaconvert.SQS_MAX_EVENT_RECEIVES)
+        client.sqs.receive_message.return_value = {
+            "Messages": [
+                {"Body": _event("job-2", "PROGRESSING"), "ReceiptHandle": "r0"},
+                {
+                    "Body": _event("job-3", "COMPLETE"),
+                    "ReceiptHandle": "r1",
+                    "Attributes": {"ApproximateReceiveCount": "2"},
+                },
+                {
+                    "Body": _event("job-4", "ERROR"),
+                    "ReceiptHandle": "r2",
+                    "Attributes": {"ApproximateReceiveCount": orphan_receives},
+                },
+                {"Body": _event("job-1", "COMPLETE"), "ReceiptHandle": "r3"},
+            ]
+        }
+
+        client.wait_for_completion("job-1")
+
+        deleted = [c.kwargs["ReceiptHandle"] for c in client.sqs.delete_message.call_args_list]
+        assert deleted == ["r0", "r2", "r3"]
+        released = [
+            c.kwargs["ReceiptHandle"] for c in client.sqs.change_message_visibility.call_args_list
+        ]
+        assert released == ["r1"]
+
+    def test_event_path_hands_event_to_other_waiter(self, mock_session):
+        """Test a terminal event received by one waiter reaches the job's waiter."""
+        client = MediaConvertClient(
+            region="ap-northeast-1",
+            s3_bucket="test-bucket",
+            role_arn="arn:aws:iam::123456789012:role/test",
+            notification_queue_url="https://sqs.example/queue",
+        )
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.side_effect = [
+            _job_response("PROGRESSING"),
+            _job_response("COMPLETE"),
+        ]
+        client.sqs = MagicMock()
+        client.sqs.receive_message.side_effect = AssertionError("queue should not be read")
+        # While job-1 is waited on, the waiter for job-2 receives job-1's event
+        client._event_waiters.update({"job-1", "job-2"})
+        client._dispatch_job_event(
+            {"Body": _event("job-1", "COMPLETE"), "ReceiptHandle": "r0"}, "job-2"
+        )
+
+        job = client.wait_for_completion("job-1")
+
+        assert job.status == "COMPLETE"
+        client.sqs.delete_message.assert_called_once_with(
+            QueueUrl="https://sqs.example/queue", ReceiptHandle="r0"
+        )
+        assert not client._terminal_events
+
+    def test_event_path_already_finished(self, mock_session):
+        """Test a job that finished before waiting returns without reading the queue."""
+        client = MediaConvertClient(
+            region="ap-northeast-1",
+            s3_bucket="test-bucket",
+            role_arn="arn:aws:iam::123456789012:role/test",
+            notification_queue_url="https://sqs.example/queue",
+        )
+        client.mediaconvert = MagicMock()
+        client.mediaconvert.get_job.return_value = _job_response("ERROR")
+        client.sqs = MagicMock()
+
+        job = client.wait_for_completion("job-1")
+
+        assert job.status == "ERROR"
+        client.sqs.receive_message.assert_not_called()
+
+
+class TestConcurrentJobCalls:
+    """Tests for concurrent submit/list helpers."""
+
+    def test_submit_jobs_preserves_order(self, client):
+        """Test results line up with the input and failures are returned."""
+        client.mediaconvert = MagicMock()
+
+        def create_job(**kwargs):
+            uuid = kwargs["UserMetadata"]["source_video_uuid"]
+            if uuid == "bad":
+                raise RuntimeError("quota")
+            return {"Job": {"Id": f"job-{uuid}"}}
+
+        client.mediaconvert.create_job.side_effect = create_job
+        jobs = [
+            {"source_video_uuid": u, "source_s3_key": f"in/{u}", "output_s3_key": f"out/{u}"}
+            for u in ("a", "bad", "c")
+        ]
+
+        results = client.submit_jobs(jobs)
+
+        assert results[0].job_id == "job-a"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].job_id == "job-c"
+
+    def _paginate(self, client, pages):
+        client.mediaconvert = MagicMock()
+        paginator = client.mediaconvert.get_paginator.return_value
+        paginator.paginate.return_value = iter(pages)
+        return paginator
+
+    def test_list_jobs_preserves_order(self, client):
+        """Test list_jobs hydrates every job in listing order across pages."""
+        paginator = self._paginate(
+            client,
+            [
+                {"Jobs": [{"Id": "job-0"}, {"Id": "job-1"}]},
+                {"Jobs": [{"Id": "job-2"}, {"Id": "job-3"}]},
+            ],
+        )
+        client.mediaconvert.get_job.side_effect = lambda **kw: _job_response("COMPLETE")
+
+        jobs = list(client.list_jobs(status="COMPLETE"))
+
+        assert [job.job_id for job in jobs] == ["job-0", "job-1", "job-2", "job-3"]
+        paginator.paginate.assert_called_once_with(
+            Order="DESCENDING",
+            PaginationConfig={"PageSize": 20, "MaxItems": 20},
+            Status="COMPLETE",
+        )
+
+    def test_list_jobs_without_hydrate(self, client):
+        """Test hydrate=False builds jobs from the listing without GetJob."""
+        self._paginate(
+            client,
+            [
+                {
+                    "Jobs": [
+                        {
+                            "Id": "job-0",
+                            "Status": "ERROR",
+                            "ErrorMessage": "bad input",
+                            "UserMetadata": {"quality_preset": "high"},
+                        }
+                    ]
+                }
+            ],
+        )
+
+        jobs = list(client.list_jobs(hydrate=False, max_results=None))
+
+        assert jobs[0].job_id == "job-0"
+        assert jobs[0].error_message == "bad input"
+        assert jobs[0].quality_preset == "high"
+        client.mediaconvert.get_job.assert_not_called()
+
+    def test_list_jobs_is_lazy(self, client):
+        """Test later pages are not fetched when the caller stops early."""
+        pages_read = []
+
+        def pages():
+            for i in range(3):
+                pages_read.append(i)
+                yield {"Jobs": [{"Id": f"job-{i}", "Status": "COMPLETE"}]}
+
+        self._paginate(client, pages())
+
+        first = next(client.list_jobs(hydrate=False))
+
+        assert first.job_id == "job-0"
+        assert pages_read == [0]
+
+    def test_list_jobs_empty(self, client):
+        """Test an empty listing makes no GetJob calls."""
+        self._paginate(client, [{"Jobs": []}])
+
+        assert list(client.list_jobs()) == []
+        client.mediaconvert.get_job.assert_not_called()
+
+
+class TestEstimateCost:
+    """Tests for estimate_cost."""
+
+    @pytest.mark.parametrize(
+        "resolution,per_minute",
+        [
+            ((640, 480), 0.0075),
+            ((1280, 720), 0.0075),
+            ((1281, 720), 0.015),
+            ((1920, 1080), 0.015),
+            ((3840, 2160), 0.030),
+        ],
+    )
+    def test_tier_boundaries(self, client, resolution, per_minute):
+        """Test each resolution maps to the right pricing tier."""
+        assert client.estimate_cost(600, resolution) == round(10 * per_minute, 4)
+
+    def test_rounds_like_per_minute_formula(self, client):
+        """Test short durations round from the per-minute price, not a per-second one."""
+        assert client.estimate_cost(1.3, (3840, 2160)) == round(1.3 / 60 * 0.030, 4) == 0.0006
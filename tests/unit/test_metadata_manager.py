@@ -4,12 +4,17 @@ Tests metadata extraction, application, and file operations.
 Target coverage: 50%+ (ファイル I/O)
 """
 
+import asyncio
 import json
-from datetime import datetime
-from unittest.mock import patch
+import os
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from vco.metadata import manager as metadata_manager
 from vco.metadata.manager import MetadataManager, VideoMetadata
 
 
@@ -161,7 +166,7 @@ class TestMetadataManager:
         manager = MetadataManager()
 
         # Mock ffprobe to avoid actual execution
-        with patch.object(manager, "_run_ffprobe", return_value={"format": {"tags": {}}}):
+        with patch.object(manager, "_run_ffprobe_format", return_value={"format": {"tags": {}}}):
             metadata = manager.extract_metadata(video_path)
 
         assert isinstance(metadata, VideoMetadata)
@@ -185,13 +190,24 @@ class TestMetadataManager:
             }
         }
 
-        with patch.object(manager, "_run_ffprobe", return_value=ffprobe_data):
+        with patch.object(manager, "_run_ffprobe_format", return_value=ffprobe_data):
             metadata = manager.extract_metadata(video_path)
 
         assert metadata.capture_date == datetime(2024, 6, 15, 10, 30, 0)
         assert metadata.title == "Test Video"
         assert metadata.description == "A test video"
 
+    def test_build_metadata_skips_malformed_date_tag(self):
+        """Test a creation_time that fails to parse falls back to the date tag."""
+        video_path = MagicMock()
+        video_path.stat.return_value.st_birthtime = 0
+        manager = MetadataManager()
+        probe_data = {"format": {"tags": {"creation_time": "garbage", "date": "2024-06-15"}}}
+
+        metadata = manager._build_metadata(video_path, probe_data)
+
+        assert metadata.capture_date == datetime(2024, 6, 15)
+
     def test_save_metadata_json(self, tmp_path):
         """Test save_metadata_json creates JSON file."""
         manager = MetadataManager()
@@ -285,6 +301,100 @@ class TestMetadataManager:
         stat = video_path.stat()
         assert abs(stat.st_mtime - mod_date.timestamp()) < 1
 
+    def test_set_file_dates_copies_stat_times(self, tmp_path):
+        """Test set_file_dates copies times from a stat result in nanoseconds."""
+        source = tmp_path / "source.mp4"
+        target = tmp_path / "target.mp4"
+        source.write_bytes(b"source")
+        target.write_bytes(b"target")
+        os.utime(source, ns=(1_700_000_000_123_456_789, 1_700_000_100_987_654_321))
+
+        manager = MetadataManager()
+        result = manager.set_file_dates(target, stat_result=source.stat())
+
+        assert result is True
+        assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    def test_set_file_dates_creation_only_missing_file(self, tmp_path):
+        """Test a missing file raises instead of being created by the touch fallback."""
+        manager = MetadataManager()
+        missing = tmp_path / "missing.mp4"
+
+        with patch("vco.metadata.manager.subprocess.run") as run:
+            with pytest.raises(FileNotFoundError):
+                manager.set_file_dates(missing, creation_date=datetime(2024, 1, 1))
+
+        run.assert_not_called()
+        assert not missing.exists()
+
+    def test_set_creation_dates_single_process(self, tmp_path):
+        """Test several files are dated by one SetFile call."""
+        paths = [tmp_path / f"video{i}.mp4" for i in range(3)]
+        for path in paths:
+            path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch(
+            "vco.metadata.manager.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0),
+        ) as run:
+            result = manager.set_creation_dates(paths, datetime(2024, 6, 15, 10, 30, 0))
+
+        assert result is True
+        run.assert_called_once()
+        assert run.call_args.args[0] == [
+            "SetFile",
+            "-d",
+            "06/15/2024 10:30:00",
+            *(str(p) for p in paths),
+        ]
+
+    def test_set_creation_dates_touch_fallback(self, tmp_path):
+        """Test touch is used for all files when SetFile fails."""
+        paths = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for path in paths:
+            path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch(
+            "vco.metadata.manager.subprocess.run",
+            side_effect=[subprocess.CompletedProcess([], 1), subprocess.CompletedProcess([], 0)],
+        ) as run:
+            result = manager.set_creation_dates(paths, datetime(2024, 6, 15, 10, 30, 0))
+
+        assert result is True
+        assert run.call_args.args[0] == ["touch", "-t", "202406151030.00", *map(str, paths)]
+
+    def test_set_creation_dates_native_first(self, tmp_path):
+        """Test SetFile only runs for files the native call could not date."""
+        paths = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        for path in paths:
+            path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with (
+            patch.object(
+                metadata_manager,
+                "_set_creation_date_native",
+                side_effect=lambda path, date: path.name == "a.mp4",
+            ),
+            patch(
+                "vco.metadata.manager.subprocess.run",
+                return_value=subprocess.CompletedProcess([], 0),
+            ) as run,
+        ):
+            result = manager.set_creation_dates(paths, datetime(2024, 6, 15, 10, 30, 0))
+
+        assert result is True
+        assert run.call_args.args[0] == ["SetFile", "-d", "06/15/2024 10:30:00", str(paths[1])]
+
+    def test_set_creation_dates_missing_file(self, tmp_path):
+        """Test set_creation_dates raises for a missing file."""
+        manager = MetadataManager()
+
+        with pytest.raises(FileNotFoundError):
+            manager.set_creation_dates([tmp_path / "missing.mp4"], datetime(2024, 1, 1))
+
     def test_copy_dates_from_original_file_not_found(self, tmp_path):
         """Test copy_dates_from_original raises error for non-existent files."""
         manager = MetadataManager()
@@ -309,6 +419,25 @@ class TestMetadataManager:
         assert result is True
         mock_set.assert_called_once()
 
+    def test_copy_dates_from_original_batch(self, tmp_path):
+        """Test the batch copy returns one result per pair in input order."""
+        pairs = [(tmp_path / f"original{i}.mp4", tmp_path / f"converted{i}.mp4") for i in range(4)]
+        manager = MetadataManager()
+
+        with patch.object(
+            manager,
+            "copy_dates_from_original",
+            side_effect=lambda original, converted: original.name != "original2.mp4",
+        ) as mock_copy:
+            results = manager.copy_dates_from_original_batch(pairs, max_workers=2)
+
+        assert results == [True, True, False, True]
+        assert mock_copy.call_count == 4
+
+    def test_copy_dates_from_original_batch_empty(self):
+        """Test the batch copy with no pairs does nothing."""
+        assert MetadataManager().copy_dates_from_original_batch([]) == []
+
     def test_apply_metadata_file_not_found(self, tmp_path):
         """Test apply_metadata raises error for non-existent file."""
         manager = MetadataManager()
@@ -329,6 +458,253 @@ class TestMetadataManager:
 
         assert result is True  # Nothing to apply
 
+    def test_apply_metadata_skips_when_already_tagged(self, tmp_path):
+        """Test no remux happens when the file already has the tags."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy content")
+        manager = MetadataManager()
+        metadata = VideoMetadata(
+            capture_date=datetime(2024, 6, 15, 10, 30, 0),
+            title="Beach",
+            location=(35.6762, 139.6503),
+        )
+        probe = {
+            "format": {
+                "tags": {
+                    "creation_time": "2024-06-15T10:30:00.000000Z",
+                    "title": "Beach",
+                    "com.apple.quicktime.location.ISO6709": "+35.6762+139.6503/",
+                }
+            }
+        }
+
+        with (
+            patch.object(manager, "_run_ffprobe_format", return_value=probe),
+            patch("vco.metadata.manager.subprocess.run") as run,
+        ):
+            assert manager.apply_metadata(video_path, metadata, skip_if_tagged=True) is True
+
+        run.assert_not_called()
+
+    def test_apply_metadata_failure_removes_temp_file(self, tmp_path):
+        """Test a failed FFmpeg run leaves the original and no temp file."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy content")
+        manager = MetadataManager()
+
+        def fail(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"partial")
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="error")
+
+        with patch("vco.metadata.manager.subprocess.run", side_effect=fail):
+            assert manager.apply_metadata(video_path, VideoMetadata(title="New")) is False
+
+        assert video_path.read_bytes() == b"dummy content"
+        assert not video_path.with_suffix(".temp.mp4").exists()
+
+    def test_apply_metadata_success_replaces_original(self, tmp_path):
+        """Test a successful remux replaces the original with the output."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy content")
+        manager = MetadataManager()
+
+        def remux(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"tagged content")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with (
+            patch.object(manager, "_run_ffprobe_format") as probe,
+            patch("vco.metadata.manager.subprocess.run", side_effect=remux),
+        ):
+            assert manager.apply_metadata(video_path, VideoMetadata(title="New")) is True
+
+        probe.assert_not_called()
+        assert video_path.read_bytes() == b"tagged content"
+        assert not video_path.with_suffix(".temp.mp4").exists()
+
+    def test_apply_metadata_command(self, tmp_path):
+        """Test the FFmpeg command copies streams and sets each tag."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy content")
+        manager = MetadataManager()
+        metadata = VideoMetadata(
+            capture_date=datetime(2024, 6, 15, 10, 30, 0),
+            title="Beach",
+            location=(35.6762, 139.6503),
+        )
+
+        with patch(
+            "vco.metadata.manager.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 1),
+        ) as run:
+            manager.apply_metadata(video_path, metadata)
+
+        temp_path = video_path.with_suffix(".temp.mp4")
+        assert run.call_args.args[0] == [
+            "ffmpeg",
+            "-i",
+            str(video_path),
+            "-c",
+            "copy",
+            "-metadata",
+            "creation_time=2024-06-15T10:30:00",
+            "-metadata",
+            "title=Beach",
+            "-metadata",
+            "com.apple.quicktime.location.ISO6709=+35.6762+139.6503/",
+            "-y",
+            str(temp_path),
+        ]
+
+
+class TestFfprobeCache:
+    """Tests for FFprobe result caching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty FFprobe cache."""
+        MetadataManager.clear_ffprobe_cache()
+        yield
+        MetadataManager.clear_ffprobe_cache()
+
+    def _completed(self, stdout='{"format": {}}', returncode=0):
+        return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="error")
+
+    def test_unchanged_file_probed_once(self, tmp_path):
+        """Test repeated probes of an unchanged file reuse the result."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch("vco.metadata.manager.subprocess.run", return_value=self._completed()) as run:
+            first = manager._run_ffprobe(video_path)
+            second = manager._run_ffprobe(video_path)
+
+        assert first == second == {"format": {}}
+        assert first is not second
+        run.assert_called_once()
+
+    def test_modified_file_probed_again(self, tmp_path):
+        """Test a change in size invalidates the cached result."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch("vco.metadata.manager.subprocess.run", return_value=self._completed()) as run:
+            manager._run_ffprobe(video_path)
+            video_path.write_bytes(b"dummy but longer")
+            manager._run_ffprobe(video_path)
+
+        assert run.call_count == 2
+
+    def test_failure_not_cached(self, tmp_path):
+        """Test a failed probe is retried on the next call."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch(
+            "vco.metadata.manager.subprocess.run",
+            side_effect=[self._completed(returncode=1), self._completed()],
+        ) as run:
+            with pytest.raises(RuntimeError):
+                manager._run_ffprobe(video_path)
+            assert manager._run_ffprobe(video_path) == {"format": {}}
+
+        assert run.call_count == 2
+
+    def test_probe_skips_fd_sweep(self, tmp_path):
+        """Test FFprobe is started without closing every inherited fd."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch("vco.metadata.manager.subprocess.run", return_value=self._completed()) as run:
+            manager._run_ffprobe(video_path)
+
+        assert run.call_args.kwargs["close_fds"] is False
+
+    def test_format_probe_reads_only_tags(self, tmp_path):
+        """Test the narrow probe skips streams and is cached separately."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+
+        with patch("vco.metadata.manager.subprocess.run", return_value=self._completed()) as run:
+            manager._run_ffprobe_format(video_path)
+            manager._run_ffprobe(video_path)
+
+        assert run.call_count == 2
+        narrow_cmd = run.call_args_list[0].args[0]
+        assert "-show_streams" not in narrow_cmd
+        assert "format_tags=creation_time,date," in " ".join(narrow_cmd)
+        assert "-show_streams" in run.call_args_list[1].args[0]
+
+    def test_format_probe_matches_json_parse(self, tmp_path):
+        """Test the tag scan agrees with json.loads, including escapes."""
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+        manager = MetadataManager()
+        tags = {
+            "creation_time": "2024-06-15T10:30:00.000000Z",
+            "title": 'Say "hi" \\ \u6771\u4eac',
+            "description": "line1\nline2",
+            "com.apple.quicktime.location.ISO6709": "+35.6762+139.6503/",
+        }
+        stdout = json.dumps({"format": {"tags": tags}}, indent=4)
+
+        with patch("vco.metadata.manager.subprocess.run", return_value=self._completed(stdout)):
+            result = manager._run_ffprobe_format(video_path)
+
+        assert result == json.loads(stdout)
+
+
+class TestExtractMetadataBatch:
+    """Tests for concurrent metadata extraction."""
+
+    def test_batch_preserves_order_and_limits_concurrency(self, tmp_path):
+        """Test results follow input order and FFprobe runs are bounded."""
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"video{i}.mp4"
+            path.write_bytes(b"dummy")
+            paths.append(path)
+
+        manager = MetadataManager()
+        running = 0
+        peak = 0
+
+        async def fake_probe(video_path):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if video_path.name == "video3.mp4":
+                raise RuntimeError("FFprobe failed")
+            return {"format": {"tags": {"title": video_path.stem}}}
+
+        with (
+            patch.object(manager, "_run_ffprobe_async", side_effect=fake_probe),
+            patch.object(manager, "_build_metadata", side_effect=lambda path, data: data),
+        ):
+            results = asyncio.run(manager.extract_metadata_batch(paths, concurrency=2))
+
+        assert peak == 2
+        assert results[3] is None
+        titles = [r["format"]["tags"]["title"] for i, r in enumerate(results) if i != 3]
+        assert titles == ["video0", "video1", "video2", "video4", "video5"]
+
+    def test_batch_missing_file(self, tmp_path):
+        """Test a missing file raises before any FFprobe runs."""
+        manager = MetadataManager()
+
+        with patch.object(manager, "_run_ffprobe_async") as mock_probe:
+            with pytest.raises(FileNotFoundError):
+                asyncio.run(manager.extract_metadata_batch([tmp_path / "missing.mp4"]))
+
+        mock_probe.assert_not_called()
+
 
 class TestMetadataManagerParsing:
     """Tests for MetadataManager parsing methods."""
@@ -359,6 +735,29 @@ class TestMetadataManagerParsing:
 
         assert result == datetime(2024, 6, 15)
 
+    def test_parse_date_with_offset(self):
+        """Test _parse_date keeps an explicit UTC offset."""
+        manager = MetadataManager()
+
+        result = manager._parse_date("2024-06-15T10:30:00+09:00")
+
+        assert result == datetime(2024, 6, 15, 10, 30, 0, tzinfo=timezone(timedelta(hours=9)))
+
+    def test_parse_date_short_fraction(self):
+        """Test _parse_date pads short fractional seconds like strptime."""
+        manager = MetadataManager()
+
+        result = manager._parse_date("2024-06-15T10:30:00.5Z")
+
+        assert result == datetime(2024, 6, 15, 10, 30, 0, 500000)
+
+    def test_parse_date_invalid_day(self):
+        """Test _parse_date rejects dates that do not exist."""
+        manager = MetadataManager()
+
+        with pytest.raises(ValueError):
+            manager._parse_date("2024-02-30")
+
     def test_parse_date_invalid_format(self):
         """Test _parse_date raises ValueError for invalid format."""
         manager = MetadataManager()
@@ -396,6 +795,14 @@ class TestMetadataManagerParsing:
         assert abs(result[0] - (-33.8688)) < 0.0001
         assert abs(result[1] - 151.2093) < 0.0001
 
+    def test_parse_location_with_altitude(self):
+        """Test _parse_location ignores a trailing altitude."""
+        manager = MetadataManager()
+
+        result = manager._parse_location("+35.6762+139.6503+010.000/")
+
+        assert result == (35.6762, 139.6503)
+
     def test_parse_location_invalid(self):
         """Test _parse_location returns None for invalid format."""
         manager = MetadataManager()
@@ -445,3 +852,18 @@ class TestMetadataJsonRoundtrip:
         assert loaded.title == original.title
         assert loaded.description == original.description
         assert loaded.location == original.location
+
+    def test_roundtrip_without_orjson(self, tmp_path):
+        """Test the stdlib json fallback writes UTF-8 and reads it back."""
+        manager = MetadataManager()
+        original = VideoMetadata(title="東京の夜", albums=["旅行"])
+        json_path = tmp_path / "metadata.json"
+
+        with patch("vco.utils.json_io._HAS_ORJSON", False):
+            assert manager.save_metadata_json(original, json_path) is True
+            loaded = manager.load_metadata_json(json_path)
+
+        assert "東京の夜" in json_path.read_text(encoding="utf-8")
+        assert loaded is not None
+        assert loaded.title == original.title
+        assert loaded.albums == original.albums
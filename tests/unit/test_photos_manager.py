@@ -4,12 +4,15 @@ Tests for video extraction from Photos library.
 Validates: Requirements 1.1, 1.2, 1.3
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from vco.models.types import VideoInfo
-from vco.photos.manager import PhotosAccessManager
+from vco.photos.manager import MAX_SCAN_WORKERS, PhotosAccessManager
 
 
 class MockExifInfo:
@@ -687,6 +690,42 @@ class TestCodecExtraction:
         assert result is not None
         assert result.codec == "unknown"
 
+    def test_exiftool_not_read_concurrently(self, tmp_path):
+        """Test parallel extraction reads exiftool one photo at a time."""
+        manager = PhotosAccessManager()
+        state_lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+
+        class SlowExiftoolPhoto(MockPhotoInfo):
+            @property
+            def exiftool(self):
+                with state_lock:
+                    state["active"] += 1
+                    state["max_active"] = max(state["max_active"], state["active"])
+                time.sleep(0.01)
+                with state_lock:
+                    state["active"] -= 1
+                return self._exiftool
+
+        photos = []
+        for i in range(MAX_SCAN_WORKERS * 2):
+            video_path = tmp_path / f"video{i}.mov"
+            video_path.write_bytes(b"\0")
+            photos.append(
+                SlowExiftoolPhoto(
+                    uuid=f"video{i}",
+                    path=str(video_path),
+                    exif_info=MockExifInfo(codec=None, duration=60.0),
+                    exiftool={"CompressorID": "hvc1"},
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+            results = list(executor.map(manager._extract_video_info, photos))
+
+        assert state["max_active"] == 1
+        assert [r.codec for r in results] == ["hvc1"] * len(photos)
+
 
 class TestFileSizeExtraction:
     """Tests for file size extraction."""
@@ -126,7 +126,7 @@ class TestExtractCodec:
 
     def test_extract_codec_fallback_to_ffprobe(self, tmp_path):
         """Test codec extraction falls back to ffprobe."""
-        manager = PhotosAccessManager()
+        manager = PhotosAccessManager(exif_bruteforce=True)
 
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
@@ -140,6 +140,23 @@ class TestExtractCodec:
 
         assert codec == "h264"
 
+    def test_extract_codec_skips_ffprobe_by_default(self, tmp_path):
+        """Test ffprobe is not run unless exif_bruteforce is enabled."""
+        manager = PhotosAccessManager()
+
+        video_path = tmp_path / "test.mp4"
+        video_path.write_bytes(b"dummy")
+
+        mock_photo = MagicMock()
+        mock_photo.exiftool = {}
+        mock_photo.path = str(video_path)
+
+        with patch.object(manager, "_get_codec_from_ffprobe") as mock_probe:
+            codec = manager._extract_codec(mock_photo)
+
+        assert codec == "unknown"
+        mock_probe.assert_not_called()
+
     def test_extract_codec_unknown(self):
         """Test codec extraction returns unknown when no source available."""
         manager = PhotosAccessManager()
@@ -221,6 +238,95 @@ class TestGetCodecFromFFprobe:
         assert codec is None
 
 
+class TestBatchGetCodecs:
+    """Tests for _batch_get_codecs and the scan-wide codec probe."""
+
+    def test_empty_paths_does_not_probe(self):
+        """Test no ffprobe runs when there is nothing to probe."""
+        manager = PhotosAccessManager()
+
+        with patch.object(manager, "_get_codec_from_ffprobe") as mock_probe:
+            assert manager._batch_get_codecs([]) == {}
+
+        mock_probe.assert_not_called()
+
+    def test_maps_detected_codecs_by_path(self, tmp_path):
+        """Test results are keyed by path and failed probes are omitted."""
+        manager = PhotosAccessManager()
+        paths = [tmp_path / f"video_{i}.mov" for i in range(3)]
+        detected = {paths[0]: "hevc", paths[2]: "h264"}
+
+        with patch.object(manager, "_get_codec_from_ffprobe", side_effect=detected.get):
+            assert manager._batch_get_codecs(paths) == detected
+
+    def test_get_all_videos_probes_unknown_codecs_in_one_batch(self, tmp_path):
+        """Test scans defer ffprobe and run it once for all unknown local files."""
+        manager = PhotosAccessManager(exif_bruteforce=True)
+        paths = [tmp_path / "known.mov", tmp_path / "unknown.mov"]
+        for path in paths:
+            path.write_bytes(b"dummy")
+
+        photos = []
+        for path, codec in zip(paths, ("hevc", None)):
+            photo = MagicMock()
+            photo.uuid = path.stem
+            photo.path = str(path)
+            photo.exif_info = MagicMock(codec=codec)
+            photo.exiftool = {}
+            photos.append(photo)
+        manager._photosdb = MagicMock()
+        manager._photosdb.photos.return_value = photos
+
+        with (
+            patch.object(manager, "_get_codec_from_ffprobe") as mock_probe,
+            patch.object(
+                manager, "_batch_get_codecs", return_value={paths[1]: "h264"}
+            ) as mock_batch,
+        ):
+            videos = manager.get_all_videos()
+
+        mock_probe.assert_not_called()
+        mock_batch.assert_called_once_with([paths[1]])
+        assert [v.codec for v in videos] == ["hevc", "h264"]
+
+    def test_get_all_videos_skips_probe_by_default(self, tmp_path):
+        """Test scans leave codecs unknown without exif_bruteforce."""
+        manager = PhotosAccessManager()
+        path = tmp_path / "unknown.mov"
+        path.write_bytes(b"dummy")
+
+        photo = MagicMock()
+        photo.uuid = path.stem
+        photo.path = str(path)
+        photo.exif_info = MagicMock(codec=None)
+        photo.exiftool = {}
+        manager._photosdb = MagicMock()
+        manager._photosdb.photos.return_value = [photo]
+
+        with patch.object(manager, "_batch_get_codecs") as mock_batch:
+            videos = manager.get_all_videos()
+
+        mock_batch.assert_not_called()
+        assert [v.codec for v in videos] == ["unknown"]
+
+    def test_get_all_videos_keeps_library_order_and_skips_failures(self):
+        """Test concurrent extraction returns videos in library order."""
+        manager = PhotosAccessManager()
+        photos = [MagicMock(uuid=f"uuid-{i}") for i in range(20)]
+        manager._photosdb = MagicMock()
+        manager._photosdb.photos.return_value = photos
+
+        def extract(photo, probe_codec=True):
+            if photo.uuid == "uuid-3":
+                return None
+            return VideoInfo(uuid=photo.uuid, filename=f"{photo.uuid}.mov", codec="hevc")
+
+        with patch.object(manager, "_extract_video_info", side_effect=extract):
+            videos = manager.get_all_videos()
+
+        assert [v.uuid for v in videos] == [p.uuid for p in photos if p.uuid != "uuid-3"]
+
+
 class TestExtractVideoInfo:
     """Tests for _extract_video_info method."""
 
@@ -320,6 +426,41 @@ class TestExtractVideoInfo:
         assert video_info is not None
         assert video_info.filename == "video_no-filename-uuid"
 
+    def test_extract_video_info_reads_exif_once(self, tmp_path):
+        """Test exif_info and exiftool are each read once per video."""
+        manager = PhotosAccessManager()
+
+        video_path = tmp_path / "test.mov"
+        video_path.write_bytes(b"dummy video content")
+
+        mock_photo = MagicMock()
+        mock_photo.uuid = "exif-uuid"
+        mock_photo.path = str(video_path)
+        mock_photo.original_filename = "test.mov"
+        mock_photo.iscloudasset = False
+        exif_info = PropertyMock(
+            return_value=MagicMock(codec=None, duration=12.0, bit_rate=None, fps=None)
+        )
+        exiftool = PropertyMock(
+            return_value={
+                "CompressorID": "hvc1",
+                "AvgBitrate": 8000000,
+                "VideoFrameRate": 29.97,
+            }
+        )
+        type(mock_photo).exif_info = exif_info
+        type(mock_photo).exiftool = exiftool
+
+        video_info = manager._extract_video_info(mock_photo)
+
+        assert video_info is not None
+        assert video_info.codec == "hvc1"
+        assert video_info.duration == 12.0
+        assert video_info.bitrate == 8000000
+        assert video_info.frame_rate == 29.97
+        exif_info.assert_called_once_with()
+        exiftool.assert_called_once_with()
+
     def test_extract_video_info_exception(self):
         """Test extracting video info handles exception."""
         manager = PhotosAccessManager()
@@ -560,6 +701,24 @@ class TestGetVideosByDateRange:
 
         assert len(result) == 1
 
+    def test_excluded_videos_are_not_extracted(self):
+        """Test video info is only extracted for videos inside the range."""
+        photos = [
+            MagicMock(uuid="1", date=datetime(2024, 1, 1)),
+            MagicMock(uuid="2", date=datetime(2024, 6, 1)),
+        ]
+        manager = PhotosAccessManager()
+        manager._photosdb = MagicMock()
+        manager._photosdb.photos.return_value = photos
+
+        with patch.object(manager, "_extract_video_info") as mock_extract:
+            mock_extract.return_value.codec = "h264"
+            mock_extract.return_value.capture_date = datetime(2024, 6, 1)
+            result = manager.get_videos_by_date_range(from_date=datetime(2024, 3, 1), to_date=None)
+
+        assert len(result) == 1
+        mock_extract.assert_called_once_with(photos[1], probe_codec=False)
+
 
 class TestPhotosAccessError:
     """Tests for PhotosAccessError exception."""
@@ -741,6 +900,69 @@ class TestDeleteVideo:
             with pytest.raises(PhotosAccessError, match="Timeout"):
                 manager.delete_video("uuid-to-delete")
 
+    def test_delete_videos_runs_one_script(self):
+        """Test batch deletion spawns osascript once and maps results by UUID."""
+        manager = PhotosAccessManager()
+        uuids = ["uuid-1", "uuid-2", "uuid-3"]
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=(
+                    "deleted\n"
+                    'error: Photos got an error: Can\'t get media item id "uuid-2".\n'
+                    "error: Photos got an error: Access not allowed.\n"
+                ),
+                stderr="",
+            )
+            result = manager.delete_videos(uuids)
+
+        assert result == {"uuid-1": True, "uuid-2": True, "uuid-3": False}
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0][2]
+        assert all(f'"{uuid}"' in script for uuid in uuids)
+
+    def test_delete_videos_missing_result_is_failure(self):
+        """Test UUIDs without a result line are not reported as deleted."""
+        manager = PhotosAccessManager()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="deleted\n", stderr="")
+            result = manager.delete_videos(["uuid-1", "uuid-2"])
+
+        assert result == {"uuid-1": True, "uuid-2": False}
+
+    def test_delete_video_empty_output_raises(self):
+        """Test delete raises error when AppleScript prints no result."""
+        manager = PhotosAccessManager()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+            with pytest.raises(PhotosAccessError, match="no result"):
+                manager.delete_video("uuid-to-delete")
+
+    def test_delete_videos_empty_list(self):
+        """Test batch deletion with no UUIDs does not run osascript."""
+        manager = PhotosAccessManager()
+
+        with patch("subprocess.run") as mock_run:
+            assert manager.delete_videos([]) == {}
+
+        mock_run.assert_not_called()
+
+    def test_delete_video_reports_item_error(self):
+        """Test delete raises error when Photos rejects the item."""
+        manager = PhotosAccessManager()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout="error: Access not allowed.\n", stderr=""
+            )
+
+            with pytest.raises(PhotosAccessError, match="Access not allowed"):
+                manager.delete_video("uuid-to-delete")
+
 
 class TestAddToAlbums:
     """Tests for add_to_albums method."""
@@ -829,6 +1051,50 @@ class TestAddToAlbumByName:
         mock_photos_app.create_album.assert_called_once_with("New Album")
         mock_new_album.add.assert_called_once_with([mock_photo])
 
+    def test_album_lookup_is_cached(self):
+        """Test albums are listed once and created albums join the cache."""
+        import sys
+
+        mock_photoscript = MagicMock()
+        mock_photos_app = MagicMock()
+        mock_album = MagicMock()
+        mock_album.name = "Existing Album"
+        mock_new_album = MagicMock()
+        mock_photos_app.albums.return_value = [mock_album]
+        mock_photos_app.create_album.return_value = mock_new_album
+        mock_photoscript.PhotosLibrary.return_value = mock_photos_app
+
+        with patch.dict(sys.modules, {"photoscript": mock_photoscript}):
+            manager = PhotosAccessManager()
+            for _ in range(3):
+                manager._add_to_album_by_name(MagicMock(), "Existing Album")
+                manager._add_to_album_by_name(MagicMock(), "New Album")
+
+        mock_photoscript.PhotosLibrary.assert_called_once_with()
+        mock_photos_app.albums.assert_called_once_with()
+        mock_photos_app.create_album.assert_called_once_with("New Album")
+        assert mock_album.add.call_count == 3
+        assert mock_new_album.add.call_count == 3
+
+    def test_refresh_album_cache_reloads_albums(self):
+        """Test refresh_album_cache forces the next lookup to list albums again."""
+        import sys
+
+        mock_photoscript = MagicMock()
+        mock_photos_app = MagicMock()
+        mock_album = MagicMock()
+        mock_album.name = "Album"
+        mock_photos_app.albums.return_value = [mock_album]
+        mock_photoscript.PhotosLibrary.return_value = mock_photos_app
+
+        with patch.dict(sys.modules, {"photoscript": mock_photoscript}):
+            manager = PhotosAccessManager()
+            manager._add_to_album_by_name(MagicMock(), "Album")
+            manager.refresh_album_cache()
+            manager._add_to_album_by_name(MagicMock(), "Album")
+
+        assert mock_photos_app.albums.call_count == 2
+
 
 class TestExportVideo:
     """Tests for export_video method."""
@@ -0,0 +1,102 @@
+"""Unit tests for retry helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from botocore.exceptions import ClientError
+
+from vco.utils.retry import is_retryable_error, with_backoff
+
+
+def _http_error(status: int) -> requests.exceptions.HTTPError:
+    response = MagicMock()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+def _client_error(code: str, status: int = 400) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "GetJob",
+    )
+
+
+class TestIsRetryableError:
+    """Tests for is_retryable_error."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_throttling_and_server_errors_retryable(self, status):
+        """Test 429 and 5xx responses are retried."""
+        assert is_retryable_error(_http_error(status)) is True
+
+    @pytest.mark.parametrize("status", [400, 403, 404])
+    def test_client_errors_not_retryable(self, status):
+        """Test 4xx responses other than 429 are not retried."""
+        assert is_retryable_error(_http_error(status)) is False
+
+    def test_connection_error_retryable(self):
+        """Test connection failures are retried."""
+        assert is_retryable_error(requests.exceptions.ConnectionError()) is True
+
+    def test_boto_throttling_retryable(self):
+        """Test botocore throttling codes are retried."""
+        assert is_retryable_error(_client_error("ThrottlingException")) is True
+        assert is_retryable_error(_client_error("AccessDeniedException", 403)) is False
+
+    def test_non_idempotent_skips_server_errors(self):
+        """Test non-idempotent calls skip errors that can follow a sent request."""
+        assert is_retryable_error(_http_error(503), idempotent=False) is False
+        assert is_retryable_error(requests.exceptions.ReadTimeout(), idempotent=False) is False
+        assert is_retryable_error(requests.exceptions.ConnectionError(), idempotent=False) is False
+        assert is_retryable_error(requests.exceptions.ConnectTimeout(), idempotent=False) is True
+        assert is_retryable_error(_http_error(429), idempotent=False) is True
+
+    def test_other_exceptions_not_retryable(self):
+        """Test unrelated exceptions are not retried."""
+        assert is_retryable_error(ValueError("bad")) is False
+
+
+class TestWithBackoff:
+    """Tests for with_backoff."""
+
+    def test_returns_on_first_success(self):
+        """Test no sleep when the call succeeds."""
+        sleep = MagicMock()
+        assert with_backoff(lambda: "ok", sleep=sleep) == "ok"
+        sleep.assert_not_called()
+
+    def test_retries_transient_then_succeeds(self):
+        """Test transient failures are retried until success."""
+        fn = MagicMock(side_effect=[_http_error(503), _http_error(429), "ok"])
+        sleep = MagicMock()
+
+        assert with_backoff(fn, sleep=sleep) == "ok"
+        assert fn.call_count == 3
+        assert sleep.call_count == 2
+
+    def test_gives_up_after_max_attempts(self):
+        """Test the last error is raised once attempts are exhausted."""
+        fn = MagicMock(side_effect=_http_error(503))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            with_backoff(fn, max_attempts=3, sleep=MagicMock())
+        assert fn.call_count == 3
+
+    def test_non_retryable_raises_immediately(self):
+        """Test non-transient errors are not retried."""
+        fn = MagicMock(side_effect=_http_error(404))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            with_backoff(fn, sleep=MagicMock())
+        assert fn.call_count == 1
+
+    def test_delay_bounded_by_cap(self):
+        """Test jittered delays never exceed the cap."""
+        fn = MagicMock(side_effect=[_http_error(503)] * 5 + ["ok"])
+        sleep = MagicMock()
+
+        with_backoff(fn, max_attempts=6, base=1.0, cap=2.0, sleep=sleep)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert all(0 <= d <= 2.0 for d in delays)
@@ -9,6 +9,8 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from vco.metadata.manager import VideoMetadata
 from vco.models.types import ConversionResult
 from vco.quality.checker import QualityResult
@@ -264,6 +266,33 @@ class TestReviewServiceLoadSave:
         assert result is True
         assert queue_path.parent.exists()
 
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_save_and_load_roundtrip_non_ascii(self, tmp_path, has_orjson):
+        """Test queue roundtrip with and without orjson keeps non-ASCII text."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+
+        queue_path = tmp_path / "queue.json"
+        service = ReviewService(
+            photos_manager=MagicMock(), metadata_manager=MagicMock(), queue_path=queue_path
+        )
+        item = ReviewItem(
+            id="rev_1",
+            original_uuid="uuid-1",
+            original_path=tmp_path / "旅行.mov",
+            converted_path=tmp_path / "旅行_h265.mp4",
+            conversion_date="2024-12-15T12:00:00",
+            quality_result={"ssim_score": 0.95},
+            metadata={"albums": ["家族"]},
+        )
+
+        with patch("vco.utils.json_io._HAS_ORJSON", has_orjson):
+            assert service.save_queue(ReviewQueue(items=[item])) is True
+            loaded = service.load_queue()
+
+        assert "旅行.mov" in queue_path.read_text(encoding="utf-8")
+        assert loaded.items[0].to_dict() == item.to_dict()
+
 
 class TestReviewServiceAddToQueue:
     """Tests for add_to_queue method."""
@@ -10,8 +10,11 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from vco.analyzer.analyzer import ConversionCandidate
 from vco.models.types import VideoInfo, VideoStatus
+from vco.services import scan as scan_module
 from vco.services.scan import ScanResult, ScanService, ScanSummary
 
 
@@ -172,6 +175,15 @@ class TestScanMethod:
         assert result.filter is not None
         assert result.filter["from_date"] is not None
 
+    @pytest.mark.parametrize("exif_bruteforce", [True, False])
+    def test_exif_bruteforce_passed_to_default_manager(self, exif_bruteforce):
+        """Test that exif_bruteforce reaches the default PhotosAccessManager."""
+        with patch.object(scan_module, "PhotosAccessManager") as mock_manager:
+            service = ScanService(exif_bruteforce=exif_bruteforce)
+
+        mock_manager.assert_called_once_with(exif_bruteforce=exif_bruteforce)
+        assert service.photos_manager is mock_manager.return_value
+
 
 class TestCandidateSerialization:
     """Tests for candidate serialization/deserialization."""
@@ -230,7 +242,15 @@ class TestCandidateSerialization:
             assert loaded.candidates[0].video.uuid == "video1"
             assert loaded.candidates[0].status == VideoStatus.PENDING
 
-    def test_load_candidates_converts_status_string_to_enum(self):
+    @pytest.mark.parametrize(
+        ("status_str", "expected"),
+        [
+            ("pending", VideoStatus.PENDING),
+            ("converted", VideoStatus.CONVERTED),
+            ("not-a-status", VideoStatus.PENDING),
+        ],
+    )
+    def test_load_candidates_converts_status_string_to_enum(self, status_str, expected):
         """Test that status string is converted to enum when loading."""
         with tempfile.TemporaryDirectory() as tmpdir:
             service = ScanService(output_dir=Path(tmpdir))
@@ -266,7 +286,7 @@ class TestCandidateSerialization:
                         "is_in_icloud": False,
                         "estimated_savings_bytes": 50000000,
                         "estimated_savings_percent": 50.0,
-                        "status": "pending",  # String status
+                        "status": status_str,  # String status
                         "skip_reason": None,
                     }
                 ],
@@ -280,8 +300,7 @@ class TestCandidateSerialization:
             loaded = service.load_candidates()
 
             assert loaded is not None
-            assert loaded.candidates[0].status == VideoStatus.PENDING
-            assert isinstance(loaded.candidates[0].status, VideoStatus)
+            assert loaded.candidates[0].status is expected
 
 
 class TestVideoStatusEnum:
@@ -183,6 +183,20 @@ class TestSwiftBridgeVideoInfoParsing:
         video = bridge._parse_video_info(data)
         assert video.location is None
 
+    def test_parse_video_info_interns_repeated_strings(self, bridge: SwiftBridge) -> None:
+        """Test codec and album names are shared between parsed videos."""
+        response = json.loads(
+            '[{"uuid": "A", "codec": "hevc", "albums": ["Family"]},'
+            ' {"uuid": "B", "codec": "hevc", "albums": ["Family"]}]'
+        )
+
+        videos = [bridge._parse_video_info(data) for data in response]
+
+        assert videos[0].codec == "hevc"
+        assert videos[0].albums == ["Family"]
+        assert videos[1].codec is videos[0].codec
+        assert videos[1].albums[0] is videos[0].albums[0]
+
 
 class TestSwiftBridgePhotosInterface:
     """Tests for PhotosAccessManager compatible interface."""